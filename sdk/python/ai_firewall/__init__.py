@@ -1,6 +1,10 @@
 """AI Firewall Python SDK - Validate AI agent actions against policies."""
 
+# Defined before the submodule imports; client.py reads it for the User-Agent
+__version__ = "0.1.0"
+
 from ai_firewall.client import AIFirewall
+from ai_firewall.async_client import AsyncAIFirewall
 from ai_firewall.models import ValidationResult, Policy, AuditLogEntry, LogsPage
 from ai_firewall.exceptions import (
     AIFirewallError,
@@ -13,10 +17,9 @@ from ai_firewall.exceptions import (
     ActionBlockedError,
 )
 
-__version__ = "0.1.0"
-
 __all__ = [
     "AIFirewall",
+    "AsyncAIFirewall",
     "ValidationResult",
     "Policy",
     "AuditLogEntry",
@@ -0,0 +1,113 @@
+"""Adaptive (AIMD) limits on concurrent requests for the AI Firewall clients."""
+
+import asyncio
+import threading
+
+# Responses that mean the server is overloaded, so the limit should back off
+OVERLOAD_STATUS_CODES = frozenset({429, 502, 503})
+
+
+class _AIMDLimit:
+    """
+    Concurrency limit adjusted by additive increase / multiplicative decrease.
+
+    Every `window` completed requests, the limit grows by `alpha` if their
+    average latency met `latency_target`, and is multiplied by `beta`
+    otherwise. Any overloaded response or network error also multiplies it
+    by `beta` straight away. The limit stays within [min_limit, max_limit],
+    and never below 1 so a request can always be admitted.
+
+    Raises ValueError unless 1 <= min_limit <= max_limit.
+    """
+
+    def __init__(
+        self,
+        latency_target: float,
+        min_limit: int,
+        max_limit: int,
+        initial: int,
+        alpha: float = 0.5,
+        beta: float = 0.5,
+        window: int = 10,
+    ):
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError(
+                f"Admission limits must satisfy 1 <= min_limit <= max_limit, "
+                f"got min_limit={min_limit}, max_limit={max_limit}"
+            )
+        self.latency_target = latency_target
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.alpha = alpha
+        self.beta = beta
+        self.window = window
+        self.limit = float(min(max(initial, min_limit), max_limit))
+        self.in_flight = 0
+        self._samples = 0
+        self._latency_sum = 0.0
+
+    def _has_room(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    def _record(self, latency: float, overloaded: bool) -> None:
+        """Update the limit with one completed request."""
+        if overloaded:
+            self._decrease()
+            return
+        self._samples += 1
+        self._latency_sum += latency
+        if self._samples < self.window:
+            return
+        if self._latency_sum / self._samples <= self.latency_target:
+            self.limit = min(self.limit + self.alpha, self.max_limit)
+        else:
+            self._decrease()
+        self._samples = 0
+        self._latency_sum = 0.0
+
+    def _decrease(self) -> None:
+        self.limit = max(self.limit * self.beta, self.min_limit, 1)
+        self._samples = 0
+        self._latency_sum = 0.0
+
+
+class AdmissionController(_AIMDLimit):
+    """AIMD limit for the sync client; acquire() blocks the calling thread."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        """Wait for a free slot under the current limit."""
+        with self._condition:
+            self._condition.wait_for(self._has_room)
+            self.in_flight += 1
+
+    def release(self, latency: float, overloaded: bool) -> None:
+        """Free a slot and feed the request's outcome into the limit."""
+        with self._condition:
+            self.in_flight -= 1
+            self._record(latency, overloaded)
+            self._condition.notify_all()
+
+
+class AsyncAdmissionController(_AIMDLimit):
+    """AIMD limit for the async client; acquire() suspends the calling task."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        """Wait for a free slot under the current limit."""
+        async with self._condition:
+            await self._condition.wait_for(self._has_room)
+            self.in_flight += 1
+
+    async def release(self, latency: float, overloaded: bool) -> None:
+        """Free a slot and feed the request's outcome into the limit."""
+        async with self._condition:
+            self.in_flight -= 1
+            self._record(latency, overloaded)
+            self._condition.notify_all()
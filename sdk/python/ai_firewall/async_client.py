@@ -0,0 +1,249 @@
+"""AI Firewall Python SDK asyncio client."""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator
+
+import httpx
+
+from ai_firewall.admission import OVERLOAD_STATUS_CODES, AsyncAdmissionController
+from ai_firewall.client import (
+    _MISSING,
+    _FirewallBase,
+    _action_cache_key,
+    _decode_json,
+    _encode_json_body,
+)
+from ai_firewall.exceptions import AIFirewallError, NetworkError
+from ai_firewall.models import ValidationResult, Policy, AuditLogEntry, LogsPage
+
+
+class AsyncAIFirewall(_FirewallBase):
+    """
+    asyncio AI Firewall client, built on httpx.AsyncClient.
+
+    Takes the same arguments and follows the same retry, strict-mode and
+    caching rules as AIFirewall, but its methods are coroutines and retry
+    backoff uses asyncio.sleep, so other tasks keep running while a request
+    waits to be retried.
+
+    Usage:
+        async with AsyncAIFirewall(api_key="af_xxx", project_id="my-project") as fw:
+            result = await fw.execute("my_agent", "do_something", {"param": "value"})
+
+            # Validate many actions concurrently over the shared connection pool
+            results = await asyncio.gather(*(
+                fw.execute("my_agent", "do_something", {"n": n}) for n in range(100)
+            ))
+    """
+
+    def _create_client(self, **kwargs: Any) -> httpx.AsyncClient:
+        return httpx.AsyncClient(**kwargs)
+
+    def _create_admission(self, *args: Any, **kwargs: Any) -> AsyncAdmissionController:
+        return AsyncAdmissionController(*args, **kwargs)
+
+    async def _admitted_request(
+        self,
+        admission: AsyncAdmissionController,
+        method: str,
+        path: str,
+        kwargs: dict[str, Any],
+    ) -> httpx.Response:
+        """Send one request once admission control has a free slot for it."""
+        await admission.acquire()
+        start = time.monotonic()
+        overloaded = True
+        try:
+            response = await self._client.request(method, path, **kwargs)
+            overloaded = response.status_code in OVERLOAD_STATUS_CODES
+            return response
+        finally:
+            await admission.release(time.monotonic() - start, overloaded)
+
+    async def execute(
+        self,
+        agent_name: str,
+        action_type: str,
+        params: dict[str, Any] | None = None,
+        simulate: bool = False,
+    ) -> ValidationResult:
+        """
+        Validate an action before executing it.
+
+        See AIFirewall.execute.
+        """
+        payload = self._action_payload(agent_name, action_type, params, simulate)
+        if self.action_cache_ttl > 0:
+            key = _action_cache_key(payload)
+            result = self._action_cache_get(key)
+            if result is not None:
+                return result
+        response = await self._request("POST", "/validate_action", json=payload)
+        result = ValidationResult.from_dict(response)
+        if self.action_cache_ttl > 0:
+            self._action_cache_put(key, result)
+        self._raise_if_blocked([result], simulate)
+        return result
+
+    async def execute_many(
+        self,
+        actions: list[tuple[str, str, dict[str, Any] | None]],
+        simulate: bool = False,
+    ) -> list[ValidationResult]:
+        """
+        Validate several actions with one request per BATCH_MAX_ACTIONS actions.
+
+        See AIFirewall.execute_many.
+        """
+        results: list[ValidationResult] = []
+        for payload in self._batch_payloads(actions, simulate):
+            response = await self._request("POST", "/validate_action/batch", json=payload)
+            results.extend(ValidationResult.from_dict(item) for item in response["results"])
+        self._raise_if_blocked(results, simulate)
+        return results
+
+    async def get_policy(self, refresh: bool = False) -> Policy:
+        """
+        Get the active policy for this project.
+
+        See AIFirewall.get_policy.
+        """
+        policy = _MISSING if refresh else self._cache_get("policy")
+        if policy is _MISSING:
+            policy = Policy.from_dict(await self._request("GET", f"/policies/{self.project_id}"))
+            self._cache_put("policy", policy)
+        return policy
+
+    async def update_policy(
+        self,
+        rules: list[dict],
+        name: str = "default",
+        version: str = "1.0",
+        default: str = "allow",
+    ) -> Policy:
+        """
+        Update the policy for this project.
+
+        See AIFirewall.update_policy.
+        """
+        payload = self._policy_payload(rules, name, version, default)
+        response = await self._request("POST", f"/policies/{self.project_id}", json=payload)
+        self._cache.pop("policy", None)
+        return Policy.from_dict(response)
+
+    async def get_logs(
+        self,
+        page: int = 1,
+        page_size: int = 50,
+        agent_name: str | None = None,
+        action_type: str | None = None,
+        allowed: bool | None = None,
+    ) -> LogsPage:
+        """
+        Get audit logs for this project.
+
+        See AIFirewall.get_logs.
+        """
+        params = self._logs_params(page, page_size, agent_name, action_type, allowed)
+        response = await self._request("GET", f"/logs/{self.project_id}", params=params)
+        return LogsPage.from_dict(response)
+
+    async def iter_logs(
+        self,
+        page_size: int = 100,
+        agent_name: str | None = None,
+        action_type: str | None = None,
+        allowed: bool | None = None,
+    ) -> AsyncIterator[AuditLogEntry]:
+        """
+        Iterate over all audit logs for this project, newest first.
+
+        See AIFirewall.iter_logs.
+        """
+        page = 1
+        while True:
+            logs = await self.get_logs(page, page_size, agent_name, action_type, allowed)
+            for entry in logs.items:
+                yield entry
+            if not logs.has_more:
+                return
+            page += 1
+
+    async def get_stats(self, refresh: bool = False) -> dict:
+        """
+        Get audit log statistics for this project.
+
+        See AIFirewall.get_stats.
+        """
+        stats = _MISSING if refresh else self._cache_get("stats")
+        if stats is _MISSING:
+            stats = await self._request("GET", f"/logs/{self.project_id}/stats")
+            self._cache_put("stats", stats)
+        return stats
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        **kwargs,
+    ) -> dict:
+        """
+        Make an HTTP request to the API with automatic retry on transient failures.
+
+        Same retry rules as AIFirewall._request; waits use asyncio.sleep.
+        """
+        last_exception: Exception | None = None
+        # Encode once; retries resend the same bytes
+        _encode_json_body(kwargs)
+        client = self._client
+        max_retries = self.max_retries
+        retry_on_status = self.retry_on_status
+
+        admission = self._admission
+
+        for attempt in range(max_retries + 1):
+            try:
+                if admission is None:
+                    response = await client.request(method, path, **kwargs)
+                else:
+                    response = await self._admitted_request(admission, method, path, kwargs)
+                status_code = response.status_code
+
+                # Retryable status with attempts left - back off and retry
+                if status_code in retry_on_status and attempt < max_retries:
+                    await asyncio.sleep(self._retry_delay(attempt, response))
+                    continue
+
+                # Non-retryable error, or retryable error on the last attempt
+                if status_code >= 400:
+                    self._handle_response_error(response)
+
+                return _decode_json(response)
+
+            except httpx.RequestError as e:
+                last_exception = e
+                if not self.retry_on_network_error:
+                    raise NetworkError(f"Network error: {e}") from e
+
+                if attempt < max_retries:
+                    await asyncio.sleep(self._retry_delay(attempt))
+                    continue
+
+                # Last attempt - raise the error
+                raise NetworkError(f"Network error after {attempt + 1} attempts: {e}") from e
+
+        # Should not reach here, but handle edge case
+        if last_exception:
+            raise NetworkError(f"Max retries exceeded: {last_exception}") from last_exception
+        raise AIFirewallError("Unexpected error in request retry loop")
+
+    async def aclose(self):
+        """Close the HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
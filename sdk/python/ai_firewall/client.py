@@ -1,10 +1,19 @@
 """AI Firewall Python SDK Client."""
 
+import abc
+import hashlib
+import json
 import random
+import sys
 import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import httpx
-from typing import Any
+from typing import Any, Iterator
 
+from ai_firewall import __version__
+from ai_firewall.admission import OVERLOAD_STATUS_CODES, AdmissionController
 from ai_firewall.exceptions import (
     AIFirewallError,
     AuthenticationError,
@@ -15,47 +24,136 @@ from ai_firewall.exceptions import (
     RateLimitError,
     ActionBlockedError,
 )
-from ai_firewall.models import ValidationResult, Policy, LogsPage
+from ai_firewall.models import ValidationResult, Policy, AuditLogEntry, LogsPage
 
+# Conditional import - orjson is optional (pip install ai-firewall[fast])
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 
-class AIFirewall:
+# Conditional import - h2 is optional (pip install ai-firewall[http2])
+try:
+    import h2  # noqa: F401
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+# Error statuses whose exception doesn't depend on the response body
+_STATUS_ERRORS: dict[int, tuple[type[AIFirewallError], str]] = {
+    401: (AuthenticationError, "Missing or invalid API key"),
+    403: (AuthenticationError, "API key does not have access to this resource"),
+    429: (RateLimitError, "Rate limit exceeded"),
+}
+
+_USER_AGENT = f"ai-firewall-python/{__version__}"
+
+# Sent as params when execute() gets none; never mutated
+_EMPTY_PARAMS: dict[str, Any] = {}
+
+# Cache lookup sentinel (None is a valid result)
+_MISSING = object()
+
+
+def _decode_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body, with orjson when it is installed.
+
+    orjson parses the raw bytes in one pass; httpx's response.json() first
+    decodes them to str. Both raise json.JSONDecodeError on bad input.
     """
-    AI Firewall client for validating agent actions.
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
 
-    Usage:
-        fw = AIFirewall(
-            api_key="af_xxx",
-            project_id="my-project",
-            base_url="http://localhost:8000"  # or your deployed URL
-        )
 
-        # Validate an action
-        result = fw.execute("my_agent", "do_something", {"param": "value"})
-        if result.allowed:
-            # proceed with action
+def _encode_json_body(kwargs: dict[str, Any]) -> None:
+    """Replace a json= request body with orjson-encoded content=, if available.
+
+    The client's default headers already set Content-Type. Non-string dict
+    keys are stringified as the stdlib encoder does. Bodies orjson refuses
+    (e.g. integers beyond 64 bits) are left for httpx's stdlib encoder.
+    """
+    if ORJSON_AVAILABLE and "json" in kwargs:
+        try:
+            content = orjson.dumps(kwargs["json"], option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            return
+        del kwargs["json"]
+        kwargs["content"] = content
+
+
+def _encode_params(**params: Any) -> dict[str, Any]:
+    """Query parameters without unset (None or empty) values.
+
+    Booleans become "true"/"false", as the server's query parser expects;
+    other values are left for httpx to encode.
+    """
+    return {
+        key: ("true" if value else "false") if isinstance(value, bool) else value
+        for key, value in params.items()
+        if value is not None and value != ""
+    }
+
+
+def _action_cache_key(payload: dict[str, Any]) -> bytes:
+    """Stable digest of an action payload, independent of params key order."""
+    data = None
+    if ORJSON_AVAILABLE:
+        try:
+            data = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # Values orjson refuses (e.g. integers beyond 64 bits)
             pass
-        else:
-            print(f"Blocked: {result.reason}")
+    if data is None:
+        data = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode()
+    return hashlib.blake2b(data, digest_size=16).digest()
 
-        # Or use strict mode (raises exception if blocked)
-        fw_strict = AIFirewall(..., strict=True)
-        result = fw_strict.execute(...)  # Raises ActionBlockedError if blocked
 
-        # With retry configuration
-        fw_retry = AIFirewall(
-            api_key="af_xxx",
-            project_id="my-project",
-            max_retries=3,
-            retry_base_delay=1.0,
-        )
+def _retry_after_seconds(response: httpx.Response) -> float | None:
+    """Seconds the server asked us to wait via Retry-After, if it sent one.
+
+    Accepts both delta-seconds and HTTP-date values. Returns None when the
+    header is missing or unparseable.
     """
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class _FirewallBase(abc.ABC):
+    """Configuration, payloads and response handling shared by the sync and async clients."""
 
     DEFAULT_BASE_URL = "http://localhost:8000"
     DEFAULT_TIMEOUT = 30.0
+    DEFAULT_CONNECT_TIMEOUT = 5.0
     DEFAULT_MAX_RETRIES = 3
     DEFAULT_RETRY_BASE_DELAY = 1.0
     DEFAULT_RETRY_MAX_DELAY = 30.0
     DEFAULT_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    # Server-side limit on actions per /validate_action/batch request
+    BATCH_MAX_ACTIONS = 100
+    # Starting concurrency limit when latency_target enables admission control
+    DEFAULT_INITIAL_CONCURRENCY = 8
+    # Most distinct actions kept when action_cache_ttl is set
+    ACTION_CACHE_MAX_ENTRIES = 1024
+    DEFAULT_LIMITS = httpx.Limits(
+        max_connections=256,
+        max_keepalive_connections=64,
+        keepalive_expiry=15.0,
+    )
 
     def __init__(
         self,
@@ -69,24 +167,55 @@ class AIFirewall:
         retry_max_delay: float | None = None,
         retry_on_status: set[int] | None = None,
         retry_on_network_error: bool = True,
+        limits: httpx.Limits | None = None,
+        http2: bool | None = None,
+        cache_ttl: float = 0.0,
+        action_cache_ttl: float = 0.0,
+        latency_target: float | None = None,
+        min_concurrency: int = 1,
+        max_concurrency: int | None = None,
     ):
         """
-        Initialize the AI Firewall client.
+        Initialize the client.
 
         Args:
             api_key: Your project API key (starts with 'af_')
             project_id: Your project identifier
             base_url: API base URL (default: http://localhost:8000)
-            timeout: Request timeout in seconds (default: 30)
+            timeout: Read/write timeout in seconds (default: 30). Connecting
+                and waiting for a pooled connection time out after at most 5s.
             strict: If True, raise ActionBlockedError when actions are blocked
             max_retries: Maximum number of retry attempts (default: 3, set to 0 to disable)
             retry_base_delay: Base delay in seconds for exponential backoff (default: 1.0)
             retry_max_delay: Maximum delay cap in seconds (default: 30.0)
             retry_on_status: HTTP status codes to retry on (default: {429, 500, 502, 503, 504})
             retry_on_network_error: Whether to retry on network errors (default: True)
+            limits: Connection pool limits for the underlying httpx client
+                (default: 256 connections, 64 kept alive for 15s)
+            http2: Negotiate HTTP/2 with the server, multiplexing concurrent
+                requests over one connection (default: enabled when the h2
+                package is installed, pip install ai-firewall[http2])
+            cache_ttl: Seconds to reuse get_policy() and get_stats() results
+                before fetching again (default: 0, no caching). Cached
+                results are shared between calls; treat them as read-only.
+            action_cache_ttl: Seconds to reuse an allowed execute() result for
+                an identical (agent_name, action_type, params, simulate) call
+                (default: 0, no caching). Keep it short, e.g. 1s: cache hits
+                are not logged or rate limited by the server.
+            latency_target: Enable adaptive admission control. The number of
+                requests in flight grows slowly while their average latency
+                stays at or under this many seconds, and halves when it
+                doesn't or the server reports overload (429/502/503 or a
+                network error). Extra callers wait for a free slot
+                (default: None, no limit beyond the connection pool).
+            min_concurrency: Lowest in-flight limit admission control can
+                shrink to; at least 1 and at most max_concurrency, or
+                ValueError is raised (default: 1)
+            max_concurrency: Highest in-flight limit admission control can
+                grow to (default: the pool's max_connections)
         """
         self.api_key = api_key
-        self.project_id = project_id
+        self.project_id = sys.intern(project_id)
         self.base_url = (base_url or self.DEFAULT_BASE_URL).rstrip("/")
         self.timeout = timeout or self.DEFAULT_TIMEOUT
         self.strict = strict
@@ -95,18 +224,260 @@ class AIFirewall:
         self.max_retries = max_retries if max_retries is not None else self.DEFAULT_MAX_RETRIES
         self.retry_base_delay = retry_base_delay or self.DEFAULT_RETRY_BASE_DELAY
         self.retry_max_delay = retry_max_delay or self.DEFAULT_RETRY_MAX_DELAY
-        self.retry_on_status = retry_on_status or self.DEFAULT_RETRY_STATUS_CODES
+        self.retry_on_status = frozenset(retry_on_status or self.DEFAULT_RETRY_STATUS_CODES)
         self.retry_on_network_error = retry_on_network_error
+        # Capped delay before each retry; attempts never exceed max_retries
+        self._backoff_table = tuple(
+            min(self.retry_base_delay * (1 << attempt), self.retry_max_delay)
+            for attempt in range(self.max_retries + 1)
+        )
+        self._rng = random.Random()
+        self.limits = limits or self.DEFAULT_LIMITS
+        self.http2 = H2_AVAILABLE if http2 is None else http2
+        self.cache_ttl = cache_ttl
+        # key -> (expires_at on time.monotonic(), result)
+        self._cache: dict[str, tuple[float, Any]] = {}
+        self.action_cache_ttl = action_cache_ttl
+        # payload digest -> (expires_at, result), least recently used first
+        self._action_cache: OrderedDict[bytes, tuple[float, ValidationResult]] = OrderedDict()
+        self._admission = None
+        if latency_target is not None:
+            max_concurrency = (
+                max_concurrency
+                or self.limits.max_connections
+                or self.DEFAULT_LIMITS.max_connections
+            )
+            self._admission = self._create_admission(
+                latency_target,
+                min_concurrency,
+                max_concurrency,
+                initial=self.DEFAULT_INITIAL_CONCURRENCY,
+            )
+        connect_timeout = min(self.timeout, self.DEFAULT_CONNECT_TIMEOUT)
 
-        self._client = httpx.Client(
+        self._client = self._create_client(
             base_url=self.base_url,
             headers={
                 "X-API-Key": self.api_key,
                 "Content-Type": "application/json",
+                "User-Agent": _USER_AGENT,
             },
-            timeout=self.timeout,
+            timeout=httpx.Timeout(self.timeout, connect=connect_timeout, pool=connect_timeout),
+            limits=self.limits,
+            http2=self.http2,
         )
 
+    @abc.abstractmethod
+    def _create_client(self, **kwargs: Any) -> Any:
+        """Build the underlying httpx client (sync or async)."""
+
+    @abc.abstractmethod
+    def _create_admission(self, *args: Any, **kwargs: Any) -> Any:
+        """Build the admission controller (sync or async)."""
+
+    def _action_payload(
+        self,
+        agent_name: str,
+        action_type: str,
+        params: dict[str, Any] | None,
+        simulate: bool,
+    ) -> dict[str, Any]:
+        """Request body for validating one action."""
+        return {
+            "project_id": self.project_id,
+            "agent_name": agent_name,
+            "action_type": action_type,
+            "params": params or _EMPTY_PARAMS,
+            "simulate": simulate,
+        }
+
+    def _batch_payloads(
+        self,
+        actions: list[tuple[str, str, dict[str, Any] | None]],
+        simulate: bool,
+    ) -> Iterator[dict[str, Any]]:
+        """Request bodies for /validate_action/batch, BATCH_MAX_ACTIONS actions each."""
+        for start in range(0, len(actions), self.BATCH_MAX_ACTIONS):
+            batch = actions[start:start + self.BATCH_MAX_ACTIONS]
+            yield {
+                "actions": [
+                    self._action_payload(agent_name, action_type, params, simulate)
+                    for agent_name, action_type, params in batch
+                ],
+            }
+
+    def _raise_if_blocked(self, results: list[ValidationResult], simulate: bool) -> None:
+        """In strict mode, raise ActionBlockedError for the first blocked result."""
+        # Don't raise ActionBlockedError for simulations (they're expected to test blocked scenarios)
+        if not self.strict or simulate:
+            return
+        for result in results:
+            if not result.allowed:
+                raise ActionBlockedError(
+                    reason=result.reason or "Action blocked by policy",
+                    action_id=result.action_id or "simulated",
+                )
+
+    @staticmethod
+    def _policy_payload(rules: list[dict], name: str, version: str, default: str) -> dict:
+        """Request body for updating the policy."""
+        return {
+            "name": name,
+            "version": version,
+            "default": default,
+            "rules": rules,
+        }
+
+    @staticmethod
+    def _logs_params(
+        page: int,
+        page_size: int,
+        agent_name: str | None,
+        action_type: str | None,
+        allowed: bool | None,
+    ) -> dict[str, Any]:
+        """Query parameters for the logs endpoint."""
+        return _encode_params(
+            page=page,
+            page_size=page_size,
+            agent_name=agent_name,
+            action_type=action_type,
+            allowed=allowed,
+        )
+
+    def _cache_get(self, key: str) -> Any:
+        """Cached result younger than cache_ttl, or _MISSING."""
+        if self.cache_ttl <= 0:
+            return _MISSING
+        hit = self._cache.get(key)
+        if hit is None or hit[0] <= time.monotonic():
+            return _MISSING
+        return hit[1]
+
+    def _cache_put(self, key: str, result: Any) -> None:
+        """Store a result for cache_ttl seconds (no-op when caching is off)."""
+        if self.cache_ttl > 0:
+            self._cache[key] = (time.monotonic() + self.cache_ttl, result)
+
+    def _action_cache_get(self, key: bytes) -> ValidationResult | None:
+        """Allowed result for an identical action younger than action_cache_ttl."""
+        hit = self._action_cache.get(key)
+        if hit is None:
+            return None
+        if hit[0] <= time.monotonic():
+            self._action_cache.pop(key, None)
+            return None
+        try:
+            self._action_cache.move_to_end(key)
+        except KeyError:
+            pass  # evicted by another thread since the lookup
+        return hit[1]
+
+    def _action_cache_put(self, key: bytes, result: ValidationResult) -> None:
+        """Store an allowed result, evicting the least recently used entry when full."""
+        # Blocked results aren't cached so a policy change lets the action through
+        if not result.allowed:
+            return
+        # Each OrderedDict call is atomic, but another thread may evict the
+        # key (or empty the cache) between calls; no lock on the hot path
+        cache = self._action_cache
+        cache[key] = (time.monotonic() + self.action_cache_ttl, result)
+        try:
+            cache.move_to_end(key)
+            if len(cache) > self.ACTION_CACHE_MAX_ENTRIES:
+                cache.popitem(last=False)
+        except KeyError:
+            pass
+
+    def _calculate_backoff(self, attempt: int) -> float:
+        """
+        Calculate delay with exponential backoff and full jitter.
+
+        Args:
+            attempt: The current attempt number (0-indexed)
+
+        Returns:
+            Delay in seconds, uniform between 0 and the capped exponential delay
+        """
+        if attempt < len(self._backoff_table):
+            delay = self._backoff_table[attempt]
+        else:
+            delay = min(self.retry_base_delay * (2 ** attempt), self.retry_max_delay)
+        # Full jitter spreads clients that failed together across the whole
+        # window, so their retries don't arrive as another burst
+        return self._rng.uniform(0, delay)
+
+    def _is_retryable_status(self, status_code: int) -> bool:
+        """Check if the HTTP status code should be retried."""
+        return status_code in self.retry_on_status
+
+    def _handle_response_error(self, response: httpx.Response) -> None:
+        """Handle error responses and raise appropriate exceptions."""
+        status_code = response.status_code
+        error = _STATUS_ERRORS.get(status_code)
+        if error is not None:
+            exc_class, message = error
+            raise exc_class(message)
+        if status_code == 404:
+            detail = _decode_json(response).get("detail", "")
+            lowered = detail.lower()
+            if "policy" in lowered:
+                raise PolicyNotFoundError(detail)
+            if "project" in lowered:
+                raise ProjectNotFoundError(detail)
+            raise AIFirewallError(detail)
+        if status_code == 422:
+            raise ValidationError(f"Invalid request: {_decode_json(response)}")
+        if status_code >= 400:
+            raise AIFirewallError(f"API error {status_code}: {response.text}")
+
+    def _retry_delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """
+        Delay before retrying after the given attempt.
+
+        For retryable responses with a Retry-After header, waits exactly as
+        long as the server asks (capped at retry_max_delay) instead of the
+        exponential backoff.
+        """
+        if response is not None:
+            retry_after = _retry_after_seconds(response)
+            if retry_after is not None:
+                return min(retry_after, self.retry_max_delay)
+        return self._calculate_backoff(attempt)
+
+
+class AIFirewall(_FirewallBase):
+    """
+    AI Firewall client for validating agent actions.
+
+    Usage:
+        fw = AIFirewall(
+            api_key="af_xxx",
+            project_id="my-project",
+            base_url="http://localhost:8000"  # or your deployed URL
+        )
+
+        # Validate an action
+        result = fw.execute("my_agent", "do_something", {"param": "value"})
+        if result.allowed:
+            # proceed with action
+            pass
+        else:
+            print(f"Blocked: {result.reason}")
+
+        # Or use strict mode (raises exception if blocked)
+        fw_strict = AIFirewall(..., strict=True)
+        result = fw_strict.execute(...)  # Raises ActionBlockedError if blocked
+
+        # With retry configuration
+        fw_retry = AIFirewall(
+            api_key="af_xxx",
+            project_id="my-project",
+            max_retries=3,
+            retry_base_delay=1.0,
+        )
+    """
+
     def execute(
         self,
         agent_name: str,
@@ -133,38 +504,69 @@ class AIFirewall:
             AuthenticationError: If API key is invalid
             NetworkError: If network request fails
         """
-        payload = {
-            "project_id": self.project_id,
-            "agent_name": agent_name,
-            "action_type": action_type,
-            "params": params or {},
-            "simulate": simulate,
-        }
-
+        payload = self._action_payload(agent_name, action_type, params, simulate)
+        if self.action_cache_ttl > 0:
+            key = _action_cache_key(payload)
+            result = self._action_cache_get(key)
+            if result is not None:
+                return result
         response = self._request("POST", "/validate_action", json=payload)
         result = ValidationResult.from_dict(response)
+        if self.action_cache_ttl > 0:
+            self._action_cache_put(key, result)
+        self._raise_if_blocked([result], simulate)
+        return result
 
-        # Don't raise ActionBlockedError for simulations (they're expected to test blocked scenarios)
-        if self.strict and not result.allowed and not simulate:
-            raise ActionBlockedError(
-                reason=result.reason or "Action blocked by policy",
-                action_id=result.action_id or "simulated",
-            )
+    def execute_many(
+        self,
+        actions: list[tuple[str, str, dict[str, Any] | None]],
+        simulate: bool = False,
+    ) -> list[ValidationResult]:
+        """
+        Validate several actions with one request per BATCH_MAX_ACTIONS actions.
 
-        return result
+        Each action is validated exactly as execute() would, in order, but
+        the batch shares a single HTTP round-trip.
+
+        Args:
+            actions: (agent_name, action_type, params) tuples
+            simulate: If True, run every validation in what-if mode
 
-    def get_policy(self) -> Policy:
+        Returns:
+            One ValidationResult per action, in the same order.
+
+        Raises:
+            ActionBlockedError: If strict=True and any action is blocked
+                (raised for the first blocked action, after the whole batch
+                has been validated)
+            AuthenticationError: If API key is invalid
+            NetworkError: If network request fails
+        """
+        results: list[ValidationResult] = []
+        for payload in self._batch_payloads(actions, simulate):
+            response = self._request("POST", "/validate_action/batch", json=payload)
+            results.extend(ValidationResult.from_dict(item) for item in response["results"])
+        self._raise_if_blocked(results, simulate)
+        return results
+
+    def get_policy(self, refresh: bool = False) -> Policy:
         """
         Get the active policy for this project.
 
+        Args:
+            refresh: Bypass the client-side cache (only relevant with cache_ttl)
+
         Returns:
             The active Policy
 
         Raises:
             PolicyNotFoundError: If no active policy exists
         """
-        response = self._request("GET", f"/policies/{self.project_id}")
-        return Policy.from_dict(response)
+        policy = _MISSING if refresh else self._cache_get("policy")
+        if policy is _MISSING:
+            policy = Policy.from_dict(self._request("GET", f"/policies/{self.project_id}"))
+            self._cache_put("policy", policy)
+        return policy
 
     def update_policy(
         self,
@@ -185,13 +587,9 @@ class AIFirewall:
         Returns:
             The updated Policy
         """
-        payload = {
-            "name": name,
-            "version": version,
-            "default": default,
-            "rules": rules,
-        }
+        payload = self._policy_payload(rules, name, version, default)
         response = self._request("POST", f"/policies/{self.project_id}", json=payload)
+        self._cache.pop("policy", None)
         return Policy.from_dict(response)
 
     def get_logs(
@@ -215,66 +613,55 @@ class AIFirewall:
         Returns:
             LogsPage with items and pagination info
         """
-        params = {"page": page, "page_size": page_size}
-        if agent_name:
-            params["agent_name"] = agent_name
-        if action_type:
-            params["action_type"] = action_type
-        if allowed is not None:
-            params["allowed"] = str(allowed).lower()
-
+        params = self._logs_params(page, page_size, agent_name, action_type, allowed)
         response = self._request("GET", f"/logs/{self.project_id}", params=params)
         return LogsPage.from_dict(response)
 
-    def get_stats(self) -> dict:
+    def iter_logs(
+        self,
+        page_size: int = 100,
+        agent_name: str | None = None,
+        action_type: str | None = None,
+        allowed: bool | None = None,
+    ) -> Iterator[AuditLogEntry]:
         """
-        Get audit log statistics for this project.
+        Iterate over all audit logs for this project, newest first.
 
-        Returns:
-            Dictionary with total_actions, allowed, blocked, block_rate, etc.
-        """
-        return self._request("GET", f"/logs/{self.project_id}/stats")
+        Pages are fetched lazily: the next page is requested only once the
+        caller has consumed the current one, so the first entries are
+        available after a single round-trip and stopping early skips the
+        remaining pages. Logs written during iteration shift later pages,
+        so an entry may be yielded twice.
 
-    def _calculate_backoff(self, attempt: int) -> float:
+        Args:
+            page_size: Entries fetched per request (max 100)
+            agent_name: Filter by agent name
+            action_type: Filter by action type
+            allowed: Filter by allowed status
         """
-        Calculate delay with exponential backoff and jitter.
+        page = 1
+        while True:
+            logs = self.get_logs(page, page_size, agent_name, action_type, allowed)
+            yield from logs.items
+            if not logs.has_more:
+                return
+            page += 1
+
+    def get_stats(self, refresh: bool = False) -> dict:
+        """
+        Get audit log statistics for this project.
 
         Args:
-            attempt: The current attempt number (0-indexed)
+            refresh: Bypass the client-side cache (only relevant with cache_ttl)
 
         Returns:
-            Delay in seconds with jitter applied
+            Dictionary with total_actions, allowed, blocked, block_rate, etc.
         """
-        delay = self.retry_base_delay * (2 ** attempt)
-        delay = min(delay, self.retry_max_delay)
-        # Add jitter (±25%) to prevent thundering herd
-        jitter = delay * 0.25 * (random.random() * 2 - 1)
-        return max(0, delay + jitter)
-
-    def _is_retryable_status(self, status_code: int) -> bool:
-        """Check if the HTTP status code should be retried."""
-        return status_code in self.retry_on_status
-
-    def _handle_response_error(self, response: httpx.Response) -> None:
-        """Handle error responses and raise appropriate exceptions."""
-        if response.status_code == 401:
-            raise AuthenticationError("Missing or invalid API key")
-        if response.status_code == 403:
-            raise AuthenticationError("API key does not have access to this resource")
-        if response.status_code == 404:
-            data = response.json()
-            detail = data.get("detail", "")
-            if "policy" in detail.lower():
-                raise PolicyNotFoundError(detail)
-            if "project" in detail.lower():
-                raise ProjectNotFoundError(detail)
-            raise AIFirewallError(detail)
-        if response.status_code == 422:
-            raise ValidationError(f"Invalid request: {response.json()}")
-        if response.status_code == 429:
-            raise RateLimitError("Rate limit exceeded")
-        if response.status_code >= 400:
-            raise AIFirewallError(f"API error {response.status_code}: {response.text}")
+        stats = _MISSING if refresh else self._cache_get("stats")
+        if stats is _MISSING:
+            stats = self._request("GET", f"/logs/{self.project_id}/stats")
+            self._cache_put("stats", stats)
+        return stats
 
     def _request(
         self,
@@ -287,7 +674,9 @@ class AIFirewall:
 
         Retries on:
         - Network errors (connection refused, timeout, etc.) if retry_on_network_error=True
-        - HTTP status codes in retry_on_status (default: 429, 500, 502, 503, 504)
+        - HTTP status codes in retry_on_status (default: 429, 500, 502, 503, 504),
+          waiting as long as the response's Retry-After header asks (capped at
+          retry_max_delay), or with exponential backoff if it sends none
 
         Does NOT retry on:
         - 401 Unauthorized (invalid API key)
@@ -296,34 +685,41 @@ class AIFirewall:
         - 422 Validation Error
         """
         last_exception: Exception | None = None
+        # Encode once; retries resend the same bytes
+        _encode_json_body(kwargs)
+        # All retry state is local, so one client can be shared across threads
+        client = self._client
+        max_retries = self.max_retries
+        retry_on_status = self.retry_on_status
+
+        admission = self._admission
 
-        for attempt in range(self.max_retries + 1):
+        for attempt in range(max_retries + 1):
             try:
-                response = self._client.request(method, path, **kwargs)
-
-                # Check if we got a retryable status code
-                if self._is_retryable_status(response.status_code):
-                    if attempt < self.max_retries:
-                        delay = self._calculate_backoff(attempt)
-                        time.sleep(delay)
-                        continue
-                    # Last attempt - raise the error
-                    self._handle_response_error(response)
+                if admission is None:
+                    response = client.request(method, path, **kwargs)
+                else:
+                    response = self._admitted_request(admission, method, path, kwargs)
+                status_code = response.status_code
+
+                # Retryable status with attempts left - back off and retry
+                if status_code in retry_on_status and attempt < max_retries:
+                    time.sleep(self._retry_delay(attempt, response))
+                    continue
 
-                # Non-retryable error or success
-                if response.status_code >= 400:
+                # Non-retryable error, or retryable error on the last attempt
+                if status_code >= 400:
                     self._handle_response_error(response)
 
-                return response.json()
+                return _decode_json(response)
 
             except httpx.RequestError as e:
                 last_exception = e
                 if not self.retry_on_network_error:
                     raise NetworkError(f"Network error: {e}") from e
 
-                if attempt < self.max_retries:
-                    delay = self._calculate_backoff(attempt)
-                    time.sleep(delay)
+                if attempt < max_retries:
+                    time.sleep(self._retry_delay(attempt))
                     continue
 
                 # Last attempt - raise the error
@@ -334,6 +730,30 @@ class AIFirewall:
             raise NetworkError(f"Max retries exceeded: {last_exception}") from last_exception
         raise AIFirewallError("Unexpected error in request retry loop")
 
+    def _create_client(self, **kwargs: Any) -> httpx.Client:
+        return httpx.Client(**kwargs)
+
+    def _create_admission(self, *args: Any, **kwargs: Any) -> AdmissionController:
+        return AdmissionController(*args, **kwargs)
+
+    def _admitted_request(
+        self,
+        admission: AdmissionController,
+        method: str,
+        path: str,
+        kwargs: dict[str, Any],
+    ) -> httpx.Response:
+        """Send one request once admission control has a free slot for it."""
+        admission.acquire()
+        start = time.monotonic()
+        overloaded = True
+        try:
+            response = self._client.request(method, path, **kwargs)
+            overloaded = response.status_code in OVERLOAD_STATUS_CODES
+            return response
+        finally:
+            admission.release(time.monotonic() - start, overloaded)
+
     def close(self):
         """Close the HTTP client."""
         self._client.close()
@@ -4,8 +4,19 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
+# Conditional import - ciso8601 is optional (pip install ai-firewall[fast])
+try:
+    from ciso8601 import parse_datetime as _parse_iso8601
+except ImportError:
+    _parse_iso8601 = datetime.fromisoformat
 
-@dataclass
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an API timestamp, ignoring a trailing Z as the API's times are UTC."""
+    return _parse_iso8601(value.rstrip("Z"))
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of an action validation."""
 
@@ -22,14 +33,14 @@ class ValidationResult:
         return cls(
             allowed=data["allowed"],
             action_id=data.get("action_id"),  # None for simulations
-            timestamp=datetime.fromisoformat(data["timestamp"].rstrip("Z")),
+            timestamp=_parse_timestamp(data["timestamp"]),
             reason=data.get("reason"),
             execution_time_ms=data.get("execution_time_ms"),
             simulated=data.get("simulated", False),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Policy:
     """A project policy."""
 
@@ -52,12 +63,12 @@ class Policy:
             version=data["version"],
             rules=data["rules"],
             is_active=data["is_active"],
-            created_at=datetime.fromisoformat(data["created_at"].rstrip("Z")),
-            updated_at=datetime.fromisoformat(data["updated_at"].rstrip("Z")),
+            created_at=_parse_timestamp(data["created_at"]),
+            updated_at=_parse_timestamp(data["updated_at"]),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditLogEntry:
     """An audit log entry."""
 
@@ -85,11 +96,11 @@ class AuditLogEntry:
             reason=data.get("reason"),
             policy_version=data.get("policy_version"),
             execution_time_ms=data.get("execution_time_ms"),
-            timestamp=datetime.fromisoformat(data["timestamp"].rstrip("Z")),
+            timestamp=_parse_timestamp(data["timestamp"]),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LogsPage:
     """A page of audit logs."""
 
@@ -19,6 +19,8 @@ from server.cache import init_cache, close_cache, get_cache
 from server.logging_config import setup_logging
 from server.middleware.correlation import CorrelationIdMiddleware
 from server.middleware.timeout import RequestTimeoutMiddleware
+from server.responses import ORJSONResponse
+from server.services.audit_queue import init_audit_writer, close_audit_writer
 from server.routes import validate_router, policies_router, logs_router, projects_router, templates_router
 from server.metrics import (
     HTTP_REQUESTS_TOTAL,
@@ -97,6 +99,7 @@ async def lifespan(app: FastAPI):
 
     await init_db()
     await init_cache()
+    await init_audit_writer()
     yield
 
     # Shutdown - graceful drain
@@ -117,6 +120,7 @@ async def lifespan(app: FastAPI):
         await asyncio.sleep(0.1)
 
     logger.info("All requests drained, closing connections")
+    await close_audit_writer()
     await close_cache()
     await close_db()
 
@@ -126,6 +130,7 @@ app = FastAPI(
     description="Middleware that intercepts AI agent actions, validates them against policy rules, and logs all activity.",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
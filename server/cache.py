@@ -1,8 +1,12 @@
 """Redis caching service with graceful degradation."""
 
+import asyncio
 import json
 import logging
-from typing import Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
 
 from server.config import get_settings
 
@@ -18,6 +22,167 @@ except ImportError:
     aioredis = None
     RedisError = Exception  # Fallback for type hints
 
+# Conditional import - orjson is optional (faster encode/decode of cached values)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+class TTLCache:
+    """Thread-safe in-process cache with per-entry expiry.
+
+    Entries expire ttl seconds after they are set. When full, the oldest
+    entry is evicted.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: str) -> Any:
+        """Get a value. Returns None on miss or if the entry has expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store a value, evicting the oldest entry if full.
+
+        ttl overrides the cache-wide TTL for this entry.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+            expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+            self._data[key] = (expires_at, value)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: str) -> Any:
+        """Remove and return a value (None if absent)."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return entry[1] if entry else None
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# Process-wide API key -> project cache. Sits in front of Redis so
+# authentication skips the network on hot keys.
+_local_projects: TTLCache | None = None
+
+
+def get_local_project_cache() -> TTLCache:
+    """Get the in-process project cache, creating it from settings."""
+    global _local_projects
+    if _local_projects is None:
+        settings = get_settings()
+        _local_projects = TTLCache(settings.cache_local_maxsize, settings.cache_ttl_local)
+    return _local_projects
+
+
+# Process-wide project_id -> active policy cache, so validation skips the
+# policy lookup on hot projects. Evicted when a policy is created.
+_local_policies: TTLCache | None = None
+
+
+def get_local_policy_cache() -> TTLCache:
+    """Get the in-process policy cache, creating it from settings."""
+    global _local_policies
+    if _local_policies is None:
+        settings = get_settings()
+        _local_policies = TTLCache(settings.cache_local_maxsize, settings.cache_ttl_local)
+    return _local_policies
+
+
+# Pub/sub channels used to evict in-process entries on every worker
+INVALIDATION_CHANNEL = "cache_invalidation:api_key"
+POLICY_INVALIDATION_CHANNEL = "cache_invalidation:policy"
+
+_LOCAL_CACHES = {
+    INVALIDATION_CHANNEL: get_local_project_cache,
+    POLICY_INVALIDATION_CHANNEL: get_local_policy_cache,
+}
+
+# True while this process is subscribed to the invalidation channels. Local
+# entries are only safe to use while other workers' evictions reach us.
+_invalidations_live = False
+
+# Backoff between attempts to resubscribe after the listener loses Redis
+LISTENER_RETRY_DELAY = 0.5
+LISTENER_MAX_RETRY_DELAY = 30.0
+
+
+def handle_invalidation_message(message: dict) -> None:
+    """Evict the local entry named by a pub/sub invalidation message."""
+    if message.get("type") != "message":
+        return
+    channel = message.get("channel", INVALIDATION_CHANNEL)
+    if isinstance(channel, bytes):
+        channel = channel.decode()
+    key = message.get("data")
+    if isinstance(key, bytes):
+        key = key.decode()
+    get_local_cache = _LOCAL_CACHES.get(channel)
+    if key and get_local_cache is not None:
+        get_local_cache().pop(key)
+
+
+def _clear_local_caches() -> None:
+    for get_local_cache in _LOCAL_CACHES.values():
+        get_local_cache().clear()
+
+
+async def _listen_for_invalidations(redis_client) -> None:
+    """Apply invalidations published by other workers until cancelled.
+
+    If the subscription drops, the local caches are bypassed and the
+    listener resubscribes with exponential backoff.
+    """
+    global _invalidations_live
+    delay = LISTENER_RETRY_DELAY
+    while True:
+        pubsub = redis_client.pubsub()
+        try:
+            await pubsub.subscribe(*_LOCAL_CACHES)
+            _invalidations_live = True
+            delay = LISTENER_RETRY_DELAY
+            async for message in pubsub.listen():
+                handle_invalidation_message(message)
+        except asyncio.CancelledError:
+            raise
+        except RedisError as e:
+            logger.error(
+                f"Redis invalidation listener disconnected, local caches bypassed; "
+                f"retrying in {delay:.1f}s: {e}"
+            )
+        finally:
+            # Evictions may be missed from now on, so drop what we hold
+            _invalidations_live = False
+            _clear_local_caches()
+            try:
+                await pubsub.aclose()
+            except RedisError:
+                pass
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, LISTENER_MAX_RETRY_DELAY)
+
 
 class CacheService:
     """Async Redis cache with graceful degradation.
@@ -36,6 +201,15 @@ class CacheService:
         """Check if cache is available and enabled."""
         return self._available and self.settings.cache_enabled
 
+    @property
+    def local_available(self) -> bool:
+        """Whether the in-process caches may be used.
+
+        Only while this worker is subscribed to invalidations, so an entry
+        evicted by another worker can't be served from here.
+        """
+        return self.is_available and _invalidations_live
+
     async def get(self, key: str) -> Optional[str]:
         """Get value from cache. Returns None on miss or error."""
         if not self.is_available:
@@ -46,7 +220,7 @@ class CacheService:
             logger.warning(f"Redis GET error for {key}: {e}")
             return None
 
-    async def set(self, key: str, value: str, ttl: int) -> bool:
+    async def set(self, key: str, value: str | bytes, ttl: int) -> bool:
         """Set value in cache with TTL. Returns success status."""
         if not self.is_available:
             return False
@@ -81,55 +255,120 @@ class CacheService:
             logger.warning(f"Redis DELETE pattern error for {pattern}: {e}")
             return 0
 
+    # === Serialization ===
+
+    def _serialize(self, data: dict) -> str | bytes:
+        """Encode a dict for storage. Uses orjson when installed."""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(data)
+        return json.dumps(data)
+
+    def _deserialize(self, data: str | bytes) -> dict:
+        """Decode a cached value. Raises json.JSONDecodeError on bad input."""
+        if ORJSON_AVAILABLE:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            return orjson.loads(data)
+        return json.loads(data)
+
     # === Policy Cache Methods ===
 
+    def _set_local_policy(self, project_id: str, policy_data: dict) -> None:
+        # Never keep a policy locally for longer than Redis would
+        local = get_local_policy_cache()
+        ttl = min(local.ttl, self.settings.cache_ttl_policy)
+        local.set(project_id, policy_data, ttl=ttl)
+
     async def get_policy(self, project_id: str) -> Optional[dict]:
-        """Get cached policy for project."""
+        """Get cached policy for project (in-process cache first, then Redis)."""
+        if self.local_available:
+            local = get_local_policy_cache().get(project_id)
+            if local is not None:
+                return local
+
         data = await self.get(f"policy:{project_id}")
         if data:
             try:
-                return json.loads(data)
+                policy_data = self._deserialize(data)
             except json.JSONDecodeError:
                 logger.warning(f"Invalid JSON in cache for policy:{project_id}")
                 return None
+            if self.local_available:
+                self._set_local_policy(project_id, policy_data)
+            return policy_data
         return None
 
     async def set_policy(self, project_id: str, policy_data: dict) -> bool:
         """Cache policy for project."""
+        if self.local_available:
+            self._set_local_policy(project_id, policy_data)
         return await self.set(
             f"policy:{project_id}",
-            json.dumps(policy_data),
+            self._serialize(policy_data),
             self.settings.cache_ttl_policy
         )
 
     async def invalidate_policy(self, project_id: str) -> bool:
-        """Invalidate policy cache for project."""
-        return await self.delete(f"policy:{project_id}")
+        """Invalidate policy cache here and in other workers' local caches."""
+        get_local_policy_cache().pop(project_id)
+        deleted = await self.delete(f"policy:{project_id}")
+        # Published even if the Redis key had already expired: other workers
+        # may still hold a local copy
+        if self.is_available:
+            try:
+                await self.redis.publish(POLICY_INVALIDATION_CHANNEL, project_id)
+            except RedisError as e:
+                logger.warning(f"Redis PUBLISH error for policy:{project_id}: {e}")
+        return deleted
 
     # === Project/API Key Cache Methods ===
 
+    def _set_local_project(self, api_key: str, project_data: dict) -> None:
+        # Never keep a project locally for longer than Redis would
+        local = get_local_project_cache()
+        ttl = min(local.ttl, self.settings.cache_ttl_project)
+        local.set(api_key, project_data, ttl=ttl)
+
     async def get_project_by_api_key(self, api_key: str) -> Optional[dict]:
-        """Get cached project by API key."""
+        """Get cached project by API key (in-process cache first, then Redis)."""
+        if self.local_available:
+            local = get_local_project_cache().get(api_key)
+            if local is not None:
+                return local
+
         data = await self.get(f"api_key:{api_key}")
         if data:
             try:
-                return json.loads(data)
+                project_data = self._deserialize(data)
             except json.JSONDecodeError:
                 logger.warning(f"Invalid JSON in cache for api_key:{api_key[:8]}...")
                 return None
+            if self.local_available:
+                self._set_local_project(api_key, project_data)
+            return project_data
         return None
 
     async def set_project_by_api_key(self, api_key: str, project_data: dict) -> bool:
         """Cache project by API key."""
+        if self.local_available:
+            self._set_local_project(api_key, project_data)
         return await self.set(
             f"api_key:{api_key}",
-            json.dumps(project_data),
+            self._serialize(project_data),
             self.settings.cache_ttl_project
         )
 
     async def invalidate_project(self, api_key: str) -> bool:
-        """Invalidate project cache."""
-        return await self.delete(f"api_key:{api_key}")
+        """Invalidate project cache here and in other workers' local caches."""
+        get_local_project_cache().pop(api_key)
+        deleted = await self.delete(f"api_key:{api_key}")
+        # Published even if the Redis key had already expired: other workers
+        # may still hold a local copy
+        if self.is_available:
+            try:
+                await self.redis.publish(INVALIDATION_CHANNEL, api_key)
+            except RedisError as e:
+                logger.warning(f"Redis PUBLISH error for api_key:{api_key[:8]}...: {e}")
+        return deleted
 
     # === Aggregate Limit Cache Methods ===
 
@@ -155,11 +394,12 @@ class CacheService:
 
 # Global cache instance
 _cache: Optional[CacheService] = None
+_invalidation_task: Optional[asyncio.Task] = None
 
 
 async def init_cache() -> CacheService:
     """Initialize cache service. Called at app startup."""
-    global _cache
+    global _cache, _invalidation_task
     settings = get_settings()
 
     if not REDIS_AVAILABLE:
@@ -180,6 +420,9 @@ async def init_cache() -> CacheService:
             # Test connection
             await redis_client.ping()
             _cache = CacheService(redis_client)
+            _invalidation_task = asyncio.create_task(
+                _listen_for_invalidations(redis_client), name="cache_invalidation"
+            )
             logger.info(f"Redis cache initialized: {settings.redis_url}")
         except Exception as e:
             logger.warning(f"Redis unavailable, caching disabled: {e}")
@@ -196,11 +439,19 @@ async def init_cache() -> CacheService:
 
 async def close_cache() -> None:
     """Close cache connections. Called at app shutdown."""
-    global _cache
+    global _cache, _invalidation_task
+    if _invalidation_task is not None:
+        _invalidation_task.cancel()
+        try:
+            await _invalidation_task
+        except asyncio.CancelledError:
+            pass
+        _invalidation_task = None
     if _cache and _cache.redis:
         await _cache.redis.aclose()
         logger.info("Redis connection closed")
     _cache = None
+    _clear_local_caches()
 
 
 def get_cache() -> CacheService:
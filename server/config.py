@@ -41,11 +41,21 @@ class Settings(BaseSettings):
     cache_ttl_policy: int = 300  # 5 minutes
     cache_ttl_project: int = 600  # 10 minutes
     cache_enabled: bool = True  # Master switch for caching
+    cache_ttl_local: int = 60  # In-process API key and policy caches, checked before Redis
+    cache_local_maxsize: int = 10_000
 
     # Fail-Closed Mode
     fail_closed: bool = False  # If True, block actions when service errors occur
     fail_closed_reason: str = "Service unavailable - fail-closed mode active"
 
+    # Audit Log Writes
+    # Opt-in: rows are written after the response, so a crash loses queued
+    # rows and other workers' reads miss them until written (see audit_queue)
+    audit_batch_enabled: bool = False  # Queue audit rows and insert them in batches
+    audit_batch_size: int = 500  # Max rows per INSERT batch
+    audit_flush_interval: float = 0.01  # Seconds to collect a batch before writing
+    audit_queue_maxsize: int = 10_000  # Rows queued before requests write inline
+
     # Graceful Shutdown
     shutdown_timeout: int = 30  # Seconds to wait for in-flight requests to drain
 
@@ -3,6 +3,7 @@
 import re
 import ssl
 
+from sqlalchemy import event, inspect
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.pool import NullPool
@@ -45,6 +46,29 @@ def _strip_ssl_params(url: str) -> str:
     return url
 
 
+# Applied to every new SQLite connection. WAL lets validations read while an
+# audit batch is being written; NORMAL sync is durable under WAL except on
+# power loss.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",  # 20 MB page cache (negative = KiB)
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Configure a fresh SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
 def create_engine_with_config():
     """Create async engine with appropriate config for database type."""
     original_url = settings.database_url
@@ -52,12 +76,14 @@ def create_engine_with_config():
 
     if is_sqlite:
         # SQLite: No connection pooling, use NullPool for async compatibility
-        return create_async_engine(
+        sqlite_engine = create_async_engine(
             original_url,
             echo=settings.db_echo or settings.debug,
             future=True,
             poolclass=NullPool,
         )
+        event.listen(sqlite_engine.sync_engine, "connect", _set_sqlite_pragmas)
+        return sqlite_engine
     else:
         # PostgreSQL: Handle SSL and connection pooling
         connect_args = {}
@@ -115,14 +141,34 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+def _existing_tables(connection) -> set[str]:
+    """Names of the tables already in the database."""
+    return set(inspect(connection).get_table_names())
+
+
+def _create_missing_indexes(connection) -> None:
+    """Create any model index not yet present on an existing table."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
 async def init_db() -> None:
     """Initialize database tables."""
     # Import models to register them with SQLAlchemy
-    from server.models import Project, Policy, AuditLog  # noqa: F401
+    from server.models import Project, Policy, AuditLog, AuditLogCounter  # noqa: F401
+    from server.services.log_stats import backfill_log_counters
 
     try:
         async with engine.begin() as conn:
+            existing = await conn.run_sync(_existing_tables)
             await conn.run_sync(Base.metadata.create_all)
+            # create_all skips existing tables, so add indexes defined since
+            await conn.run_sync(_create_missing_indexes)
+            # Counters added to a database that already has logs start from them
+            if "audit_logs" in existing and "audit_log_counters" not in existing:
+                rows = await backfill_log_counters(conn)
+                logger.info(f"Backfilled {rows} audit log counter rows")
         logger.info("Database tables initialized successfully")
     except Exception as e:
         # Log error but don't crash - app can still serve health checks
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from server.config import get_settings
 from server.database import get_db
 from server.models import Project
+from server.models.project import API_KEY_LENGTH, API_KEY_PREFIX
 from server.cache import get_cache
 from server.errors import ErrorCode, make_error
 
@@ -40,6 +41,15 @@ async def get_project_by_api_key(
             detail=make_error(ErrorCode.MISSING_API_KEY),
         )
 
+    # Keys that generate_api_key() could never have produced can't match a
+    # project; reject them without a cache or DB lookup. The key format is
+    # public, so answering these faster reveals nothing about valid keys.
+    if len(api_key) != API_KEY_LENGTH or not api_key.startswith(API_KEY_PREFIX):
+        raise HTTPException(
+            status_code=403,
+            detail=make_error(ErrorCode.INVALID_API_KEY),
+        )
+
     cache = get_cache()
 
     # Try cache first
@@ -3,5 +3,6 @@
 from server.models.project import Project
 from server.models.policy import Policy
 from server.models.audit_log import AuditLog
+from server.models.audit_log_counter import AuditLogCounter
 
-__all__ = ["Project", "Policy", "AuditLog"]
+__all__ = ["Project", "Policy", "AuditLog", "AuditLogCounter"]
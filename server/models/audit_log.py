@@ -2,7 +2,7 @@
 
 import uuid
 from datetime import datetime
-from sqlalchemy import String, DateTime, ForeignKey, Text, Boolean, Integer
+from sqlalchemy import String, DateTime, ForeignKey, Text, Boolean, Integer, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from server.database import Base
@@ -17,6 +17,11 @@ class AuditLog(Base):
     """AuditLog model - immutable record of every action validation."""
 
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        # Log listing filters and aggregate windows, newest first within each
+        Index("ix_audit_logs_project_agent", "project_id", "agent_name", "timestamp"),
+        Index("ix_audit_logs_project_allowed", "project_id", "allowed", "timestamp"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     action_id: Mapped[str] = mapped_column(
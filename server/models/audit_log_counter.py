@@ -0,0 +1,36 @@
+"""AuditLogCounter model - running totals of audit logs for the stats endpoint."""
+
+from datetime import date
+from sqlalchemy import String, Date, ForeignKey, Boolean, Integer
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from server.database import Base
+
+
+class AuditLogCounter(Base):
+    """Number of audit logs per project, day, agent, action type and outcome.
+
+    Incremented in the same transaction that inserts the logs, so stats are
+    read from a handful of rows instead of scanning audit_logs.
+    """
+
+    __tablename__ = "audit_log_counters"
+
+    project_id: Mapped[str] = mapped_column(
+        String(50), ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    agent_name: Mapped[str] = mapped_column(String(255), primary_key=True)
+    action_type: Mapped[str] = mapped_column(String(255), primary_key=True)
+    allowed: Mapped[bool] = mapped_column(Boolean, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Relationships
+    project: Mapped["Project"] = relationship("Project", back_populates="audit_log_counters")
+
+    def __repr__(self) -> str:
+        status = "allowed" if self.allowed else "blocked"
+        return (
+            f"<AuditLogCounter {self.project_id} {self.day}: "
+            f"{self.agent_name}/{self.action_type} {status}={self.count}>"
+        )
@@ -8,9 +8,14 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from server.database import Base
 
 
+API_KEY_PREFIX = "af_"
+# token_urlsafe(32) is always 43 characters
+API_KEY_LENGTH = len(API_KEY_PREFIX) + 43
+
+
 def generate_api_key() -> str:
     """Generate a secure API key."""
-    return f"af_{secrets.token_urlsafe(32)}"
+    return f"{API_KEY_PREFIX}{secrets.token_urlsafe(32)}"
 
 
 class Project(Base):
@@ -40,6 +45,9 @@ class Project(Base):
     audit_logs: Mapped[list["AuditLog"]] = relationship(
         "AuditLog", back_populates="project", cascade="all, delete-orphan"
     )
+    audit_log_counters: Mapped[list["AuditLogCounter"]] = relationship(
+        "AuditLogCounter", back_populates="project", cascade="all, delete-orphan"
+    )
 
     def __repr__(self) -> str:
         return f"<Project {self.id}: {self.name}>"
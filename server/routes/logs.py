@@ -9,6 +9,8 @@ from server.database import get_db
 from server.middleware.auth import verify_project_access
 from server.models import AuditLog, Project
 from server.schemas import AuditLogResponse, AuditLogList
+from server.services import log_stats
+from server.services.audit_queue import flush_audit_logs
 
 router = APIRouter(prefix="/logs", tags=["Audit Logs"])
 
@@ -29,6 +31,8 @@ async def get_logs(
 
     Returns all action validation attempts, both allowed and blocked.
     """
+    await flush_audit_logs()
+
     # Build base query
     base_query = select(AuditLog).where(AuditLog.project_id == project_id)
 
@@ -92,55 +96,22 @@ async def get_log_stats(
 
     Returns counts of allowed vs blocked actions, most common action types, etc.
     """
-    # Total actions
-    total_query = select(func.count()).where(AuditLog.project_id == project_id)
-    total_result = await db.execute(total_query)
-    total = total_result.scalar()
+    await flush_audit_logs()
+    return await log_stats.get_log_stats(db, project_id)
 
-    # Allowed count
-    allowed_query = (
-        select(func.count())
-        .where(AuditLog.project_id == project_id)
-        .where(AuditLog.allowed == True)
-    )
-    allowed_result = await db.execute(allowed_query)
-    allowed = allowed_result.scalar()
-
-    # Blocked count
-    blocked = total - allowed
-
-    # Most common action types
-    action_types_query = (
-        select(AuditLog.action_type, func.count().label("count"))
-        .where(AuditLog.project_id == project_id)
-        .group_by(AuditLog.action_type)
-        .order_by(func.count().desc())
-        .limit(10)
-    )
-    action_types_result = await db.execute(action_types_query)
-    action_types = [
-        {"action_type": row[0], "count": row[1]}
-        for row in action_types_result.all()
-    ]
 
-    # Most active agents
-    agents_query = (
-        select(AuditLog.agent_name, func.count().label("count"))
-        .where(AuditLog.project_id == project_id)
-        .group_by(AuditLog.agent_name)
-        .order_by(func.count().desc())
-        .limit(10)
-    )
-    agents_result = await db.execute(agents_query)
-    agents = [
-        {"agent_name": row[0], "count": row[1]} for row in agents_result.all()
-    ]
+@router.post("/{project_id}/stats/rebuild")
+async def rebuild_log_stats(
+    project_id: str,
+    db: AsyncSession = Depends(get_db),
+    project: Project = Depends(verify_project_access),
+):
+    """
+    Recompute summary statistics from the full audit log.
 
-    return {
-        "total_actions": total,
-        "allowed": allowed,
-        "blocked": blocked,
-        "block_rate": round(blocked / total * 100, 2) if total > 0 else 0,
-        "top_action_types": action_types,
-        "top_agents": agents,
-    }
+    Stats are kept as running counters; use this to repair them, e.g. for
+    logs recorded before counters existed. Scans every log of the project.
+    """
+    await flush_audit_logs()
+    await log_stats.rebuild_log_counters(db, project_id)
+    return await log_stats.get_log_stats(db, project_id)
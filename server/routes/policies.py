@@ -1,6 +1,5 @@
 """Policy management endpoints."""
 
-import json
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select
@@ -13,6 +12,8 @@ from server.schemas import PolicyCreate, PolicyResponse
 from server.cache import get_cache
 from server.templates.loader import get_template
 from server.errors import ErrorCode, make_error
+from server.responses import ORJSONResponse
+from server.services.policy_engine import dump_policy_json, parse_policy_json
 
 router = APIRouter(prefix="/policies", tags=["Policies"])
 
@@ -45,16 +46,17 @@ async def get_policy(
             detail=make_error(ErrorCode.POLICY_NOT_FOUND),
         )
 
-    return PolicyResponse(
-        id=policy.id,
-        project_id=policy.project_id,
-        name=policy.name,
-        version=policy.version,
-        rules=json.loads(policy.rules),
-        is_active=policy.is_active,
-        created_at=policy.created_at,
-        updated_at=policy.updated_at,
-    )
+    # Returned directly to skip response_model revalidation (hot read path)
+    return ORJSONResponse(content={
+        "id": policy.id,
+        "project_id": policy.project_id,
+        "name": policy.name,
+        "version": policy.version,
+        "rules": parse_policy_json(policy.rules),
+        "is_active": policy.is_active,
+        "created_at": policy.created_at,
+        "updated_at": policy.updated_at,
+    })
 
 
 @router.post("/{project_id}", response_model=PolicyResponse)
@@ -93,12 +95,15 @@ async def create_or_update_policy(
         project_id=project_id,
         name=policy_data.name,
         version=policy_data.version,
-        rules=json.dumps(rules_json),
+        rules=dump_policy_json(rules_json),
         is_active=True,
     )
     db.add(policy)
     await db.flush()
 
+    # Commit before invalidating so no request can re-cache the old policy
+    await db.commit()
+
     # Invalidate cache for this project's policy
     cache = get_cache()
     await cache.invalidate_policy(project_id)
@@ -142,7 +147,7 @@ async def get_policy_history(
             project_id=p.project_id,
             name=p.name,
             version=p.version,
-            rules=json.loads(p.rules),
+            rules=parse_policy_json(p.rules),
             is_active=p.is_active,
             created_at=p.created_at,
             updated_at=p.updated_at,
@@ -201,12 +206,15 @@ async def create_policy_from_template(
         project_id=project_id,
         name=policy_name,
         version=policy_data["version"],
-        rules=json.dumps(rules_json),
+        rules=dump_policy_json(rules_json),
         is_active=True,
     )
     db.add(policy)
     await db.flush()
 
+    # Commit before invalidating so no request can re-cache the old policy
+    await db.commit()
+
     # Invalidate cache for this project's policy
     cache = get_cache()
     await cache.invalidate_policy(project_id)
@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from server.cache import get_cache
 from server.database import get_db
 from server.middleware.auth import get_project_by_api_key
 from server.models import Project
@@ -107,7 +108,9 @@ async def deactivate_project(
         )
 
     project.is_active = False
-    await db.flush()
+    # Commit before invalidating so no request can re-cache the old project
+    await db.commit()
+    await get_cache().invalidate_project(project.api_key)
 
     return {"message": f"Project '{project_id}' has been deactivated"}
 
@@ -117,7 +120,7 @@ async def update_project(
     project_id: str,
     updates: ProjectUpdate,
     db: AsyncSession = Depends(get_db),
-    project: Project = Depends(get_project_by_api_key),
+    current: Project = Depends(get_project_by_api_key),
 ):
     """
     Update project settings.
@@ -126,12 +129,18 @@ async def update_project(
     Requires API key authentication.
     """
     # Verify the API key matches the project being updated
-    if project.id != project_id:
+    if current.id != project_id:
         raise HTTPException(
             status_code=403,
             detail=make_error(ErrorCode.PROJECT_MISMATCH),
         )
 
+    # The authenticated project may come from cache (not attached to this
+    # session), so load the row to update
+    stmt = select(Project).where(Project.id == project_id)
+    result = await db.execute(stmt)
+    project = result.scalar_one()
+
     # Apply updates
     if updates.name is not None:
         project.name = updates.name
@@ -140,7 +149,9 @@ async def update_project(
     if updates.webhook_enabled is not None:
         project.webhook_enabled = updates.webhook_enabled
 
-    await db.flush()
+    # Commit before invalidating so no request can re-cache the old project
+    await db.commit()
+    await get_cache().invalidate_project(project.api_key)
 
     return ProjectResponse(
         id=project.id,
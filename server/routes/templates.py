@@ -1,34 +1,58 @@
 """Policy templates endpoints."""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 
-from server.templates.loader import list_templates, get_template
+from server.templates.loader import list_templates_body, get_template_body
 from server.errors import ErrorCode, make_error
 
 router = APIRouter(prefix="/templates", tags=["Templates"])
 
+# Template files only change on deploy
+CACHE_CONTROL = "public, max-age=300"
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header (weak comparison, lists and *)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _cached_response(request: Request, body: bytes, etag: str) -> Response:
+    """Serve a pre-serialized body, or 304 if the client already has it."""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 @router.get("")
-async def get_templates():
+async def get_templates(request: Request):
     """List all available policy templates.
 
     Returns template metadata (id, name, description) without the full policy.
     Use GET /templates/{template_id} to get the full template with policy.
     """
-    return {"templates": list_templates()}
+    body, etag = list_templates_body()
+    return _cached_response(request, body, etag)
 
 
 @router.get("/{template_id}")
-async def get_template_detail(template_id: str):
+async def get_template_detail(template_id: str, request: Request):
     """Get full template details including policy rules.
 
     Returns the complete template with all policy rules that can be
     used to create a new policy.
     """
-    template = get_template(template_id)
-    if not template:
+    cached = get_template_body(template_id)
+    if not cached:
         raise HTTPException(
             status_code=404,
             detail=make_error(ErrorCode.TEMPLATE_NOT_FOUND),
         )
-    return template
+    body, etag = cached
+    return _cached_response(request, body, etag)
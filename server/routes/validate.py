@@ -12,47 +12,57 @@ from server.database import get_db
 from server.metrics import record_validation_metrics
 from server.middleware.auth import get_project_by_api_key
 from server.models import Project
-from server.schemas import ActionRequest, ActionResponse
+from server.responses import ORJSONResponse
+from server.routing import ORJSONRoute
+from server.schemas import ActionRequest, ActionResponse, BatchActionRequest, BatchActionResponse
 from server.services import ValidatorService
 from server.services.webhook import get_webhook_service
 
 logger = logging.getLogger(__name__)
-router = APIRouter(tags=["Validation"])
+router = APIRouter(tags=["Validation"], route_class=ORJSONRoute)
 
 
-@router.post("/validate_action", response_model=ActionResponse)
-async def validate_action(
-    request: ActionRequest,
-    background_tasks: BackgroundTasks,
-    db: AsyncSession = Depends(get_db),
-    project: Project = Depends(get_project_by_api_key),
-):
-    """
-    Validate an AI agent action against the project's policy.
+def _action_body(
+    allowed: bool,
+    action_id: str | None,
+    timestamp: datetime,
+    reason: str | None = None,
+    execution_time_ms: int | None = None,
+    simulated: bool = False,
+) -> dict:
+    """Build the validation response body (fields mirror ActionResponse)."""
+    return {
+        "allowed": allowed,
+        "action_id": action_id,
+        "timestamp": timestamp,
+        "reason": reason,
+        "execution_time_ms": execution_time_ms,
+        "simulated": simulated,
+    }
 
-    This is the main endpoint for the firewall. Call this before executing
-    any agent action to check if it's allowed.
-
-    Set `simulate=true` to test policies without affecting production state
-    (what-if mode). Simulations do not create audit logs or trigger webhooks.
 
-    Returns:
-    - **allowed**: True if the action can proceed, False if blocked
-    - **action_id**: Unique identifier for this validation (None for simulations)
-    - **reason**: Explanation if the action was blocked
-    - **simulated**: True if this was a simulation
-    """
-    settings = get_settings()
-
-    # Verify the project_id in request matches the authenticated project
+def _check_project(request: ActionRequest, project: Project) -> None:
+    """Verify the project_id in request matches the authenticated project."""
     if request.project_id != project.id:
         raise HTTPException(
             status_code=403,
             detail=f"API key is for project '{project.id}', not '{request.project_id}'",
         )
 
+
+async def _run_validation(
+    request: ActionRequest,
+    validator: ValidatorService,
+    project: Project,
+    background_tasks: BackgroundTasks,
+) -> dict:
+    """Validate one action, record metrics and queue webhooks.
+
+    Returns the response body for the action.
+    """
+    settings = get_settings()
+
     try:
-        validator = ValidatorService(db)
         result = await validator.validate_action(
             project_id=request.project_id,
             agent_name=request.agent_name,
@@ -67,7 +77,7 @@ async def validate_action(
         # Fail-closed mode: block action on any service error
         if settings.fail_closed:
             logger.error(f"Fail-closed: blocking action due to error: {e}")
-            return ActionResponse(
+            return _action_body(
                 allowed=False,
                 action_id=f"fail-closed-{uuid.uuid4().hex[:8]}",
                 timestamp=datetime.utcnow(),
@@ -104,7 +114,7 @@ async def validate_action(
             reason=result.reason or "Action blocked by policy",
         )
 
-    return ActionResponse(
+    return _action_body(
         allowed=result.allowed,
         action_id=result.action_id,
         timestamp=result.timestamp,
@@ -112,3 +122,62 @@ async def validate_action(
         execution_time_ms=result.execution_time_ms,
         simulated=result.simulated,
     )
+
+
+# Handlers return ORJSONResponse directly, skipping FastAPI's response_model
+# validation and jsonable_encoder pass; response_model stays declared on the
+# routes for the OpenAPI schema.
+
+@router.post("/validate_action", response_model=ActionResponse)
+async def validate_action(
+    request: ActionRequest,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    project: Project = Depends(get_project_by_api_key),
+):
+    """
+    Validate an AI agent action against the project's policy.
+
+    This is the main endpoint for the firewall. Call this before executing
+    any agent action to check if it's allowed.
+
+    Set `simulate=true` to test policies without affecting production state
+    (what-if mode). Simulations do not create audit logs or trigger webhooks.
+
+    Returns:
+    - **allowed**: True if the action can proceed, False if blocked
+    - **action_id**: Unique identifier for this validation (None for simulations)
+    - **reason**: Explanation if the action was blocked
+    - **simulated**: True if this was a simulation
+    """
+    _check_project(request, project)
+    body = await _run_validation(request, ValidatorService(db), project, background_tasks)
+    return ORJSONResponse(content=body)
+
+
+@router.post("/validate_action/batch", response_model=BatchActionResponse)
+async def validate_actions_batch(
+    batch: BatchActionRequest,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    project: Project = Depends(get_project_by_api_key),
+):
+    """
+    Validate several actions in one request.
+
+    Actions are validated in order, exactly as if each had been sent to
+    /validate_action, and share one database transaction. All actions must
+    belong to the authenticated project; otherwise the whole batch is
+    rejected with 403 before any is validated.
+
+    Returns one result per action, in request order.
+    """
+    for request in batch.actions:
+        _check_project(request, project)
+
+    validator = ValidatorService(db)
+    results = [
+        await _run_validation(request, validator, project, background_tasks)
+        for request in batch.actions
+    ]
+    return ORJSONResponse(content={"results": results})
@@ -0,0 +1,37 @@
+"""Route class that decodes JSON request bodies with orjson."""
+
+from typing import Any, Callable
+
+import orjson
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+
+class ORJSONRequest(Request):
+    """Request whose json() uses orjson instead of the stdlib decoder.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so malformed
+    bodies still produce FastAPI's usual 422 json_invalid error. Unlike the
+    stdlib decoder, NaN and Infinity literals are rejected.
+    """
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """APIRoute that hands endpoints an ORJSONRequest.
+
+    Bodies are still validated against the endpoint's Pydantic model; only
+    the bytes-to-dict step is faster. Used on routers with hot JSON bodies.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request) -> Response:
+            return await handler(ORJSONRequest(request.scope, request.receive))
+
+        return orjson_route_handler
@@ -1,6 +1,11 @@
 """Pydantic schemas package."""
 
-from server.schemas.action import ActionRequest, ActionResponse
+from server.schemas.action import (
+    ActionRequest,
+    ActionResponse,
+    BatchActionRequest,
+    BatchActionResponse,
+)
 from server.schemas.policy import PolicyCreate, PolicyResponse, PolicyRule
 from server.schemas.project import ProjectCreate, ProjectResponse, ProjectPublic, ProjectUpdate
 from server.schemas.logs import AuditLogResponse, AuditLogList
@@ -8,6 +13,8 @@ from server.schemas.logs import AuditLogResponse, AuditLogList
 __all__ = [
     "ActionRequest",
     "ActionResponse",
+    "BatchActionRequest",
+    "BatchActionResponse",
     "PolicyCreate",
     "PolicyResponse",
     "PolicyRule",
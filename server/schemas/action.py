@@ -1,8 +1,29 @@
 """Pydantic schemas for action validation."""
 
+from collections import deque
 from datetime import datetime
 from typing import Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+# Deepest nesting of dicts/lists accepted in action params (params itself is 1)
+MAX_PARAM_DEPTH = 32
+
+
+def _param_depth(params: dict[str, Any]) -> int:
+    """Return how deeply containers nest in params, walking iteratively."""
+    depth = 0
+    queue = deque([(params, 1)])
+    while queue:
+        value, level = queue.popleft()
+        depth = max(depth, level)
+        if level > MAX_PARAM_DEPTH:
+            # No need to look further; the caller only compares to the limit
+            break
+        children = value.values() if isinstance(value, dict) else value
+        queue.extend(
+            (child, level + 1) for child in children if isinstance(child, (dict, list))
+        )
+    return depth
 
 
 class ActionRequest(BaseModel):
@@ -19,6 +40,13 @@ class ActionRequest(BaseModel):
         description="If true, run validation without logging or affecting state (what-if mode)",
     )
 
+    @field_validator("params")
+    @classmethod
+    def check_params_depth(cls, params: dict[str, Any]) -> dict[str, Any]:
+        if _param_depth(params) > MAX_PARAM_DEPTH:
+            raise ValueError(f"params may be nested at most {MAX_PARAM_DEPTH} levels deep")
+        return params
+
     model_config = {
         "json_schema_extra": {
             "example": {
@@ -79,3 +107,26 @@ class ActionResponse(BaseModel):
             ]
         }
     }
+
+
+# Upper bound on actions per batch request
+MAX_BATCH_ACTIONS = 100
+
+
+class BatchActionRequest(BaseModel):
+    """Request schema for validating several actions in one call."""
+
+    actions: list[ActionRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_ACTIONS,
+        description="Actions to validate, in order",
+    )
+
+
+class BatchActionResponse(BaseModel):
+    """Response schema for batch action validation."""
+
+    results: list[ActionResponse] = Field(
+        ..., description="One result per action, in request order"
+    )
@@ -14,6 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from server.models.audit_log import AuditLog
 from server.cache import get_cache
+from server.services.audit_queue import flush_audit_logs
 
 logger = logging.getLogger(__name__)
 
@@ -158,6 +159,9 @@ class AggregateService:
         measure: str,
     ) -> float:
         """Calculate aggregate from audit logs in database."""
+        # Include rows still queued by the batch writer
+        await flush_audit_logs()
+
         # Build query - only count allowed actions
         stmt = (
             select(AuditLog)
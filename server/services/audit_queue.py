@@ -0,0 +1,210 @@
+"""Batched audit log writer.
+
+Validation requests enqueue AuditLog rows instead of inserting them inline.
+A background task drains the queue and inserts each batch in one
+transaction, so concurrent validations don't each wait on their own
+INSERT + COMMIT (and, on SQLite, on the single writer lock).
+
+Batching is opt-in (audit_batch_enabled). Rows are written after the
+response has gone out, so rows still queued when the process dies are
+lost, and flush_audit_logs() only drains this worker's queue: with several
+workers, reads and spend checks can miss rows queued on the others. Use it
+with a single worker that can tolerate that.
+
+Anything that reads audit logs must call flush_audit_logs() first so it
+sees rows from requests that have already returned.
+
+The queue is bounded: if the database falls behind and it fills up,
+put_nowait() raises asyncio.QueueFull and the caller writes the row
+itself, so a backlog applies backpressure instead of growing memory.
+
+If a batch fails to insert, its rows are retried one at a time so a single
+bad row doesn't hold back the rest. A row that keeps failing stays queued
+and is retried with backoff, logging an error each time; rows are never
+dropped.
+"""
+
+import asyncio
+import logging
+
+from server.config import get_settings
+from server.database import async_session_maker
+from server.models import AuditLog
+from server.services.log_stats import count_audit_logs
+
+logger = logging.getLogger(__name__)
+
+
+class AuditLogWriter:
+    """Drains queued audit rows into the database in batches."""
+
+    def __init__(
+        self,
+        max_batch: int = 500,
+        flush_interval: float = 0.01,
+        max_pending: int = 10_000,
+        retry_delay: float = 0.05,
+        max_retry_delay: float = 5.0,
+    ):
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self._queue: asyncio.Queue[AuditLog] = asyncio.Queue(maxsize=max_pending)
+        self._task: asyncio.Task | None = None
+        # Rows are handled in queue order, so flush() can wait for a sequence
+        # number instead of for the queue to drain
+        self._enqueued = 0
+        self._handled = 0
+        self._handled_changed = asyncio.Condition()
+
+    def start(self) -> None:
+        """Start the background drain task on the running loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="audit_log_writer")
+
+    async def stop(self, timeout: float | None = None) -> None:
+        """Write everything still queued, then stop the drain task.
+
+        If the rows can't be written within timeout seconds (e.g. the
+        database is down), the ones left are logged as lost.
+        """
+        try:
+            await asyncio.wait_for(self.flush(), timeout)
+        except asyncio.TimeoutError:
+            logger.error(
+                f"Audit log writer stopped with {self._enqueued - self._handled} "
+                f"rows not written after {timeout}s"
+            )
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def put_nowait(self, audit_log: AuditLog) -> None:
+        """Queue a row for the next batch. Raises asyncio.QueueFull if full."""
+        self._queue.put_nowait(audit_log)
+        self._enqueued += 1
+
+    async def flush(self) -> None:
+        """
+        Wait until every row queued before this call has been handled.
+
+        Rows queued by other requests while waiting don't extend the wait,
+        so this returns under sustained traffic.
+        """
+        mark = self._enqueued
+        async with self._handled_changed:
+            await self._handled_changed.wait_for(lambda: self._handled >= mark)
+
+    @property
+    def pending(self) -> int:
+        """Number of rows queued but not yet written."""
+        return self._queue.qsize()
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+
+            # Collect whatever else arrives within the flush interval
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._write(batch)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to write {len(batch)} audit log rows, retrying one at a time: {e}"
+                )
+                await self._write_each(batch)
+            else:
+                for _ in batch:
+                    self._queue.task_done()
+
+            self._handled += len(batch)
+            async with self._handled_changed:
+                self._handled_changed.notify_all()
+
+    async def _write_each(self, batch: list[AuditLog]) -> None:
+        """Write rows individually, retrying each until it is persisted."""
+        for row in batch:
+            attempt = 0
+            while True:
+                try:
+                    await self._write([row])
+                except Exception as e:
+                    attempt += 1
+                    delay = min(self.retry_delay * 2 ** (attempt - 1), self.max_retry_delay)
+                    logger.error(
+                        f"Failed to write audit log row for project {row.project_id} "
+                        f"({row.agent_name}/{row.action_type}), attempt {attempt}; "
+                        f"retrying in {delay:.2f}s with {self.pending} rows queued: {e}",
+                        exc_info=attempt == 1,
+                    )
+                    await asyncio.sleep(delay)
+                else:
+                    self._queue.task_done()
+                    break
+
+    async def _write(self, batch: list[AuditLog]) -> None:
+        async with async_session_maker() as session:
+            session.add_all(batch)
+            await count_audit_logs(session, batch)
+            await session.commit()
+
+
+# One writer per event loop (asyncio queues and tasks are loop-bound)
+_writers: dict[asyncio.AbstractEventLoop, AuditLogWriter] = {}
+
+
+async def init_audit_writer() -> AuditLogWriter | None:
+    """Start the audit writer for the running loop. Called at app startup."""
+    settings = get_settings()
+    if not settings.audit_batch_enabled:
+        return None
+
+    loop = asyncio.get_running_loop()
+    writer = _writers.get(loop)
+    if writer is None:
+        writer = AuditLogWriter(
+            max_batch=settings.audit_batch_size,
+            flush_interval=settings.audit_flush_interval,
+            max_pending=settings.audit_queue_maxsize,
+        )
+        writer.start()
+        _writers[loop] = writer
+    return writer
+
+
+async def close_audit_writer() -> None:
+    """Flush and stop the running loop's audit writer. Called at app shutdown."""
+    writer = _writers.pop(asyncio.get_running_loop(), None)
+    if writer is not None:
+        await writer.stop(timeout=get_settings().shutdown_timeout)
+
+
+def get_audit_writer() -> AuditLogWriter | None:
+    """Get the audit writer for the running loop, or None if not started."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    return _writers.get(loop)
+
+
+async def flush_audit_logs() -> None:
+    """Make queued audit rows visible to queries. No-op without a writer."""
+    writer = get_audit_writer()
+    if writer is not None:
+        await writer.flush()
@@ -0,0 +1,135 @@
+"""Audit log statistics backed by the audit_log_counters table.
+
+Every audit log insert also increments its counter row (project, day,
+agent, action type, outcome) in the same transaction. The stats endpoint
+sums those rows, so its cost depends on how many distinct agents and
+action types a project has, not on how many logs it has accumulated.
+"""
+
+from collections import Counter
+from typing import Iterable
+
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from server.models import AuditLog, AuditLogCounter
+
+TOP_N = 10
+
+
+def _upsert(session: AsyncSession):
+    """INSERT for the session's dialect (both support ON CONFLICT)."""
+    bind = session.bind
+    if bind is not None and bind.dialect.name == "postgresql":
+        return postgresql.insert(AuditLogCounter)
+    return sqlite.insert(AuditLogCounter)
+
+
+async def count_audit_logs(session: AsyncSession, audit_logs: Iterable[AuditLog]) -> None:
+    """Add audit logs to their counter rows. Call in the transaction that inserts them."""
+    counts = Counter(
+        (log.project_id, log.timestamp.date(), log.agent_name, log.action_type, log.allowed)
+        for log in audit_logs
+    )
+    if not counts:
+        return
+
+    stmt = _upsert(session)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["project_id", "day", "agent_name", "action_type", "allowed"],
+        set_={"count": AuditLogCounter.count + stmt.excluded.count},
+    )
+    # Sorted so concurrent batches lock rows in the same order
+    await session.execute(stmt, [
+        {
+            "project_id": project_id,
+            "day": day,
+            "agent_name": agent_name,
+            "action_type": action_type,
+            "allowed": allowed,
+            "count": count,
+        }
+        for (project_id, day, agent_name, action_type, allowed), count in sorted(counts.items())
+    ])
+
+
+async def backfill_log_counters(conn: AsyncConnection) -> int:
+    """Fill an empty audit_log_counters table from audit_logs in one query.
+
+    Run when the counters table is first created next to existing logs.
+    Returns the number of counter rows inserted.
+    """
+    keys = (
+        AuditLog.project_id,
+        func.date(AuditLog.timestamp),
+        AuditLog.agent_name,
+        AuditLog.action_type,
+        AuditLog.allowed,
+    )
+    result = await conn.execute(
+        insert(AuditLogCounter).from_select(
+            ["project_id", "day", "agent_name", "action_type", "allowed", "count"],
+            select(*keys, func.count()).group_by(*keys),
+        )
+    )
+    return result.rowcount
+
+
+async def rebuild_log_counters(session: AsyncSession, project_id: str) -> int:
+    """Recompute a project's counters from audit_logs. Returns the log count.
+
+    For repairing counters that have drifted. The delete and reinsert run in
+    the caller's transaction, and concurrent inserts are held off until it
+    commits so no log is counted twice or missed.
+    """
+    bind = session.bind
+    if bind is not None and bind.dialect.name == "postgresql":
+        # Conflicts with the row locks taken by count_audit_logs: waits for
+        # in-flight inserts to commit and blocks new ones until we commit
+        await session.execute(text("LOCK TABLE audit_log_counters IN EXCLUSIVE MODE"))
+    # On SQLite the delete takes the database write lock for the same effect
+    await session.execute(
+        delete(AuditLogCounter).where(AuditLogCounter.project_id == project_id)
+    )
+    result = await session.execute(
+        select(AuditLog.project_id, AuditLog.timestamp, AuditLog.agent_name,
+               AuditLog.action_type, AuditLog.allowed)
+        .where(AuditLog.project_id == project_id)
+    )
+    rows = result.all()
+    await count_audit_logs(session, rows)
+    return len(rows)
+
+
+async def get_log_stats(session: AsyncSession, project_id: str) -> dict:
+    """Summary of a project's audit logs, read from its counter rows."""
+    totals = await session.execute(
+        select(AuditLogCounter.allowed, func.sum(AuditLogCounter.count))
+        .where(AuditLogCounter.project_id == project_id)
+        .group_by(AuditLogCounter.allowed)
+    )
+    by_outcome = {allowed: int(count) for allowed, count in totals.all()}
+    allowed = by_outcome.get(True, 0)
+    blocked = by_outcome.get(False, 0)
+    total = allowed + blocked
+
+    async def top(column, label: str) -> list[dict]:
+        count = func.sum(AuditLogCounter.count)
+        result = await session.execute(
+            select(column, count)
+            .where(AuditLogCounter.project_id == project_id)
+            .group_by(column)
+            .order_by(count.desc())
+            .limit(TOP_N)
+        )
+        return [{label: row[0], "count": int(row[1])} for row in result.all()]
+
+    return {
+        "total_actions": total,
+        "allowed": allowed,
+        "blocked": blocked,
+        "block_rate": round(blocked / total * 100, 2) if total > 0 else 0,
+        "top_action_types": await top(AuditLogCounter.action_type, "action_type"),
+        "top_agents": await top(AuditLogCounter.agent_name, "agent_name"),
+    }
@@ -4,8 +4,12 @@ import json
 import re
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable
+
+import orjson
+
+from server.services.ratelimit import SlidingWindowRateLimiter
 
 
 # Thread pool for regex execution with timeout
@@ -23,14 +27,61 @@ class RegexTimeoutError(Exception):
     pass
 
 
-def safe_regex_match(pattern: str, value: str, timeout: float | None = None) -> bool:
+@lru_cache(maxsize=1024)
+def compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a regex pattern once per process. Raises re.error if invalid."""
+    return re.compile(pattern)
+
+
+def _precompile(pattern: Any) -> re.Pattern | Any:
+    """
+    Compile a constraint's pattern when its policy is compiled.
+
+    Patterns that don't compile are returned unchanged, so the error still
+    surfaces when a value is matched against them, as it did before.
+    """
+    try:
+        return compile_pattern(pattern)
+    except (re.error, TypeError):
+        return pattern
+
+
+@lru_cache(maxsize=256)
+def parse_policy_json(policy_json: str) -> Any:
+    """
+    Parse policy JSON, caching the result by the raw string.
+
+    Active policies are validated against on every request, so the same
+    string is parsed repeatedly. The returned object is shared between
+    callers and must be treated as read-only.
+
+    Raises json.JSONDecodeError if the string is not valid JSON.
+    """
+    try:
+        return orjson.loads(policy_json)
+    except orjson.JSONDecodeError:
+        # orjson is stricter than the stdlib (no NaN, 64-bit ints only);
+        # defer to json for those inputs, which also raises on truly bad JSON
+        return json.loads(policy_json)
+
+
+def dump_policy_json(policy: dict) -> str:
+    """Serialize policy rules for storage."""
+    try:
+        return orjson.dumps(policy).decode()
+    except TypeError:
+        # Values orjson refuses (e.g. integers beyond 64 bits)
+        return json.dumps(policy)
+
+
+def safe_regex_match(pattern: str | re.Pattern, value: str, timeout: float | None = None) -> bool:
     """
     Safely execute regex match with timeout protection against ReDoS.
     Returns True if pattern matches, False otherwise.
     Raises RegexTimeoutError if matching takes too long.
 
     Args:
-        pattern: Regex pattern to match
+        pattern: Regex pattern to match, as a string or compiled
         value: String to match against
         timeout: Timeout in seconds (default: from config)
     """
@@ -38,7 +89,8 @@ def safe_regex_match(pattern: str, value: str, timeout: float | None = None) ->
         timeout = _get_regex_timeout()
 
     def do_match():
-        return re.match(pattern, value) is not None
+        compiled = pattern if isinstance(pattern, re.Pattern) else compile_pattern(pattern)
+        return compiled.match(value) is not None
 
     try:
         future = _regex_executor.submit(do_match)
@@ -47,14 +99,14 @@ def safe_regex_match(pattern: str, value: str, timeout: float | None = None) ->
         raise RegexTimeoutError(f"Regex pattern matching timed out after {timeout}s")
 
 
-def safe_regex_search(pattern: str, value: str, timeout: float | None = None) -> bool:
+def safe_regex_search(pattern: str | re.Pattern, value: str, timeout: float | None = None) -> bool:
     """
     Safely execute regex search with timeout protection against ReDoS.
     Returns True if pattern is found, False otherwise.
     Raises RegexTimeoutError if matching takes too long.
 
     Args:
-        pattern: Regex pattern to search for
+        pattern: Regex pattern to search for, as a string or compiled
         value: String to search in
         timeout: Timeout in seconds (default: from config)
     """
@@ -62,7 +114,8 @@ def safe_regex_search(pattern: str, value: str, timeout: float | None = None) ->
         timeout = _get_regex_timeout()
 
     def do_search():
-        return re.search(pattern, value) is not None
+        compiled = pattern if isinstance(pattern, re.Pattern) else compile_pattern(pattern)
+        return compiled.search(value) is not None
 
     try:
         future = _regex_executor.submit(do_search)
@@ -80,6 +133,380 @@ class ValidationResult:
     matched_rule: str | None = None
 
 
+# A compiled constraint returns a failed ValidationResult, or None if it passes
+ConstraintCheck = Callable[[dict[str, Any]], ValidationResult | None]
+
+# Marks a rule with no action_type, which applies to every action
+_ANY_ACTION = object()
+
+# Constraint keys that fail the check when the parameter is missing
+_VALUE_REQUIRED_KEYS = ("min", "max", "in", "not_in", "pattern", "equals")
+
+
+@dataclass(slots=True)
+class CompiledRule:
+    """A policy rule with its lookups and constraint checks prepared."""
+
+    name: str
+    allowed_agents: Any = None
+    blocked_agents: Any = ()
+    blocks_all: bool = False
+    rate_limit: tuple[int, int] | None = None
+    constraint_checks: tuple[ConstraintCheck, ...] = ()
+    # Set when the rule couldn't be compiled; the rule then blocks its actions
+    invalid_reason: str | None = None
+
+
+@dataclass(slots=True)
+class CompiledPolicy:
+    """
+    Dispatch table for a parsed policy.
+
+    by_action maps each explicitly named action type to the rules that apply
+    to it, in evaluation order. Action types not listed fall back to wildcard.
+    """
+
+    default_action: str
+    by_action: dict[str, tuple[CompiledRule, ...]]
+    wildcard: tuple[CompiledRule, ...]
+
+    def rules_for(self, action_type: str) -> tuple[CompiledRule, ...]:
+        """Rules to evaluate for an action type (specific before wildcard)."""
+        return self.by_action.get(action_type, self.wildcard)
+
+
+def _as_lookup(values: Any) -> Any:
+    """
+    Convert a list of values to a frozenset for O(1) membership tests.
+
+    Anything else (strings, lists holding unhashable items) is returned
+    unchanged so membership keeps its original semantics.
+    """
+    if isinstance(values, (list, tuple)):
+        try:
+            return frozenset(values)
+        except TypeError:
+            return values
+    return values
+
+
+def _contains(lookup: Any, values: Any, value: Any) -> bool:
+    """Membership test against a lookup built by _as_lookup."""
+    try:
+        return value in lookup
+    except TypeError:
+        # Unhashable value (e.g. a dict param) against a frozenset
+        return value in values
+
+
+def _compile_path(param_path: str) -> Callable[[dict[str, Any]], Any]:
+    """Build a getter for a dot-notation parameter path."""
+    # Remove 'params.' prefix if present
+    path = param_path[7:] if param_path.startswith("params.") else param_path
+    parts = tuple(path.split("."))
+
+    def get_value(params: dict[str, Any]) -> Any:
+        value = params
+        for part in parts:
+            if isinstance(value, dict):
+                value = value.get(part)
+            else:
+                return None
+        return value
+
+    return get_value
+
+
+def _compile_constraint(param_path: str, constraint: dict) -> ConstraintCheck:
+    """Build a check function for a single parameter constraint."""
+    get_value = _compile_path(param_path)
+    requires_value = any(k in constraint for k in _VALUE_REQUIRED_KEYS)
+    steps: list[Callable[[Any], ValidationResult | None]] = []
+
+    def not_numeric() -> ValidationResult:
+        return ValidationResult(
+            allowed=False,
+            reason=f"Parameter '{param_path}' cannot be compared numerically",
+        )
+
+    def to_float(limit: Any) -> float | None:
+        try:
+            return float(limit)
+        except (ValueError, TypeError):
+            return None  # Comparison raises TypeError and reports not_numeric
+
+    # Check 'max' constraint
+    if "max" in constraint:
+        max_value = constraint["max"]
+        max_float = to_float(max_value)
+
+        def check_max(value: Any) -> ValidationResult | None:
+            try:
+                if float(value) > max_float:
+                    return ValidationResult(
+                        allowed=False,
+                        reason=f"Parameter '{param_path}' value {value} exceeds maximum {max_value}",
+                    )
+            except (ValueError, TypeError):
+                return not_numeric()
+            return None
+
+        steps.append(check_max)
+
+    # Check 'min' constraint
+    if "min" in constraint:
+        min_value = constraint["min"]
+        min_float = to_float(min_value)
+
+        def check_min(value: Any) -> ValidationResult | None:
+            try:
+                if float(value) < min_float:
+                    return ValidationResult(
+                        allowed=False,
+                        reason=f"Parameter '{param_path}' value {value} is below minimum {min_value}",
+                    )
+            except (ValueError, TypeError):
+                return not_numeric()
+            return None
+
+        steps.append(check_min)
+
+    # Check 'in' constraint (whitelist)
+    if "in" in constraint:
+        allowed_values = constraint["in"]
+        allowed_lookup = _as_lookup(allowed_values)
+
+        def check_in(value: Any) -> ValidationResult | None:
+            if not _contains(allowed_lookup, allowed_values, value):
+                return ValidationResult(
+                    allowed=False,
+                    reason=f"Parameter '{param_path}' value '{value}' not in allowed values {allowed_values}",
+                )
+            return None
+
+        steps.append(check_in)
+
+    # Check 'not_in' constraint (blacklist)
+    if "not_in" in constraint:
+        blocked_values = constraint["not_in"]
+        blocked_lookup = _as_lookup(blocked_values)
+
+        def check_not_in(value: Any) -> ValidationResult | None:
+            if _contains(blocked_lookup, blocked_values, value):
+                return ValidationResult(
+                    allowed=False,
+                    reason=f"Parameter '{param_path}' value '{value}' is blocked",
+                )
+            return None
+
+        steps.append(check_not_in)
+
+    # Check 'pattern' constraint (regex) - with ReDoS protection
+    if "pattern" in constraint:
+        pattern = constraint["pattern"]
+        compiled_pattern = _precompile(pattern)
+
+        def check_pattern(value: Any) -> ValidationResult | None:
+            try:
+                if not safe_regex_match(compiled_pattern, str(value)):
+                    return ValidationResult(
+                        allowed=False,
+                        reason=f"Parameter '{param_path}' value '{value}' does not match pattern '{pattern}'",
+                    )
+            except RegexTimeoutError:
+                return ValidationResult(
+                    allowed=False,
+                    reason=f"Pattern matching timed out for '{param_path}' - possible ReDoS pattern",
+                )
+            return None
+
+        steps.append(check_pattern)
+
+    # Check 'equals' constraint
+    if "equals" in constraint:
+        expected = constraint["equals"]
+
+        def check_equals(value: Any) -> ValidationResult | None:
+            if value != expected:
+                return ValidationResult(
+                    allowed=False,
+                    reason=f"Parameter '{param_path}' must equal '{expected}'",
+                )
+            return None
+
+        steps.append(check_equals)
+
+    # Check 'not_pattern' constraint (block if matches - for PII detection) - with ReDoS protection
+    if "not_pattern" in constraint:
+        not_pattern = constraint["not_pattern"]
+        pii_reason = constraint.get("reason", f"Pattern '{not_pattern}' is not allowed")
+        compiled_not_pattern = _precompile(not_pattern)
+
+        def check_not_pattern(value: Any) -> ValidationResult | None:
+            try:
+                if safe_regex_search(compiled_not_pattern, str(value)):
+                    return ValidationResult(
+                        allowed=False,
+                        reason=f"Parameter '{param_path}': {pii_reason}",
+                    )
+            except RegexTimeoutError:
+                return ValidationResult(
+                    allowed=False,
+                    reason=f"Pattern matching timed out for '{param_path}' - possible ReDoS pattern",
+                )
+            return None
+
+        steps.append(check_not_pattern)
+
+    # Check 'contains' constraint (value must contain substring)
+    if "contains" in constraint:
+        substring = constraint["contains"]
+
+        def check_contains(value: Any) -> ValidationResult | None:
+            if substring not in str(value):
+                return ValidationResult(
+                    allowed=False,
+                    reason=f"Parameter '{param_path}' must contain '{substring}'",
+                )
+            return None
+
+        steps.append(check_contains)
+
+    # Check 'not_contains' constraint (value must not contain substring)
+    if "not_contains" in constraint:
+        forbidden = constraint["not_contains"]
+
+        def check_not_contains(value: Any) -> ValidationResult | None:
+            if forbidden in str(value):
+                return ValidationResult(
+                    allowed=False,
+                    reason=f"Parameter '{param_path}' must not contain '{forbidden}'",
+                )
+            return None
+
+        steps.append(check_not_contains)
+
+    checks = tuple(steps)
+
+    def check(params: dict[str, Any]) -> ValidationResult | None:
+        value = get_value(params)
+
+        # Only fail on a missing value if a constraint requires one
+        if value is None:
+            if requires_value:
+                return ValidationResult(
+                    allowed=False,
+                    reason=f"Required parameter '{param_path}' is missing",
+                )
+            return None
+
+        for step in checks:
+            failure = step(value)
+            if failure is not None:
+                return failure
+        return None
+
+    return check
+
+
+def _compile_rule(rule: dict) -> CompiledRule:
+    """Prepare a single policy rule for evaluation."""
+    rate_limit = rule.get("rate_limit")
+    blocked_agents = _as_lookup(rule.get("blocked_agents", []))
+    return CompiledRule(
+        name=rule.get("action_type", "*"),
+        allowed_agents=_as_lookup(rule.get("allowed_agents") or None),
+        blocked_agents=blocked_agents,
+        blocks_all="*" in blocked_agents,
+        rate_limit=(
+            (rate_limit.get("max_requests", 100), rate_limit.get("window_seconds", 3600))
+            if rate_limit
+            else None
+        ),
+        constraint_checks=tuple(
+            _compile_constraint(param_path, constraint)
+            for param_path, constraint in rule.get("constraints", {}).items()
+        ),
+    )
+
+
+def compile_policy(policy: dict) -> CompiledPolicy:
+    """
+    Compile a parsed policy into a dispatch table.
+
+    Rules that match an action type are evaluated in policy order, with
+    explicit "*" rules after the specific ones. A rule without an
+    action_type applies to every action but keeps its position among the
+    specific rules.
+
+    A malformed rule doesn't fail the whole policy: it compiles to a rule
+    that blocks the actions it applies to, naming the problem. A rule that
+    isn't an object blocks every action, since its scope is unknown.
+    """
+    specific: list[tuple[Any, CompiledRule]] = []
+    wildcards: list[CompiledRule] = []
+
+    rules = policy.get("rules", [])
+    if not isinstance(rules, list):
+        wildcards.append(CompiledRule(
+            name="*", invalid_reason="Invalid policy: rules must be a list"
+        ))
+        rules = []
+
+    for rule in rules:
+        if not isinstance(rule, dict):
+            specific.append((_ANY_ACTION, CompiledRule(
+                name="*", invalid_reason="Invalid policy rule: rule must be an object"
+            )))
+            continue
+        try:
+            compiled = _compile_rule(rule)
+        except (AttributeError, TypeError, ValueError) as e:
+            compiled = CompiledRule(
+                name=rule.get("action_type", "*"),
+                invalid_reason=f"Invalid policy rule: {e}",
+            )
+        if "action_type" not in rule:
+            specific.append((_ANY_ACTION, compiled))
+        elif rule["action_type"] == "*":
+            wildcards.append(compiled)
+        else:
+            specific.append((rule["action_type"], compiled))
+
+    def rules_matching(action_type: Any) -> tuple[CompiledRule, ...]:
+        matched = [
+            compiled for rule_action, compiled in specific
+            if rule_action is _ANY_ACTION or rule_action == action_type
+        ]
+        return tuple(matched + wildcards)
+
+    action_types = {
+        rule_action for rule_action, _ in specific
+        if rule_action is not _ANY_ACTION and isinstance(rule_action, str)
+    }
+    return CompiledPolicy(
+        default_action=policy.get("default", "allow"),
+        by_action={action_type: rules_matching(action_type) for action_type in action_types},
+        wildcard=rules_matching(_ANY_ACTION),
+    )
+
+
+@lru_cache(maxsize=256)
+def get_compiled_policy(policy_json: str) -> CompiledPolicy | None:
+    """
+    Parse and compile policy JSON, caching the plan by the raw string.
+
+    Keying on the stored JSON means an updated policy never hits a stale
+    plan. Returns None if the JSON is valid but not an object.
+
+    Raises json.JSONDecodeError if the string is not valid JSON.
+    """
+    policy = parse_policy_json(policy_json)
+    if not isinstance(policy, dict):
+        return None
+    return compile_policy(policy)
+
+
 class PolicyEngine:
     """
     Evaluates actions against policy rules.
@@ -106,7 +533,7 @@ class PolicyEngine:
     """
 
     def __init__(self):
-        self._rate_limit_counters: dict[str, list[datetime]] = {}
+        self._rate_limiter = SlidingWindowRateLimiter()
 
     def validate(
         self,
@@ -114,64 +541,65 @@ class PolicyEngine:
         agent_name: str,
         action_type: str,
         params: dict[str, Any],
+        project_id: str | None = None,
     ) -> ValidationResult:
-        """Validate an action against a policy."""
+        """
+        Validate an action against a policy.
+
+        Rate limits are counted per (project_id, agent_name, action_type), so
+        projects with the same agent and action names don't share a budget.
+        """
         try:
-            policy = json.loads(policy_json)
+            plan = get_compiled_policy(policy_json)
         except json.JSONDecodeError as e:
             return ValidationResult(
                 allowed=False, reason=f"Invalid policy JSON: {e}"
             )
 
         # Handle case where JSON is valid but not a dict (e.g., null, [], "string")
-        if not isinstance(policy, dict):
+        if plan is None:
             return ValidationResult(
                 allowed=False, reason="Policy must be a JSON object"
             )
 
-        default_action = policy.get("default", "allow")
-        rules = policy.get("rules", [])
-
-        # Find matching rules (specific action_type first, then wildcards)
-        matching_rules = []
-        for rule in rules:
-            rule_action = rule.get("action_type", "*")
-            if rule_action == action_type or rule_action == "*":
-                matching_rules.append(rule)
-
-        # Sort so specific rules come before wildcards
-        matching_rules.sort(key=lambda r: 0 if r.get("action_type") != "*" else 1)
+        matching_rules = plan.rules_for(action_type)
 
         # If no rules match, use default
         if not matching_rules:
-            if default_action == "block":
+            if plan.default_action == "block":
                 return ValidationResult(
                     allowed=False,
                     reason=f"Action '{action_type}' not allowed by policy (no matching rules)",
                 )
             return ValidationResult(allowed=True)
 
-        # Evaluate each matching rule
+        # Evaluate each matching rule; passing rules allocate nothing
         for rule in matching_rules:
-            result = self._evaluate_rule(rule, agent_name, action_type, params)
-            if not result.allowed:
-                return result
+            failure = self._evaluate_rule(rule, agent_name, action_type, params, project_id)
+            if failure is not None:
+                return failure
 
         return ValidationResult(allowed=True)
 
     def _evaluate_rule(
         self,
-        rule: dict,
+        rule: CompiledRule,
         agent_name: str,
         action_type: str,
         params: dict[str, Any],
-    ) -> ValidationResult:
-        """Evaluate a single rule against an action."""
-        rule_name = rule.get("action_type", "*")
+        project_id: str | None = None,
+    ) -> ValidationResult | None:
+        """Evaluate a single compiled rule. Returns the failure, or None if it passes."""
+        rule_name = rule.name
+
+        # A rule that failed to compile blocks rather than being skipped
+        if rule.invalid_reason is not None:
+            return ValidationResult(
+                allowed=False, reason=rule.invalid_reason, matched_rule=rule_name
+            )
 
         # Check allowed_agents
-        allowed_agents = rule.get("allowed_agents")
-        if allowed_agents and agent_name not in allowed_agents:
+        if rule.allowed_agents is not None and agent_name not in rule.allowed_agents:
             return ValidationResult(
                 allowed=False,
                 reason=f"Agent '{agent_name}' not in allowed agents list",
@@ -179,8 +607,7 @@ class PolicyEngine:
             )
 
         # Check blocked_agents
-        blocked_agents = rule.get("blocked_agents", [])
-        if agent_name in blocked_agents or "*" in blocked_agents:
+        if rule.blocks_all or agent_name in rule.blocked_agents:
             return ValidationResult(
                 allowed=False,
                 reason=f"Agent '{agent_name}' is blocked",
@@ -188,200 +615,45 @@ class PolicyEngine:
             )
 
         # Check rate limits
-        rate_limit = rule.get("rate_limit")
-        if rate_limit:
+        if rule.rate_limit is not None:
+            max_requests, window_seconds = rule.rate_limit
             result = self._check_rate_limit(
-                agent_name, action_type, rate_limit
+                project_id, agent_name, action_type, max_requests, window_seconds
             )
             if not result.allowed:
                 result.matched_rule = rule_name
                 return result
 
         # Check parameter constraints
-        constraints = rule.get("constraints", {})
-        for param_path, constraint in constraints.items():
-            result = self._check_constraint(param_path, constraint, params)
-            if not result.allowed:
-                result.matched_rule = rule_name
-                return result
-
-        return ValidationResult(allowed=True, matched_rule=rule_name)
-
-    def _check_constraint(
-        self,
-        param_path: str,
-        constraint: dict,
-        params: dict[str, Any],
-    ) -> ValidationResult:
-        """Check a single parameter constraint."""
-        # Get the value from params using dot notation (e.g., "params.amount" -> params["amount"])
-        value = self._get_nested_value(param_path, params)
-
-        # If value is None and we have constraints, that might be an issue
-        if value is None:
-            # Only fail if there are constraints that require a value
-            if any(k in constraint for k in ["min", "max", "in", "not_in", "pattern", "equals"]):
-                return ValidationResult(
-                    allowed=False,
-                    reason=f"Required parameter '{param_path}' is missing",
-                )
-            return ValidationResult(allowed=True)
-
-        # Check 'max' constraint
-        if "max" in constraint:
-            try:
-                if float(value) > float(constraint["max"]):
-                    return ValidationResult(
-                        allowed=False,
-                        reason=f"Parameter '{param_path}' value {value} exceeds maximum {constraint['max']}",
-                    )
-            except (ValueError, TypeError):
-                return ValidationResult(
-                    allowed=False,
-                    reason=f"Parameter '{param_path}' cannot be compared numerically",
-                )
-
-        # Check 'min' constraint
-        if "min" in constraint:
-            try:
-                if float(value) < float(constraint["min"]):
-                    return ValidationResult(
-                        allowed=False,
-                        reason=f"Parameter '{param_path}' value {value} is below minimum {constraint['min']}",
-                    )
-            except (ValueError, TypeError):
-                return ValidationResult(
-                    allowed=False,
-                    reason=f"Parameter '{param_path}' cannot be compared numerically",
-                )
-
-        # Check 'in' constraint (whitelist)
-        if "in" in constraint:
-            allowed_values = constraint["in"]
-            if value not in allowed_values:
-                return ValidationResult(
-                    allowed=False,
-                    reason=f"Parameter '{param_path}' value '{value}' not in allowed values {allowed_values}",
-                )
-
-        # Check 'not_in' constraint (blacklist)
-        if "not_in" in constraint:
-            blocked_values = constraint["not_in"]
-            if value in blocked_values:
-                return ValidationResult(
-                    allowed=False,
-                    reason=f"Parameter '{param_path}' value '{value}' is blocked",
-                )
-
-        # Check 'pattern' constraint (regex) - with ReDoS protection
-        if "pattern" in constraint:
-            pattern = constraint["pattern"]
-            try:
-                if not safe_regex_match(pattern, str(value)):
-                    return ValidationResult(
-                        allowed=False,
-                        reason=f"Parameter '{param_path}' value '{value}' does not match pattern '{pattern}'",
-                    )
-            except RegexTimeoutError:
-                return ValidationResult(
-                    allowed=False,
-                    reason=f"Pattern matching timed out for '{param_path}' - possible ReDoS pattern",
-                )
-
-        # Check 'equals' constraint
-        if "equals" in constraint:
-            if value != constraint["equals"]:
-                return ValidationResult(
-                    allowed=False,
-                    reason=f"Parameter '{param_path}' must equal '{constraint['equals']}'",
-                )
-
-        # Check 'not_pattern' constraint (block if matches - for PII detection) - with ReDoS protection
-        if "not_pattern" in constraint:
-            pattern = constraint["not_pattern"]
-            try:
-                if safe_regex_search(pattern, str(value)):
-                    reason = constraint.get("reason", f"Pattern '{pattern}' is not allowed")
-                    return ValidationResult(
-                        allowed=False,
-                        reason=f"Parameter '{param_path}': {reason}",
-                    )
-            except RegexTimeoutError:
-                return ValidationResult(
-                    allowed=False,
-                    reason=f"Pattern matching timed out for '{param_path}' - possible ReDoS pattern",
-                )
-
-        # Check 'contains' constraint (value must contain substring)
-        if "contains" in constraint:
-            if constraint["contains"] not in str(value):
-                return ValidationResult(
-                    allowed=False,
-                    reason=f"Parameter '{param_path}' must contain '{constraint['contains']}'",
-                )
-
-        # Check 'not_contains' constraint (value must not contain substring)
-        if "not_contains" in constraint:
-            if constraint["not_contains"] in str(value):
-                return ValidationResult(
-                    allowed=False,
-                    reason=f"Parameter '{param_path}' must not contain '{constraint['not_contains']}'",
-                )
+        for check in rule.constraint_checks:
+            failure = check(params)
+            if failure is not None:
+                failure.matched_rule = rule_name
+                return failure
 
-        return ValidationResult(allowed=True)
-
-    def _get_nested_value(self, path: str, params: dict[str, Any]) -> Any:
-        """Get a value from params using dot notation path."""
-        # Remove 'params.' prefix if present
-        if path.startswith("params."):
-            path = path[7:]
-
-        parts = path.split(".")
-        value = params
-        for part in parts:
-            if isinstance(value, dict):
-                value = value.get(part)
-            else:
-                return None
-        return value
+        return None
 
     def _check_rate_limit(
         self,
+        project_id: str | None,
         agent_name: str,
         action_type: str,
-        rate_limit: dict,
+        max_requests: int,
+        window_seconds: int,
     ) -> ValidationResult:
         """Check rate limiting for an action."""
-        max_requests = rate_limit.get("max_requests", 100)
-        window_seconds = rate_limit.get("window_seconds", 3600)
-
-        key = f"{agent_name}:{action_type}"
-        now = datetime.utcnow()
-        window_start = now - timedelta(seconds=window_seconds)
-
-        # Get or create counter for this key
-        if key not in self._rate_limit_counters:
-            self._rate_limit_counters[key] = []
-
-        # Clean old entries
-        self._rate_limit_counters[key] = [
-            ts for ts in self._rate_limit_counters[key] if ts > window_start
-        ]
-
-        # Check if over limit
-        if len(self._rate_limit_counters[key]) >= max_requests:
+        # A tuple can't collide the way a joined string can when names contain ":"
+        key = (project_id, agent_name, action_type)
+        if not self._rate_limiter.hit(key, max_requests, window_seconds):
             return ValidationResult(
                 allowed=False,
                 reason=f"Rate limit exceeded: {max_requests} requests per {window_seconds}s",
             )
-
-        # Record this request
-        self._rate_limit_counters[key].append(now)
         return ValidationResult(allowed=True)
 
     def clear_rate_limits(self) -> None:
         """Clear all rate limit counters (useful for testing)."""
-        self._rate_limit_counters.clear()
+        self._rate_limiter.clear()
 
 
 # Singleton instance
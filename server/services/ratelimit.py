@@ -0,0 +1,98 @@
+"""Sliding-window rate limiter for policy rate_limit rules."""
+
+import threading
+import time
+from array import array
+from dataclasses import dataclass, field
+from typing import Callable, Hashable
+
+_NS_PER_SECOND = 1_000_000_000
+
+# Slots given to a key's buffer on its first hit; it doubles from there as
+# needed, up to max_requests, so a large limit costs nothing until it is used
+INITIAL_CAPACITY = 8
+
+
+@dataclass(slots=True)
+class RateState:
+    """
+    Ring buffer of request timestamps (monotonic ns) for one key.
+
+    A window never holds more than max_requests accepted requests, so the
+    buffer stops growing at that size and is reused from then on; head is
+    the oldest entry and count the number of live entries.
+    """
+
+    buf: array = field(default_factory=lambda: array("q"))
+    head: int = 0
+    count: int = 0
+
+    def grow(self, capacity: int) -> None:
+        """Enlarge the buffer, keeping live entries oldest first."""
+        size = len(self.buf)
+        live = [self.buf[(self.head + i) % size] for i in range(self.count)]
+        self.buf = array("q", live + [0] * (capacity - self.count))
+        self.head = 0
+
+
+class SlidingWindowRateLimiter:
+    """
+    In-process sliding-window counter.
+
+    Each key keeps a ring buffer of int64 timestamps, grown by doubling
+    only while the window actually fills up. Expired entries are dropped
+    from the head on access and new ones overwrite free slots, so
+    steady-state checks allocate nothing. Keys are spread over
+    independently locked shards so concurrent checks for different keys
+    don't contend.
+
+    State is per process; multiple workers each enforce their own limit.
+    """
+
+    def __init__(self, shards: int = 16, clock: Callable[[], int] = time.monotonic_ns):
+        self._clock = clock
+        self._shards: list[dict[Hashable, RateState]] = [{} for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+
+    def hit(self, key: Hashable, max_requests: int, window_seconds: float) -> bool:
+        """
+        Record a request for key if it is within the limit.
+
+        Returns True if the request is allowed, False if the key already has
+        max_requests requests in the last window_seconds.
+        """
+        index = hash(key) % len(self._shards)
+        shard = self._shards[index]
+
+        with self._locks[index]:
+            state = shard.get(key)
+            if state is None:
+                state = shard[key] = RateState()
+
+            now = self._clock()
+            buf = state.buf
+            size = len(buf)
+            window_start = now - int(window_seconds * _NS_PER_SECOND)
+            while state.count and buf[state.head] <= window_start:
+                state.head = (state.head + 1) % size
+                state.count -= 1
+
+            if state.count >= max_requests:
+                return False
+
+            if state.count == size:
+                # Rules sharing a key may use different limits, so the cap is
+                # this rule's max_requests rather than a size fixed per key
+                state.grow(min(max(size * 2, INITIAL_CAPACITY), max_requests))
+                buf = state.buf
+                size = len(buf)
+
+            buf[(state.head + state.count) % size] = now
+            state.count += 1
+            return True
+
+    def clear(self) -> None:
+        """Forget all recorded requests."""
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                shard.clear()
@@ -1,5 +1,6 @@
 """Validator service - orchestrates policy validation and logging."""
 
+import asyncio
 import json
 import logging
 import time
@@ -11,8 +12,11 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from server.models import Policy, AuditLog
-from server.services.policy_engine import get_policy_engine, ValidationResult
+from server.models.audit_log import generate_action_id
+from server.services.policy_engine import get_policy_engine, parse_policy_json, ValidationResult
 from server.services.aggregate import AggregateService
+from server.services.audit_queue import get_audit_writer
+from server.services.log_stats import count_audit_logs
 from server.cache import get_cache
 
 logger = logging.getLogger(__name__)
@@ -99,6 +103,7 @@ class ValidatorService:
                 agent_name=agent_name,
                 action_type=action_type,
                 params=params,
+                project_id=project_id,
             )
 
             # If basic validation passed, check aggregate limits
@@ -122,8 +127,10 @@ class ValidatorService:
                 simulated=True,
             )
 
-        # Create audit log entry
+        # Create audit log entry (id and timestamp set here so the row can
+        # be written after the response when batching)
         audit_log = AuditLog(
+            action_id=generate_action_id(),
             project_id=project_id,
             agent_name=agent_name,
             action_type=action_type,
@@ -132,9 +139,12 @@ class ValidatorService:
             reason=result.reason,
             policy_version=policy_version,
             execution_time_ms=execution_time_ms,
+            timestamp=datetime.utcnow(),
         )
-        self.db.add(audit_log)
-        await self.db.flush()  # Get the generated action_id
+        if not self._queue_audit_log(audit_log):
+            self.db.add(audit_log)
+            await count_audit_logs(self.db, [audit_log])
+            await self.db.flush()
 
         # Invalidate aggregate cache if action was allowed
         # (next check will recalculate from DB including this action)
@@ -165,7 +175,7 @@ class ValidatorService:
         Returns ValidationResult with allowed=False if any limit exceeded.
         """
         try:
-            policy = json.loads(policy_rules)
+            policy = parse_policy_json(policy_rules)
         except json.JSONDecodeError:
             return ValidationResult(allowed=True)  # Invalid JSON, skip aggregate check
 
@@ -252,6 +262,18 @@ class ValidatorService:
         except (ValueError, TypeError):
             return None
 
+    def _queue_audit_log(self, audit_log: AuditLog) -> bool:
+        """Hand the row to the batched writer. False if it must be written inline."""
+        writer = get_audit_writer()
+        if writer is None:
+            return False
+        try:
+            writer.put_nowait(audit_log)
+        except asyncio.QueueFull:
+            # Writer is backed up - this request writes its own row
+            return False
+        return True
+
     async def _get_active_policy(self, project_id: str) -> Policy | None:
         """Get the active policy for a project (with caching)."""
         cache = get_cache()
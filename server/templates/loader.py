@@ -1,13 +1,20 @@
 """Load and manage policy templates."""
 
+import hashlib
 import json
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import orjson
 
 TEMPLATES_DIR = Path(__file__).parent
 
 _templates_cache: Optional[Dict[str, dict]] = None
 
+# Serialized response bodies, paired with their ETag
+_list_body_cache: Optional[Tuple[bytes, str]] = None
+_detail_body_cache: Dict[str, Tuple[bytes, str]] = {}
+
 
 def load_templates() -> Dict[str, dict]:
     """Load all templates from JSON files.
@@ -57,7 +64,46 @@ def list_templates() -> List[dict]:
     ]
 
 
+def _make_etag(body: bytes) -> str:
+    """Build a strong ETag from a response body."""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def list_templates_body() -> Tuple[bytes, str]:
+    """Get the serialized GET /templates response body and its ETag.
+
+    Templates never change at runtime, so the body is encoded once and
+    reused for every request.
+    """
+    global _list_body_cache
+    if _list_body_cache is None:
+        body = orjson.dumps({"templates": list_templates()})
+        _list_body_cache = (body, _make_etag(body))
+    return _list_body_cache
+
+
+def get_template_body(template_id: str) -> Optional[Tuple[bytes, str]]:
+    """Get the serialized template response body and its ETag.
+
+    Args:
+        template_id: The template identifier (e.g., 'finance', 'healthcare')
+
+    Returns:
+        (body, etag) tuple if found, None otherwise.
+    """
+    cached = _detail_body_cache.get(template_id)
+    if cached is None:
+        template = get_template(template_id)
+        if template is None:
+            return None
+        body = orjson.dumps(template)
+        cached = _detail_body_cache[template_id] = (body, _make_etag(body))
+    return cached
+
+
 def clear_cache() -> None:
     """Clear the templates cache. Useful for testing."""
-    global _templates_cache
+    global _templates_cache, _list_body_cache
     _templates_cache = None
+    _list_body_cache = None
+    _detail_body_cache.clear()
@@ -2,17 +2,51 @@
 Shared pytest fixtures for AI Firewall tests.
 """
 
+import atexit
 import json
+import os
 import pytest
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 
+# Run against a throwaway SQLite file (WAL needs a real file, not :memory:)
+# unless DATABASE_URL points elsewhere. Must be set before server.config loads.
+if "DATABASE_URL" not in os.environ:
+    _test_db_dir = tempfile.mkdtemp(prefix="ai_firewall_test_")
+    atexit.register(shutil.rmtree, _test_db_dir, ignore_errors=True)
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_test_db_dir}/test.db"
+
 # Add server to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from server.services.policy_engine import PolicyEngine
 
 
+def pytest_addoption(parser):
+    """Add custom command line options."""
+    parser.addoption(
+        "--threaded",
+        action="store_true",
+        default=False,
+        help="Run concurrent performance tests with a thread pool instead of asyncio",
+    )
+
+
+@pytest.fixture(scope="session")
+def app_client():
+    """TestClient shared across modules - the app lifespan runs once per session.
+
+    For tests that only need a running app (no fresh state per test).
+    """
+    from fastapi.testclient import TestClient
+    from server.app import app
+
+    with TestClient(app) as client:
+        yield client
+
+
 @pytest.fixture
 def policy_engine():
     """Fresh policy engine instance for each test."""
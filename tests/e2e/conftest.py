@@ -1,24 +1,24 @@
 """E2E test fixtures for AI Agent Firewall."""
 
-import time
+import uuid
 
 import pytest
-from fastapi.testclient import TestClient
 
-from server.app import app
 
+@pytest.fixture(scope="session")
+def client(app_client):
+    """Session-wide TestClient - the app lifespan runs once, not per test.
 
-@pytest.fixture
-def client():
-    """Create TestClient with fresh database for each test."""
-    with TestClient(app) as c:
-        yield c
+    The database is shared with every test, so isolation comes from
+    unique_id rather than a fresh database.
+    """
+    return app_client
 
 
 @pytest.fixture
 def unique_id():
-    """Generate unique timestamp-based ID for test isolation."""
-    return f"e2e-{int(time.time() * 1000)}"
+    """Generate a unique ID for test isolation."""
+    return f"e2e-{uuid.uuid4().hex[:12]}"
 
 
 @pytest.fixture
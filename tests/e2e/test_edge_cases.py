@@ -189,8 +189,7 @@ class TestEdgeCases:
 
         # Run 50 concurrent validations
         with ThreadPoolExecutor(max_workers=20) as executor:
-            futures = [executor.submit(validate, i) for i in range(50)]
-            results = [f.result() for f in futures]
+            results = list(executor.map(validate, range(50)))
 
         # All should complete successfully (status 200)
         assert all(status == 200 for status, _, _ in results)
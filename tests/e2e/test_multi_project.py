@@ -245,12 +245,12 @@ class TestMultiProject:
 
         # Run 30 validations concurrently across 3 projects
         with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = []
-            for i in range(30):
-                project_id, api_key = projects[i % 3]
-                futures.append(executor.submit(validate, project_id, api_key, i))
-
-            results = [f.result() for f in futures]
+            results = list(executor.map(
+                validate,
+                (projects[i % 3][0] for i in range(30)),
+                (projects[i % 3][1] for i in range(30)),
+                range(30),
+            ))
 
         # All should succeed
         assert all(status == 200 for status, _ in results)
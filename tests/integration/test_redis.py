@@ -17,6 +17,12 @@ import pytest
 import pytest_asyncio
 import json
 
+# Connections opened up front so concurrency tests measure steady state.
+# The pool blocks when exhausted, so tests issuing more concurrent commands
+# than this wait for a free connection instead of failing.
+REDIS_POOL_SIZE = 20
+REDIS_POOL_TIMEOUT = 5
+
 # Skip all tests if Redis URL not provided
 pytestmark = [
     pytest.mark.skipif(
@@ -40,25 +46,31 @@ async def redis_client(redis_url):
     """Create Redis client for testing."""
     from redis import asyncio as aioredis
 
-    client = aioredis.from_url(
+    pool = aioredis.BlockingConnectionPool.from_url(
         redis_url,
         encoding="utf-8",
         decode_responses=True,
+        max_connections=REDIS_POOL_SIZE,
+        timeout=REDIS_POOL_TIMEOUT,
     )
+    client = aioredis.Redis(connection_pool=pool)
+    # Warm the pool - concurrent pings force each connection to be opened
+    await asyncio.gather(*(client.ping() for _ in range(REDIS_POOL_SIZE)))
     yield client
 
-    # Cleanup - flush test keys
-    keys = await client.keys("test:*")
-    if keys:
-        await client.delete(*keys)
-    keys = await client.keys("policy:*")
-    if keys:
-        await client.delete(*keys)
-    keys = await client.keys("api_key:*")
+    # Cleanup - flush test keys (one round-trip for lookup, one for delete)
+    async with client.pipeline(transaction=False) as pipe:
+        for pattern in ("test:*", "policy:*", "api_key:*"):
+            pipe.keys(pattern)
+        key_groups = await pipe.execute()
+    keys = [key for group in key_groups for key in group]
     if keys:
         await client.delete(*keys)
 
+    # Close must be awaited: the per-test event loop is closed right after
+    # teardown, so a fire-and-forget task would leak open sockets.
     await client.aclose()
+    await pool.disconnect()
 
 
 @pytest_asyncio.fixture(scope="function")
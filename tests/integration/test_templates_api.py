@@ -2,18 +2,15 @@
 
 import uuid
 import pytest
-from fastapi.testclient import TestClient
 
-from server.app import app
 from server.templates.loader import clear_cache
 
 
 @pytest.fixture
-def client():
-    """Create TestClient for each test."""
+def client(app_client):
+    """Session-wide TestClient; resets the template cache after each test."""
+    yield app_client
     clear_cache()
-    with TestClient(app) as c:
-        yield c
 
 
 def unique_id() -> str:
@@ -60,6 +57,34 @@ class TestTemplatesListEndpoint:
             # Should NOT include full policy
             assert "policy" not in template
 
+    def test_get_templates_returns_etag(self, client):
+        """GET /templates should return a stable ETag header."""
+        first = client.get("/templates")
+        second = client.get("/templates")
+        assert "etag" in first.headers
+        assert first.headers["etag"] == second.headers["etag"]
+
+    def test_get_templates_not_modified_with_matching_etag(self, client):
+        """GET /templates with a matching If-None-Match returns 304 and no body."""
+        etag = client.get("/templates").headers["etag"]
+
+        response = client.get("/templates", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_get_templates_stale_etag_returns_body(self, client):
+        """A non-matching If-None-Match gets the full body."""
+        response = client.get("/templates", headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+        assert "templates" in response.json()
+
+    def test_get_templates_cache_control(self, client):
+        """Template responses are cacheable by clients and proxies."""
+        response = client.get("/templates")
+        assert response.headers["cache-control"] == "public, max-age=300"
+
 
 class TestTemplateDetailEndpoint:
     """Tests for GET /templates/{template_id} endpoint."""
@@ -95,6 +120,15 @@ class TestTemplateDetailEndpoint:
         data = response.json()
         assert "not found" in data["detail"].lower()
 
+    def test_get_template_not_modified_with_matching_etag(self, client):
+        """Detail endpoint honours If-None-Match, including weak and list forms."""
+        etag = client.get("/templates/finance").headers["etag"]
+
+        response = client.get(
+            "/templates/finance", headers={"If-None-Match": f'"other", W/{etag}'}
+        )
+        assert response.status_code == 304
+
     def test_get_template_content_type_is_json(self, client):
         """GET /templates/{id} should return JSON content type."""
         response = client.get("/templates/finance")
@@ -0,0 +1,21 @@
+"""Performance test fixtures."""
+
+import asyncio
+
+import pytest
+
+# Optional - uvloop is installed with uvicorn[standard] on Linux/macOS
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    uvloop = None
+    UVLOOP_AVAILABLE = False
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async performance tests on uvloop when available, matching production."""
+    if UVLOOP_AVAILABLE:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
@@ -0,0 +1,217 @@
+"""
+SDK Admission Control Tests for AI Agent Firewall Python SDK.
+
+Tests:
+- AIMD limit growth and backoff
+- Blocking when the limit is reached
+- Client integration (opt-in via latency_target)
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from unittest.mock import patch
+import httpx
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "sdk" / "python"))
+
+from ai_firewall import AIFirewall, AsyncAIFirewall
+from ai_firewall.admission import AdmissionController, AsyncAdmissionController
+
+
+# =============================================================================
+# TEST FIXTURES
+# =============================================================================
+
+@pytest.fixture
+def valid_validation_response():
+    """Valid response for /validate_action endpoint."""
+    return {
+        "allowed": True,
+        "action_id": "act_123456",
+        "timestamp": "2025-01-01T12:00:00Z",
+        "reason": None,
+        "execution_time_ms": 5,
+    }
+
+
+def make_controller(**kwargs):
+    options = dict(latency_target=0.1, min_limit=1, max_limit=16, initial=4, window=2)
+    options.update(kwargs)
+    return AdmissionController(**options)
+
+
+# =============================================================================
+# AIMD TESTS
+# =============================================================================
+
+class TestAIMDLimit:
+    """Tests for how the limit reacts to request outcomes."""
+
+    def test_fast_window_increases_limit(self):
+        """A window at or under the latency target adds alpha."""
+        controller = make_controller()
+        for _ in range(2):
+            controller.acquire()
+            controller.release(0.05, overloaded=False)
+
+        assert controller.limit == 4.5
+
+    def test_slow_window_halves_limit(self):
+        """A window over the latency target multiplies by beta."""
+        controller = make_controller()
+        for _ in range(2):
+            controller.acquire()
+            controller.release(0.5, overloaded=False)
+
+        assert controller.limit == 2.0
+
+    def test_overload_halves_limit_immediately(self):
+        """An overloaded response backs off without waiting for the window."""
+        controller = make_controller()
+        controller.acquire()
+        controller.release(0.01, overloaded=True)
+
+        assert controller.limit == 2.0
+
+    def test_limit_stays_within_bounds(self):
+        """The limit never leaves [min_limit, max_limit]."""
+        controller = make_controller(min_limit=2, max_limit=5, initial=5)
+        for _ in range(4):
+            controller.acquire()
+            controller.release(0.01, overloaded=False)
+        assert controller.limit == 5.0
+
+        for _ in range(4):
+            controller.acquire()
+            controller.release(0.01, overloaded=True)
+        assert controller.limit == 2.0
+
+    @pytest.mark.parametrize("min_limit, max_limit", [(0, 4), (-1, 4), (5, 4)])
+    def test_invalid_bounds_rejected(self, min_limit, max_limit):
+        """Bounds that would let the limit admit nobody are refused."""
+        with pytest.raises(ValueError):
+            make_controller(min_limit=min_limit, max_limit=max_limit)
+
+    def test_acquire_blocks_at_limit(self):
+        """A caller over the limit waits until a slot is released."""
+        controller = make_controller(initial=1)
+        controller.acquire()
+        admitted = threading.Event()
+
+        def second_caller():
+            controller.acquire()
+            admitted.set()
+
+        thread = threading.Thread(target=second_caller)
+        thread.start()
+        assert not admitted.wait(0.05)
+
+        controller.release(0.01, overloaded=False)
+        assert admitted.wait(1.0)
+        thread.join()
+
+    async def test_async_acquire_waits_for_release(self):
+        """The async controller suspends tasks instead of blocking threads."""
+        controller = AsyncAdmissionController(
+            latency_target=0.1, min_limit=1, max_limit=4, initial=1
+        )
+        await controller.acquire()
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await controller.release(0.01, overloaded=False)
+        await asyncio.wait_for(waiter, 1.0)
+        assert controller.in_flight == 1
+
+
+# =============================================================================
+# CLIENT INTEGRATION TESTS
+# =============================================================================
+
+class TestClientAdmission:
+    """Tests for admission control in the clients."""
+
+    def test_disabled_by_default(self):
+        """Without latency_target, requests go straight to the pool."""
+        with AIFirewall(api_key="af_test", project_id="proj") as client:
+            assert client._admission is None
+
+    def test_invalid_min_concurrency_rejected(self):
+        with pytest.raises(ValueError):
+            AIFirewall(api_key="af_test", project_id="proj", latency_target=0.5, min_concurrency=0)
+
+    def test_max_concurrency_defaults_to_pool_size(self):
+        """The limit can grow up to the connection pool's size by default."""
+        with AIFirewall(api_key="af_test", project_id="proj", latency_target=0.5) as client:
+            assert client._admission.max_limit == client.limits.max_connections
+            assert client._admission.limit == AIFirewall.DEFAULT_INITIAL_CONCURRENCY
+
+    def test_rate_limited_response_shrinks_limit(self, valid_validation_response):
+        """A 429 counts as overload before the request is retried."""
+        with patch.object(httpx.Client, 'request') as mock_request, patch('time.sleep'):
+            mock_request.side_effect = [
+                httpx.Response(429, text="Too Many Requests"),
+                httpx.Response(200, json=valid_validation_response),
+            ]
+
+            with AIFirewall(
+                api_key="af_test", project_id="proj", latency_target=0.5, max_concurrency=16
+            ) as client:
+                result = client.execute("agent", "action", {})
+
+                assert result.allowed is True
+                assert client._admission.limit == AIFirewall.DEFAULT_INITIAL_CONCURRENCY / 2
+                assert client._admission.in_flight == 0
+
+    def test_concurrent_requests_capped_by_limit(self, valid_validation_response):
+        """No more requests are in flight than the limit allows."""
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def respond(method, path, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return httpx.Response(200, json=valid_validation_response)
+
+        with patch.object(httpx.Client, 'request', side_effect=respond):
+            with AIFirewall(
+                api_key="af_test",
+                project_id="proj",
+                latency_target=10.0,
+                min_concurrency=2,
+                max_concurrency=2,
+            ) as client:
+                threads = [
+                    threading.Thread(target=client.execute, args=("agent", "action", {}))
+                    for _ in range(8)
+                ]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+
+        assert peak <= 2
+
+    async def test_async_client_releases_slots(self, valid_validation_response):
+        """The async client returns every slot it takes."""
+        with patch.object(httpx.AsyncClient, 'request') as mock_request:
+            mock_request.return_value = httpx.Response(200, json=valid_validation_response)
+
+            async with AsyncAIFirewall(
+                api_key="af_test", project_id="proj", latency_target=0.5
+            ) as fw:
+                await asyncio.gather(*(fw.execute("agent", "action", {}) for _ in range(20)))
+
+                assert fw._admission.in_flight == 0
@@ -0,0 +1,275 @@
+"""
+SDK Async Client Tests for AI Agent Firewall Python SDK.
+
+Tests:
+- Response parsing and strict mode
+- Retry with asyncio.sleep backoff
+- Error mapping shared with the sync client
+- Concurrent execute() calls
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+import httpx
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "sdk" / "python"))
+
+from ai_firewall import AIFirewall, AsyncAIFirewall
+from ai_firewall.exceptions import (
+    ActionBlockedError,
+    AuthenticationError,
+    NetworkError,
+    PolicyNotFoundError,
+)
+
+
+# =============================================================================
+# TEST FIXTURES
+# =============================================================================
+
+@pytest.fixture
+def mock_response():
+    """Create an httpx.Response with a JSON body, or a plain-text one if text is given."""
+    def _create(status_code: int, json_data: dict = None, text: str = "", headers: dict = None):
+        if text:
+            return httpx.Response(status_code, text=text, headers=headers)
+        return httpx.Response(status_code, json=json_data or {}, headers=headers)
+    return _create
+
+
+@pytest.fixture
+def valid_validation_response():
+    """Valid response for /validate_action endpoint."""
+    return {
+        "allowed": True,
+        "action_id": "act_123456",
+        "timestamp": "2025-01-01T12:00:00Z",
+        "reason": None,
+        "execution_time_ms": 5,
+        "simulated": False,
+    }
+
+
+@pytest.fixture
+def blocked_validation_response():
+    """Blocked action response."""
+    return {
+        "allowed": False,
+        "action_id": "act_789012",
+        "timestamp": "2025-01-01T12:00:00Z",
+        "reason": "Amount exceeds maximum limit",
+        "execution_time_ms": 3,
+    }
+
+
+@pytest.fixture
+def mock_request():
+    """Patch httpx.AsyncClient.request with an AsyncMock."""
+    with patch.object(httpx.AsyncClient, 'request', new_callable=AsyncMock) as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_sleep():
+    """Patch asyncio.sleep so retries don't wait."""
+    with patch('ai_firewall.async_client.asyncio.sleep', new_callable=AsyncMock) as mock:
+        yield mock
+
+
+# =============================================================================
+# INITIALIZATION TESTS
+# =============================================================================
+
+class TestAsyncInitialization:
+    """Tests for AsyncAIFirewall construction."""
+
+    async def test_uses_async_client_with_shared_config(self):
+        """The async client gets the same headers, limits and timeouts as the sync one."""
+        async with AsyncAIFirewall(api_key="af_test", project_id="proj", timeout=60.0) as fw:
+            assert isinstance(fw._client, httpx.AsyncClient)
+            assert fw._client.headers["X-API-Key"] == "af_test"
+            assert fw._client.timeout.read == 60.0
+            assert fw._client.timeout.connect == AIFirewall.DEFAULT_CONNECT_TIMEOUT
+
+    async def test_retry_config_matches_sync_client(self):
+        """Backoff tables are built the same way for both clients."""
+        kwargs = dict(api_key="af_test", project_id="proj", max_retries=4, retry_base_delay=0.5)
+        sync_fw = AIFirewall(**kwargs)
+        async with AsyncAIFirewall(**kwargs) as async_fw:
+            assert async_fw._backoff_table == sync_fw._backoff_table
+            assert async_fw.retry_on_status == sync_fw.retry_on_status
+        sync_fw.close()
+
+
+# =============================================================================
+# RESPONSE HANDLING TESTS
+# =============================================================================
+
+class TestAsyncResponseHandling:
+    """Tests for async response parsing."""
+
+    async def test_execute_returns_validation_result(
+        self, mock_request, mock_response, valid_validation_response
+    ):
+        """execute() posts the action and parses the result."""
+        mock_request.return_value = mock_response(200, valid_validation_response)
+
+        async with AsyncAIFirewall(api_key="af_test", project_id="proj") as fw:
+            result = await fw.execute("agent", "action", {"key": "value"})
+
+        assert result.allowed is True
+        assert result.action_id == "act_123456"
+        assert mock_request.call_args[0] == ("POST", "/validate_action")
+
+    async def test_strict_mode_raises_when_blocked(
+        self, mock_request, mock_response, blocked_validation_response
+    ):
+        """Strict mode raises ActionBlockedError for blocked actions."""
+        mock_request.return_value = mock_response(200, blocked_validation_response)
+
+        async with AsyncAIFirewall(api_key="af_test", project_id="proj", strict=True) as fw:
+            with pytest.raises(ActionBlockedError):
+                await fw.execute("agent", "action", {})
+
+    async def test_execute_many_posts_one_batch(
+        self, mock_request, mock_response, valid_validation_response
+    ):
+        """execute_many() sends a single batch request."""
+        mock_request.return_value = mock_response(
+            200, {"results": [valid_validation_response] * 3}
+        )
+
+        async with AsyncAIFirewall(api_key="af_test", project_id="proj") as fw:
+            results = await fw.execute_many([("agent", "pay", {})] * 3)
+
+        assert len(results) == 3
+        mock_request.assert_awaited_once()
+        assert mock_request.call_args[0] == ("POST", "/validate_action/batch")
+
+    @pytest.mark.parametrize("status_code, json_data, method, exc_class", [
+        (401, {}, "execute", AuthenticationError),
+        (404, {"detail": "No active policy found"}, "get_policy", PolicyNotFoundError),
+    ])
+    async def test_error_status_raises_matching_exception(
+        self, mock_request, mock_response, status_code, json_data, method, exc_class
+    ):
+        """Error statuses map to the same exceptions as the sync client."""
+        mock_request.return_value = mock_response(status_code, json_data)
+
+        async with AsyncAIFirewall(api_key="af_test", project_id="proj") as fw:
+            with pytest.raises(exc_class):
+                if method == "execute":
+                    await fw.execute("agent", "action", {})
+                else:
+                    await fw.get_policy()
+
+    async def test_iter_logs_walks_all_pages(self, mock_request, mock_response):
+        """iter_logs() yields entries from every page until has_more is false."""
+        entry = {
+            "action_id": "act_001",
+            "project_id": "proj",
+            "agent_name": "agent",
+            "action_type": "pay",
+            "params": {},
+            "allowed": True,
+            "reason": None,
+            "policy_version": "1.0",
+            "execution_time_ms": 5,
+            "timestamp": "2025-01-01T11:00:00Z",
+        }
+        mock_request.side_effect = [
+            mock_response(200, {"items": [entry] * 2, "total": 3, "page": 1,
+                                "page_size": 2, "has_more": True}),
+            mock_response(200, {"items": [entry], "total": 3, "page": 2,
+                                "page_size": 2, "has_more": False}),
+        ]
+
+        async with AsyncAIFirewall(api_key="af_test", project_id="proj") as fw:
+            entries = [e async for e in fw.iter_logs(page_size=2)]
+
+        assert len(entries) == 3
+        assert mock_request.await_count == 2
+
+    async def test_concurrent_executes(
+        self, mock_request, mock_response, valid_validation_response
+    ):
+        """Many execute() calls can run concurrently on one client."""
+        async def respond(method, path, **kwargs):
+            await asyncio.sleep(0)
+            return mock_response(200, valid_validation_response)
+
+        mock_request.side_effect = respond
+
+        async with AsyncAIFirewall(api_key="af_test", project_id="proj") as fw:
+            results = await asyncio.gather(*(
+                fw.execute("agent", "action", {"n": n}) for n in range(50)
+            ))
+
+        assert len(results) == 50
+        assert mock_request.await_count == 50
+
+
+# =============================================================================
+# RETRY TESTS
+# =============================================================================
+
+class TestAsyncRetry:
+    """Tests for async retry behavior."""
+
+    async def test_retry_on_503_uses_asyncio_sleep(
+        self, mock_request, mock_sleep, mock_response, valid_validation_response
+    ):
+        """Retryable statuses back off with asyncio.sleep, not time.sleep."""
+        mock_request.side_effect = [
+            mock_response(503, {}, "Unavailable"),
+            mock_response(200, valid_validation_response),
+        ]
+
+        with patch('time.sleep') as mock_time_sleep:
+            async with AsyncAIFirewall(api_key="af_test", project_id="proj") as fw:
+                result = await fw.execute("agent", "action", {})
+
+        assert result.allowed is True
+        assert mock_request.await_count == 2
+        mock_sleep.assert_awaited_once()
+        mock_time_sleep.assert_not_called()
+
+    async def test_retry_respects_retry_after(
+        self, mock_request, mock_sleep, mock_response, valid_validation_response
+    ):
+        """Retry-After is honored as in the sync client."""
+        mock_request.side_effect = [
+            mock_response(429, {}, "Too Many Requests", headers={"Retry-After": "7"}),
+            mock_response(200, valid_validation_response),
+        ]
+
+        async with AsyncAIFirewall(api_key="af_test", project_id="proj") as fw:
+            await fw.execute("agent", "action", {})
+
+        mock_sleep.assert_awaited_once_with(7.0)
+
+    async def test_network_errors_retried_then_raised(self, mock_request, mock_sleep):
+        """Network errors are retried max_retries times, then raised as NetworkError."""
+        mock_request.side_effect = httpx.ConnectError("Connection refused")
+
+        async with AsyncAIFirewall(api_key="af_test", project_id="proj", max_retries=2) as fw:
+            with pytest.raises(NetworkError):
+                await fw.execute("agent", "action", {})
+
+        assert mock_request.await_count == 3
+        assert mock_sleep.await_count == 2
+
+    async def test_no_retry_on_client_error(self, mock_request, mock_sleep, mock_response):
+        """4xx errors other than 429 are not retried."""
+        mock_request.return_value = mock_response(403, {}, "Forbidden")
+
+        async with AsyncAIFirewall(api_key="af_test", project_id="proj") as fw:
+            with pytest.raises(AuthenticationError):
+                await fw.execute("agent", "action", {})
+
+        assert mock_request.await_count == 1
+        mock_sleep.assert_not_awaited()
@@ -10,6 +10,9 @@ Tests:
 - Retry behavior (documenting current behavior)
 """
 
+import json
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
@@ -20,6 +23,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "sdk" / "python"))
 
 from ai_firewall import AIFirewall
+from ai_firewall import client as client_module
 from ai_firewall.exceptions import (
     AIFirewallError,
     AuthenticationError,
@@ -37,15 +41,37 @@ from ai_firewall.models import ValidationResult, Policy, LogsPage, AuditLogEntry
 # TEST FIXTURES
 # =============================================================================
 
+@pytest.fixture(scope="module")
+def shared_firewall():
+    """One AIFirewall client reused by tests that only mock the transport."""
+    client = AIFirewall(api_key="af_test", project_id="proj")
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def request_error(monkeypatch):
+    """Make every httpx.Client.request call raise the given exception."""
+    def _set(exc: Exception):
+        monkeypatch.setattr(httpx.Client, "request", Mock(side_effect=exc))
+    return _set
+
+
+def sent_json(call_args) -> dict:
+    """Decode the JSON body a mocked httpx.Client.request was called with."""
+    kwargs = call_args[1]
+    if "content" in kwargs:
+        return json.loads(kwargs["content"])
+    return kwargs["json"]
+
+
 @pytest.fixture
 def mock_response():
-    """Create a mock httpx.Response."""
-    def _create(status_code: int, json_data: dict = None, text: str = ""):
-        response = Mock(spec=httpx.Response)
-        response.status_code = status_code
-        response.json.return_value = json_data or {}
-        response.text = text
-        return response
+    """Create an httpx.Response with a JSON body, or a plain-text one if text is given."""
+    def _create(status_code: int, json_data: dict = None, text: str = "", headers: dict = None):
+        if text:
+            return httpx.Response(status_code, text=text, headers=headers)
+        return httpx.Response(status_code, json=json_data or {}, headers=headers)
     return _create
 
 
@@ -189,6 +215,7 @@ class TestSDKInitialization:
         # Check the internal httpx client headers
         assert client._client.headers["X-API-Key"] == "af_test123"
         assert client._client.headers["Content-Type"] == "application/json"
+        assert client._client.headers["User-Agent"] == "ai-firewall-python/0.1.0"
         client.close()
 
     def test_context_manager_closes_client(self):
@@ -207,6 +234,57 @@ class TestSDKInitialization:
         """Default base URL should be localhost:8000."""
         assert AIFirewall.DEFAULT_BASE_URL == "http://localhost:8000"
 
+    def test_limits_forwarded(self):
+        """Custom connection pool limits are passed to httpx client."""
+        limits = httpx.Limits(max_connections=8, max_keepalive_connections=4)
+
+        with patch('ai_firewall.client.httpx.Client') as mock_client_class:
+            AIFirewall(api_key="af_test", project_id="proj", limits=limits)
+
+            call_kwargs = mock_client_class.call_args[1]
+            assert call_kwargs['limits'] is limits
+
+    def test_default_limits_used_when_not_specified(self):
+        """Default pool limits are used when not specified."""
+        with patch('ai_firewall.client.httpx.Client') as mock_client_class:
+            AIFirewall(api_key="af_test", project_id="proj")
+
+            call_kwargs = mock_client_class.call_args[1]
+            assert call_kwargs['limits'] == AIFirewall.DEFAULT_LIMITS
+            assert call_kwargs['limits'].max_connections == 256
+            assert call_kwargs['limits'].max_keepalive_connections == 64
+            assert call_kwargs['limits'].keepalive_expiry == 15.0
+            assert call_kwargs['http2'] is client_module.H2_AVAILABLE
+
+    def test_http2_forwarded(self):
+        """http2 flag is passed to httpx client."""
+        with patch('ai_firewall.client.httpx.Client') as mock_client_class:
+            client = AIFirewall(api_key="af_test", project_id="proj", http2=True)
+
+            assert client.http2 is True
+            assert mock_client_class.call_args[1]['http2'] is True
+
+    @pytest.mark.parametrize("h2_available", [True, False])
+    def test_http2_defaults_to_h2_availability(self, monkeypatch, h2_available):
+        """HTTP/2 is enabled by default only when h2 is installed."""
+        monkeypatch.setattr(client_module, "H2_AVAILABLE", h2_available)
+
+        with patch('ai_firewall.client.httpx.Client') as mock_client_class:
+            AIFirewall(api_key="af_test", project_id="proj")
+            assert mock_client_class.call_args[1]['http2'] is h2_available
+
+            AIFirewall(api_key="af_test", project_id="proj", http2=False)
+            assert mock_client_class.call_args[1]['http2'] is False
+
+    def test_subclass_must_build_its_client(self):
+        """A client class missing a transport hook fails at construction."""
+        class Incomplete(client_module._FirewallBase):
+            def _create_admission(self, *args, **kwargs):
+                return None
+
+        with pytest.raises(TypeError, match="_create_client"):
+            Incomplete(api_key="af_test", project_id="proj")
+
 
 # =============================================================================
 # NETWORK ERROR HANDLING TESTS
@@ -215,67 +293,44 @@ class TestSDKInitialization:
 class TestNetworkErrorHandling:
     """Tests for network error handling."""
 
-    def test_connection_refused_raises_network_error(self):
+    def test_connection_refused_raises_network_error(self, shared_firewall, request_error):
         """Connection refused raises NetworkError."""
-        with patch.object(httpx.Client, 'request') as mock_request:
-            mock_request.side_effect = httpx.ConnectError("Connection refused")
-
-            client = AIFirewall(api_key="af_test", project_id="proj")
+        request_error(httpx.ConnectError("Connection refused"))
 
-            with pytest.raises(NetworkError) as exc_info:
-                client.execute("agent", "action", {})
+        with pytest.raises(NetworkError) as exc_info:
+            shared_firewall.execute("agent", "action", {})
 
-            assert "Network error" in str(exc_info.value)
-            client.close()
+        assert "Network error" in str(exc_info.value)
 
-    def test_dns_resolution_error_raises_network_error(self):
+    def test_dns_resolution_error_raises_network_error(self, shared_firewall, request_error):
         """DNS resolution failure raises NetworkError."""
-        with patch.object(httpx.Client, 'request') as mock_request:
-            mock_request.side_effect = httpx.ConnectError("Name or service not known")
-
-            client = AIFirewall(api_key="af_test", project_id="proj")
+        request_error(httpx.ConnectError("Name or service not known"))
 
-            with pytest.raises(NetworkError):
-                client.execute("agent", "action", {})
+        with pytest.raises(NetworkError):
+            shared_firewall.execute("agent", "action", {})
 
-            client.close()
-
-    def test_connection_timeout_raises_network_error(self):
+    def test_connection_timeout_raises_network_error(self, shared_firewall, request_error):
         """Connection timeout raises NetworkError."""
-        with patch.object(httpx.Client, 'request') as mock_request:
-            mock_request.side_effect = httpx.ConnectTimeout("Connection timed out")
-
-            client = AIFirewall(api_key="af_test", project_id="proj")
+        request_error(httpx.ConnectTimeout("Connection timed out"))
 
-            with pytest.raises(NetworkError):
-                client.execute("agent", "action", {})
-
-            client.close()
+        with pytest.raises(NetworkError):
+            shared_firewall.execute("agent", "action", {})
 
-    def test_read_timeout_raises_network_error(self):
+    def test_read_timeout_raises_network_error(self, shared_firewall, request_error):
         """Read timeout raises NetworkError."""
-        with patch.object(httpx.Client, 'request') as mock_request:
-            mock_request.side_effect = httpx.ReadTimeout("Read timed out")
-
-            client = AIFirewall(api_key="af_test", project_id="proj")
-
-            with pytest.raises(NetworkError):
-                client.execute("agent", "action", {})
+        request_error(httpx.ReadTimeout("Read timed out"))
 
-            client.close()
+        with pytest.raises(NetworkError):
+            shared_firewall.execute("agent", "action", {})
 
-    def test_network_error_contains_original_message(self):
+    def test_network_error_contains_original_message(self, shared_firewall, request_error):
         """NetworkError preserves original error message."""
-        with patch.object(httpx.Client, 'request') as mock_request:
-            mock_request.side_effect = httpx.ConnectError("Custom error message")
+        request_error(httpx.ConnectError("Custom error message"))
 
-            client = AIFirewall(api_key="af_test", project_id="proj")
+        with pytest.raises(NetworkError) as exc_info:
+            shared_firewall.execute("agent", "action", {})
 
-            with pytest.raises(NetworkError) as exc_info:
-                client.execute("agent", "action", {})
-
-            assert "Custom error message" in str(exc_info.value)
-            client.close()
+        assert "Custom error message" in str(exc_info.value)
 
     def test_network_error_inherits_from_base_exception(self):
         """NetworkError inherits from AIFirewallError."""
@@ -306,7 +361,8 @@ class TestTimeoutHandling:
 
             # Verify httpx.Client was called with the timeout
             call_kwargs = mock_client_class.call_args[1]
-            assert call_kwargs['timeout'] == 45.0
+            assert call_kwargs['timeout'].read == 45.0
+            assert call_kwargs['timeout'].write == 45.0
 
     def test_default_timeout_passed_when_not_specified(self):
         """Default timeout (30s) is used when not specified."""
@@ -320,31 +376,32 @@ class TestTimeoutHandling:
             )
 
             call_kwargs = mock_client_class.call_args[1]
-            assert call_kwargs['timeout'] == 30.0
+            assert call_kwargs['timeout'].read == 30.0
 
-    def test_timeout_exception_wrapped_as_network_error(self):
-        """Timeout exceptions are wrapped as NetworkError."""
-        with patch.object(httpx.Client, 'request') as mock_request:
-            mock_request.side_effect = httpx.TimeoutException("Request timed out")
+    def test_connect_and_pool_timeouts_capped(self):
+        """Connect and pool waits fail fast even with a long read timeout."""
+        with patch('ai_firewall.client.httpx.Client') as mock_client_class:
+            AIFirewall(api_key="af_test", project_id="proj", timeout=60.0)
+            timeout = mock_client_class.call_args[1]['timeout']
+            assert (timeout.connect, timeout.pool) == (5.0, 5.0)
 
-            client = AIFirewall(api_key="af_test", project_id="proj")
+            AIFirewall(api_key="af_test", project_id="proj", timeout=2.0)
+            timeout = mock_client_class.call_args[1]['timeout']
+            assert (timeout.connect, timeout.pool) == (2.0, 2.0)
 
-            with pytest.raises(NetworkError):
-                client.execute("agent", "action", {})
+    def test_timeout_exception_wrapped_as_network_error(self, shared_firewall, request_error):
+        """Timeout exceptions are wrapped as NetworkError."""
+        request_error(httpx.TimeoutException("Request timed out"))
 
-            client.close()
+        with pytest.raises(NetworkError):
+            shared_firewall.execute("agent", "action", {})
 
-    def test_write_timeout_raises_network_error(self):
+    def test_write_timeout_raises_network_error(self, shared_firewall, request_error):
         """Write timeout raises NetworkError."""
-        with patch.object(httpx.Client, 'request') as mock_request:
-            mock_request.side_effect = httpx.WriteTimeout("Write timed out")
+        request_error(httpx.WriteTimeout("Write timed out"))
 
-            client = AIFirewall(api_key="af_test", project_id="proj")
-
-            with pytest.raises(NetworkError):
-                client.execute("agent", "action", {})
-
-            client.close()
+        with pytest.raises(NetworkError):
+            shared_firewall.execute("agent", "action", {})
 
 
 # =============================================================================
@@ -354,93 +411,49 @@ class TestTimeoutHandling:
 class TestExceptionTypes:
     """Tests for exception type handling based on HTTP status codes."""
 
-    def test_401_raises_authentication_error(self, mock_response):
-        """401 response raises AuthenticationError."""
-        with patch.object(httpx.Client, 'request') as mock_request:
-            mock_request.return_value = mock_response(401, {"detail": "Invalid key"})
-
-            client = AIFirewall(api_key="af_invalid", project_id="proj")
-
-            with pytest.raises(AuthenticationError) as exc_info:
-                client.execute("agent", "action", {})
-
-            assert "invalid" in str(exc_info.value).lower()
-            client.close()
-
-    def test_403_raises_authentication_error(self, mock_response):
-        """403 response raises AuthenticationError."""
-        with patch.object(httpx.Client, 'request') as mock_request:
-            mock_request.return_value = mock_response(403, {"detail": "Access denied"})
-
-            client = AIFirewall(api_key="af_wrong", project_id="proj")
-
-            with pytest.raises(AuthenticationError) as exc_info:
-                client.execute("agent", "action", {})
-
-            assert "access" in str(exc_info.value).lower()
-            client.close()
-
-    def test_404_with_policy_raises_policy_not_found_error(self, mock_response):
-        """404 with 'policy' in message raises PolicyNotFoundError."""
-        with patch.object(httpx.Client, 'request') as mock_request:
-            mock_request.return_value = mock_response(404, {"detail": "No active policy found"})
-
-            client = AIFirewall(api_key="af_test", project_id="proj")
-
-            with pytest.raises(PolicyNotFoundError):
-                client.get_policy()
-
-            client.close()
-
-    def test_404_with_project_raises_project_not_found_error(self, mock_response):
-        """404 with 'project' in message raises ProjectNotFoundError."""
-        with patch.object(httpx.Client, 'request') as mock_request:
-            mock_request.return_value = mock_response(404, {"detail": "Project not found"})
-
-            client = AIFirewall(api_key="af_test", project_id="nonexistent")
-
-            with pytest.raises(ProjectNotFoundError):
-                client.get_policy()
-
-            client.close()
-
-    def test_404_generic_raises_ai_firewall_error(self, mock_response):
-        """404 without specific keyword raises generic AIFirewallError."""
-        with patch.object(httpx.Client, 'request') as mock_request:
-            mock_request.return_value = mock_response(404, {"detail": "Resource not found"})
-
-            client = AIFirewall(api_key="af_test", project_id="proj")
-
-            with pytest.raises(AIFirewallError):
-                client.get_policy()
-
-            client.close()
-
-    def test_422_raises_validation_error(self, mock_response):
-        """422 response raises ValidationError."""
-        with patch.object(httpx.Client, 'request') as mock_request:
-            mock_request.return_value = mock_response(422, {"detail": "Missing field"})
-
-            client = AIFirewall(api_key="af_test", project_id="proj")
-
-            with pytest.raises(ValidationError) as exc_info:
-                client.execute("agent", "action", {})
-
-            assert "Invalid request" in str(exc_info.value)
-            client.close()
-
-    def test_500_raises_ai_firewall_error(self, mock_response):
-        """500 response raises generic AIFirewallError."""
-        with patch.object(httpx.Client, 'request') as mock_request:
-            mock_request.return_value = mock_response(500, {}, "Internal Server Error")
+    @pytest.mark.parametrize(
+        "status,payload,text,call,expected_exc,message",
+        [
+            (401, {"detail": "Invalid key"}, "", "execute", AuthenticationError, "invalid"),
+            (403, {"detail": "Access denied"}, "", "execute", AuthenticationError, "access"),
+            (404, {"detail": "No active policy found"}, "", "get_policy", PolicyNotFoundError, None),
+            (404, {"detail": "Project not found"}, "", "get_policy", ProjectNotFoundError, None),
+            (404, {"detail": "Resource not found"}, "", "get_policy", AIFirewallError, None),
+            (422, {"detail": "Missing field"}, "", "execute", ValidationError, "invalid request"),
+            (500, {}, "Internal Server Error", "execute", AIFirewallError, "500"),
+        ],
+        ids=[
+            "401-authentication",
+            "403-authentication",
+            "404-policy-not-found",
+            "404-project-not-found",
+            "404-generic",
+            "422-validation",
+            "500-generic",
+        ],
+    )
+    def test_error_status_raises_matching_exception(
+        self, shared_firewall, monkeypatch, mock_response,
+        status, payload, text, call, expected_exc, message,
+    ):
+        """Each error status maps to its SDK exception type."""
+        monkeypatch.setattr(
+            httpx.Client, "request", Mock(return_value=mock_response(status, payload, text))
+        )
 
-            client = AIFirewall(api_key="af_test", project_id="proj")
+        with pytest.raises(expected_exc) as exc_info:
+            if call == "execute":
+                shared_firewall.execute("agent", "action", {})
+            else:
+                shared_firewall.get_policy()
 
-            with pytest.raises(AIFirewallError) as exc_info:
-                client.execute("agent", "action", {})
+        if message is not None:
+            assert message in str(exc_info.value).lower()
 
-            assert "500" in str(exc_info.value)
-            client.close()
+    def test_429_raises_rate_limit_error(self, shared_firewall, mock_response):
+        """429 response maps to RateLimitError once retries are exhausted."""
+        with pytest.raises(RateLimitError, match="Rate limit exceeded"):
+            shared_firewall._handle_response_error(mock_response(429))
 
     def test_action_blocked_error_in_strict_mode(
         self, mock_response, blocked_validation_response
@@ -505,20 +518,18 @@ class TestResponseHandling:
     """Tests for response parsing and model creation."""
 
     def test_execute_returns_validation_result(
-        self, mock_response, valid_validation_response
+        self, shared_firewall, mock_response, valid_validation_response
     ):
         """execute() returns ValidationResult model."""
         with patch.object(httpx.Client, 'request') as mock_request:
             mock_request.return_value = mock_response(200, valid_validation_response)
 
-            client = AIFirewall(api_key="af_test", project_id="proj")
-            result = client.execute("agent", "action", {"key": "value"})
+            result = shared_firewall.execute("agent", "action", {"key": "value"})
 
             assert isinstance(result, ValidationResult)
             assert result.allowed is True
             assert result.action_id == "act_123456"
             assert isinstance(result.timestamp, datetime)
-            client.close()
 
     def test_execute_sends_correct_payload(self, mock_response, valid_validation_response):
         """execute() sends correct JSON payload."""
@@ -532,7 +543,7 @@ class TestResponseHandling:
             mock_request.assert_called_once()
             call_args = mock_request.call_args
             assert call_args[0] == ("POST", "/validate_action")
-            assert call_args[1]["json"] == {
+            assert sent_json(call_args) == {
                 "project_id": "test-project",
                 "agent_name": "my-agent",
                 "action_type": "my-action",
@@ -540,17 +551,73 @@ class TestResponseHandling:
             }
             client.close()
 
-    def test_execute_with_empty_params(self, mock_response, valid_validation_response):
+    def test_execute_with_empty_params(
+        self, shared_firewall, mock_response, valid_validation_response
+    ):
         """execute() handles None params by sending empty dict."""
         with patch.object(httpx.Client, 'request') as mock_request:
             mock_request.return_value = mock_response(200, valid_validation_response)
 
-            client = AIFirewall(api_key="af_test", project_id="proj")
-            client.execute("agent", "action", None)
+            shared_firewall.execute("agent", "action", None)
 
             call_args = mock_request.call_args
-            assert call_args[1]["json"]["params"] == {}
-            client.close()
+            assert sent_json(call_args)["params"] == {}
+
+    def test_execute_many_sends_one_batch_request(
+        self, shared_firewall, mock_response, valid_validation_response,
+        blocked_validation_response
+    ):
+        """execute_many() validates all actions in one request, in order."""
+        batch_response = {"results": [valid_validation_response, blocked_validation_response]}
+        with patch.object(httpx.Client, 'request') as mock_request:
+            mock_request.return_value = mock_response(200, batch_response)
+
+            results = shared_firewall.execute_many([
+                ("agent", "pay", {"amount": 10}),
+                ("agent", "refund", None),
+            ])
+
+            assert [result.allowed for result in results] == [True, False]
+            mock_request.assert_called_once()
+            assert mock_request.call_args[0] == ("POST", "/validate_action/batch")
+            actions = sent_json(mock_request.call_args)["actions"]
+            assert [action["action_type"] for action in actions] == ["pay", "refund"]
+            assert actions[1]["params"] == {}
+            assert all(action["project_id"] == "proj" for action in actions)
+
+    def test_execute_many_splits_large_batches(
+        self, shared_firewall, mock_response, valid_validation_response
+    ):
+        """Lists over BATCH_MAX_ACTIONS are sent as several requests."""
+        def respond(method, path, **kwargs):
+            count = len(sent_json((None, kwargs))["actions"])
+            return mock_response(200, {"results": [valid_validation_response] * count})
+
+        with patch.object(httpx.Client, 'request', side_effect=respond) as mock_request:
+            results = shared_firewall.execute_many([("agent", "pay", {})] * 250)
+
+            assert len(results) == 250
+            assert mock_request.call_count == 3
+
+    def test_execute_many_empty_makes_no_request(self, shared_firewall):
+        """An empty action list returns without calling the API."""
+        with patch.object(httpx.Client, 'request') as mock_request:
+            assert shared_firewall.execute_many([]) == []
+            mock_request.assert_not_called()
+
+    def test_execute_many_strict_raises_for_blocked_action(
+        self, mock_response, valid_validation_response, blocked_validation_response
+    ):
+        """In strict mode, a blocked action in the batch raises ActionBlockedError."""
+        batch_response = {"results": [valid_validation_response, blocked_validation_response]}
+        with patch.object(httpx.Client, 'request') as mock_request:
+            mock_request.return_value = mock_response(200, batch_response)
+
+            with AIFirewall(api_key="af_test", project_id="proj", strict=True) as client:
+                with pytest.raises(ActionBlockedError) as exc_info:
+                    client.execute_many([("agent", "pay", {}), ("agent", "pay", {})])
+
+            assert exc_info.value.action_id == "act_789012"
 
     def test_get_policy_returns_policy_model(
         self, mock_response, valid_policy_response
@@ -586,13 +653,36 @@ class TestResponseHandling:
             assert isinstance(logs.items[0], AuditLogEntry)
             client.close()
 
-    def test_get_logs_with_filters(self, mock_response, valid_logs_response):
+    def test_iter_logs_fetches_pages_lazily(
+        self, shared_firewall, mock_response, valid_logs_response
+    ):
+        """iter_logs() requests the next page only after the current one is consumed."""
+        entry = valid_logs_response["items"][0]
+        pages = [
+            {**valid_logs_response, "items": [entry, entry], "page": 1, "has_more": True},
+            {**valid_logs_response, "items": [entry], "page": 2, "has_more": False},
+        ]
+        with patch.object(httpx.Client, 'request') as mock_request:
+            mock_request.side_effect = [mock_response(200, page) for page in pages]
+
+            logs = shared_firewall.iter_logs(page_size=2, allowed=False)
+            assert mock_request.call_count == 0
+
+            first = next(logs)
+            assert isinstance(first, AuditLogEntry)
+            assert mock_request.call_count == 1
+
+            assert len(list(logs)) == 2
+            assert mock_request.call_count == 2
+            params = mock_request.call_args[1]["params"]
+            assert params == {"page": 2, "page_size": 2, "allowed": "false"}
+
+    def test_get_logs_with_filters(self, shared_firewall, mock_response, valid_logs_response):
         """get_logs() sends filter parameters correctly."""
         with patch.object(httpx.Client, 'request') as mock_request:
             mock_request.return_value = mock_response(200, valid_logs_response)
 
-            client = AIFirewall(api_key="af_test", project_id="proj")
-            client.get_logs(
+            shared_firewall.get_logs(
                 page=2,
                 page_size=25,
                 agent_name="specific-agent",
@@ -605,9 +695,18 @@ class TestResponseHandling:
             assert params["page_size"] == 25
             assert params["agent_name"] == "specific-agent"
             assert params["allowed"] == "true"
-            client.close()
 
-    def test_get_stats_returns_dict(self, mock_response):
+    def test_get_logs_omits_unset_filters(self, shared_firewall, mock_response, valid_logs_response):
+        """Filters left as None or empty are not sent."""
+        with patch.object(httpx.Client, 'request') as mock_request:
+            mock_request.return_value = mock_response(200, valid_logs_response)
+
+            shared_firewall.get_logs(agent_name="", action_type=None)
+
+            params = mock_request.call_args[1]["params"]
+            assert params == {"page": 1, "page_size": 50}
+
+    def test_get_stats_returns_dict(self, shared_firewall, mock_response):
         """get_stats() returns dictionary."""
         stats_response = {
             "total_actions": 100,
@@ -618,21 +717,20 @@ class TestResponseHandling:
         with patch.object(httpx.Client, 'request') as mock_request:
             mock_request.return_value = mock_response(200, stats_response)
 
-            client = AIFirewall(api_key="af_test", project_id="proj")
-            stats = client.get_stats()
+            stats = shared_firewall.get_stats()
 
             assert isinstance(stats, dict)
             assert stats["total_actions"] == 100
             assert stats["block_rate"] == 0.2
-            client.close()
 
-    def test_update_policy_returns_policy(self, mock_response, valid_policy_response):
+    def test_update_policy_returns_policy(
+        self, shared_firewall, mock_response, valid_policy_response
+    ):
         """update_policy() returns updated Policy model."""
         with patch.object(httpx.Client, 'request') as mock_request:
             mock_request.return_value = mock_response(200, valid_policy_response)
 
-            client = AIFirewall(api_key="af_test", project_id="proj")
-            policy = client.update_policy(
+            policy = shared_firewall.update_policy(
                 rules=[{"action_type": "*", "rate_limit": {"max": 100}}],
                 name="new-policy",
                 version="2.0"
@@ -640,9 +738,195 @@ class TestResponseHandling:
 
             assert isinstance(policy, Policy)
             call_args = mock_request.call_args
-            assert call_args[1]["json"]["name"] == "new-policy"
-            assert call_args[1]["json"]["version"] == "2.0"
-            client.close()
+            assert sent_json(call_args)["name"] == "new-policy"
+            assert sent_json(call_args)["version"] == "2.0"
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_decode_json_matches_httpx(self, monkeypatch, orjson_available):
+        """Response bodies decode the same with and without orjson."""
+        if orjson_available:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(client_module, "ORJSON_AVAILABLE", orjson_available)
+        response = httpx.Response(200, content=b'{"allowed": true, "reason": "caf\\u00e9"}')
+
+        assert client_module._decode_json(response) == response.json()
+
+        with pytest.raises(json.JSONDecodeError):
+            client_module._decode_json(httpx.Response(502, content=b"<html>Bad Gateway</html>"))
+
+    def test_request_body_encoded_with_orjson(
+        self, shared_firewall, mock_response, valid_validation_response
+    ):
+        """With orjson installed, bodies are sent as pre-encoded content."""
+        pytest.importorskip("orjson")
+        with patch.object(httpx.Client, 'request') as mock_request:
+            mock_request.return_value = mock_response(200, valid_validation_response)
+
+            shared_firewall.execute("agent", "action", {"ids": {1: "a"}})
+
+            call_kwargs = mock_request.call_args[1]
+            assert "json" not in call_kwargs
+            assert json.loads(call_kwargs["content"])["params"] == {"ids": {"1": "a"}}
+
+    def test_request_body_with_huge_int_falls_back_to_json(
+        self, shared_firewall, mock_response, valid_validation_response
+    ):
+        """Integers orjson can't encode are sent with the stdlib encoder."""
+        with patch.object(httpx.Client, 'request') as mock_request:
+            mock_request.return_value = mock_response(200, valid_validation_response)
+
+            shared_firewall.execute("agent", "action", {"amount": 2**70})
+
+            assert sent_json(mock_request.call_args)["params"] == {"amount": 2**70}
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_action_cache_key_accepts_huge_int(self, monkeypatch, orjson_available):
+        """Cache keys are computed for integers beyond 64 bits."""
+        if orjson_available:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(client_module, "ORJSON_AVAILABLE", orjson_available)
+
+        key = client_module._action_cache_key({"params": {"amount": 2**70}})
+
+        assert key == client_module._action_cache_key({"params": {"amount": 2**70}})
+        assert key != client_module._action_cache_key({"params": {"amount": 2**70 + 1}})
+
+    def test_execute_thread_safe(self, mock_response, valid_validation_response):
+        """One client can serve execute() calls from many threads at once."""
+        with patch.object(httpx.Client, 'request') as mock_request:
+            mock_request.return_value = mock_response(200, valid_validation_response)
+
+            with AIFirewall(api_key="af_test", project_id="proj") as client:
+                with ThreadPoolExecutor(64) as pool:
+                    results = list(pool.map(
+                        lambda n: client.execute("agent", "action", {"n": n}), range(1000)
+                    ))
+
+            assert len(results) == 1000
+            assert all(result.allowed for result in results)
+            assert mock_request.call_count == 1000
+
+
+# =============================================================================
+# RESPONSE CACHE TESTS
+# =============================================================================
+
+class TestResponseCache:
+    """Tests for the opt-in get_policy()/get_stats() and execute() caches."""
+
+    def test_no_caching_by_default(self, shared_firewall, mock_response, valid_policy_response):
+        """Without cache_ttl every call hits the API."""
+        with patch.object(httpx.Client, 'request') as mock_request:
+            mock_request.return_value = mock_response(200, valid_policy_response)
+
+            shared_firewall.get_policy()
+            shared_firewall.get_policy()
+
+            assert mock_request.call_count == 2
+
+    def test_policy_cached_within_ttl(self, mock_response, valid_policy_response):
+        """Repeated get_policy() calls within cache_ttl reuse the first result."""
+        with patch.object(httpx.Client, 'request') as mock_request:
+            mock_request.return_value = mock_response(200, valid_policy_response)
+
+            with AIFirewall(api_key="af_test", project_id="proj", cache_ttl=30) as client:
+                first = client.get_policy()
+                assert client.get_policy() is first
+                assert mock_request.call_count == 1
+
+                client.get_policy(refresh=True)
+                assert mock_request.call_count == 2
+
+    def test_cache_expires_after_ttl(self, mock_response):
+        """Entries older than cache_ttl are fetched again."""
+        with patch.object(httpx.Client, 'request') as mock_request, \
+                patch('ai_firewall.client.time.monotonic') as mock_monotonic:
+            mock_request.return_value = mock_response(200, {"total_actions": 1})
+
+            with AIFirewall(api_key="af_test", project_id="proj", cache_ttl=30) as client:
+                mock_monotonic.return_value = 100.0
+                client.get_stats()
+                mock_monotonic.return_value = 129.0
+                client.get_stats()
+                assert mock_request.call_count == 1
+
+                mock_monotonic.return_value = 131.0
+                client.get_stats()
+                assert mock_request.call_count == 2
+
+    def test_update_policy_invalidates_cached_policy(self, mock_response, valid_policy_response):
+        """update_policy() drops the cached policy so the next read is fresh."""
+        with patch.object(httpx.Client, 'request') as mock_request:
+            mock_request.return_value = mock_response(200, valid_policy_response)
+
+            with AIFirewall(api_key="af_test", project_id="proj", cache_ttl=30) as client:
+                client.get_policy()
+                client.update_policy(rules=[])
+                client.get_policy()
+
+            assert mock_request.call_count == 3
+
+    def test_identical_actions_served_from_action_cache(
+        self, mock_response, valid_validation_response
+    ):
+        """With action_cache_ttl, identical execute() calls share one request."""
+        with patch.object(httpx.Client, 'request') as mock_request:
+            mock_request.return_value = mock_response(200, valid_validation_response)
+
+            with AIFirewall(api_key="af_test", project_id="proj", action_cache_ttl=1) as client:
+                first = client.execute("agent", "pay", {"amount": 5, "to": "bob"})
+                assert client.execute("agent", "pay", {"to": "bob", "amount": 5}) is first
+                assert mock_request.call_count == 1
+
+                client.execute("agent", "pay", {"amount": 6, "to": "bob"})
+                client.execute("agent", "pay", {"amount": 5, "to": "bob"}, simulate=True)
+                assert mock_request.call_count == 3
+
+    def test_blocked_actions_not_cached(self, mock_response, blocked_validation_response):
+        """Blocked results are always revalidated."""
+        with patch.object(httpx.Client, 'request') as mock_request:
+            mock_request.return_value = mock_response(200, blocked_validation_response)
+
+            with AIFirewall(api_key="af_test", project_id="proj", action_cache_ttl=1) as client:
+                client.execute("agent", "pay", {"amount": 5000})
+                client.execute("agent", "pay", {"amount": 5000})
+
+            assert mock_request.call_count == 2
+
+    def test_action_cache_evicts_least_recently_used(
+        self, mock_response, valid_validation_response
+    ):
+        """The action cache holds at most ACTION_CACHE_MAX_ENTRIES entries."""
+        with patch.object(httpx.Client, 'request') as mock_request, \
+                patch.object(AIFirewall, 'ACTION_CACHE_MAX_ENTRIES', 2):
+            mock_request.return_value = mock_response(200, valid_validation_response)
+
+            with AIFirewall(api_key="af_test", project_id="proj", action_cache_ttl=1) as client:
+                client.execute("agent", "a", {})
+                client.execute("agent", "b", {})
+                client.execute("agent", "a", {})
+                client.execute("agent", "c", {})
+                assert mock_request.call_count == 3
+
+                client.execute("agent", "a", {})
+                assert mock_request.call_count == 3
+                client.execute("agent", "b", {})
+                assert mock_request.call_count == 4
+
+    def test_action_cache_thread_safe(self, mock_response, valid_validation_response):
+        """Concurrent hits and evictions on the action cache don't raise."""
+        with patch.object(httpx.Client, 'request') as mock_request, \
+                patch.object(AIFirewall, 'ACTION_CACHE_MAX_ENTRIES', 8):
+            mock_request.return_value = mock_response(200, valid_validation_response)
+
+            with AIFirewall(api_key="af_test", project_id="proj", action_cache_ttl=1) as client:
+                with ThreadPoolExecutor(64) as pool:
+                    results = list(pool.map(
+                        lambda n: client.execute("agent", "action", {"n": n % 16}), range(1000)
+                    ))
+
+            assert len(results) == 1000
+            assert all(result.allowed for result in results)
 
 
 # =============================================================================
@@ -652,65 +936,53 @@ class TestResponseHandling:
 class TestRetryBehavior:
     """Tests documenting current retry behavior (no automatic retries)."""
 
-    def test_no_automatic_retry_on_network_error(self):
+    def test_no_automatic_retry_on_network_error(self, shared_firewall):
         """Network errors are NOT automatically retried."""
         with patch.object(httpx.Client, 'request') as mock_request:
             mock_request.side_effect = httpx.ConnectError("Connection failed")
 
-            client = AIFirewall(api_key="af_test", project_id="proj")
-
             with pytest.raises(NetworkError):
-                client.execute("agent", "action", {})
+                shared_firewall.execute("agent", "action", {})
 
             # Verify request was only called once (no retries)
             assert mock_request.call_count == 1
-            client.close()
 
-    def test_no_retry_on_server_error(self, mock_response):
+    def test_no_retry_on_server_error(self, shared_firewall, mock_response):
         """Server errors (5xx) are NOT automatically retried."""
         with patch.object(httpx.Client, 'request') as mock_request:
             mock_request.return_value = mock_response(503, {}, "Service Unavailable")
 
-            client = AIFirewall(api_key="af_test", project_id="proj")
-
             with pytest.raises(AIFirewallError):
-                client.execute("agent", "action", {})
+                shared_firewall.execute("agent", "action", {})
 
             # Verify request was only called once (no retries)
             assert mock_request.call_count == 1
-            client.close()
 
-    def test_no_retry_on_timeout(self):
+    def test_no_retry_on_timeout(self, shared_firewall):
         """Timeout errors are NOT automatically retried."""
         with patch.object(httpx.Client, 'request') as mock_request:
             mock_request.side_effect = httpx.TimeoutException("Timeout")
 
-            client = AIFirewall(api_key="af_test", project_id="proj")
-
             with pytest.raises(NetworkError):
-                client.execute("agent", "action", {})
+                shared_firewall.execute("agent", "action", {})
 
             # Verify request was only called once (no retries)
             assert mock_request.call_count == 1
-            client.close()
 
     def test_single_request_per_execute_call(
-        self, mock_response, valid_validation_response
+        self, shared_firewall, mock_response, valid_validation_response
     ):
         """Each execute() makes exactly one HTTP request."""
         with patch.object(httpx.Client, 'request') as mock_request:
             mock_request.return_value = mock_response(200, valid_validation_response)
 
-            client = AIFirewall(api_key="af_test", project_id="proj")
-
             # Make multiple execute calls
-            client.execute("agent", "action1", {})
-            client.execute("agent", "action2", {})
-            client.execute("agent", "action3", {})
+            shared_firewall.execute("agent", "action1", {})
+            shared_firewall.execute("agent", "action2", {})
+            shared_firewall.execute("agent", "action3", {})
 
             # Each call should result in exactly one request
             assert mock_request.call_count == 3
-            client.close()
 
 
 # =============================================================================
@@ -831,3 +1103,24 @@ class TestModels:
         assert isinstance(logs_page.items[0], AuditLogEntry)
         assert logs_page.items[0].agent_name == "agent1"
         assert logs_page.items[1].allowed is False
+
+    @pytest.mark.parametrize("value, expected", [
+        ("2025-01-01T12:00:00Z", datetime(2025, 1, 1, 12, 0, 0)),
+        ("2025-01-01T12:00:00.123456", datetime(2025, 1, 1, 12, 0, 0, 123456)),
+        ("2025-01-01T12:00:00.123456Z", datetime(2025, 1, 1, 12, 0, 0, 123456)),
+    ])
+    def test_timestamps_parse_as_naive_utc(self, value, expected):
+        """API timestamps, with or without a Z suffix, parse to naive datetimes."""
+        data = {
+            "allowed": True,
+            "action_id": "act_123",
+            "timestamp": value,
+        }
+
+        assert ValidationResult.from_dict(data).timestamp == expected
+
+    @pytest.mark.parametrize("model", [ValidationResult, Policy, AuditLogEntry, LogsPage])
+    def test_models_are_slotted(self, model):
+        """Model instances use __slots__ instead of a per-instance __dict__."""
+        assert "__slots__" in vars(model)
+        assert "__dict__" not in vars(model)
@@ -11,9 +11,14 @@ Tests:
 - Retry configuration options
 """
 
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock, call
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 import httpx
 
 import sys
@@ -34,18 +39,43 @@ from ai_firewall.exceptions import (
 # TEST FIXTURES
 # =============================================================================
 
+@pytest.fixture(scope="module")
+def shared_firewall():
+    """One default-config AIFirewall client reused by tests that only mock the transport."""
+    client = AIFirewall(api_key="af_test", project_id="proj")
+    yield client
+    client.close()
+
+
 @pytest.fixture
 def mock_response():
-    """Create a mock httpx.Response."""
-    def _create(status_code: int, json_data: dict = None, text: str = ""):
-        response = Mock(spec=httpx.Response)
-        response.status_code = status_code
-        response.json.return_value = json_data or {}
-        response.text = text
-        return response
+    """Create an httpx.Response with a JSON body, or a plain-text one if text is given."""
+    def _create(status_code: int, json_data: dict = None, text: str = "", headers: dict = None):
+        if text:
+            return httpx.Response(status_code, text=text, headers=headers)
+        return httpx.Response(status_code, json=json_data or {}, headers=headers)
     return _create
 
 
+@pytest.fixture
+def serve(monkeypatch):
+    """Replace httpx.Client.request with canned responses.
+
+    Responses are returned in order, and the last one repeats. Returns the
+    list of (method, path) calls made.
+    """
+    calls = []
+
+    def _serve(*responses):
+        def fake_request(self, method, url, **kwargs):
+            calls.append((method, url))
+            return responses[min(len(calls), len(responses)) - 1]
+
+        monkeypatch.setattr(httpx.Client, "request", fake_request)
+        return calls
+    return _serve
+
+
 @pytest.fixture
 def valid_validation_response():
     """Valid response for /validate_action endpoint."""
@@ -75,8 +105,8 @@ class TestExponentialBackoff:
             retry_max_delay=30.0,
         )
 
-        # Get delays for first few attempts (without jitter for testing)
-        with patch('random.random', return_value=0.5):  # 0 jitter
+        # Get the upper end of the jitter window for the first few attempts
+        with patch.object(client._rng, 'random', return_value=1.0):
             delay_0 = client._calculate_backoff(0)  # 1 * 2^0 = 1
             delay_1 = client._calculate_backoff(1)  # 1 * 2^1 = 2
             delay_2 = client._calculate_backoff(2)  # 1 * 2^2 = 4
@@ -98,33 +128,43 @@ class TestExponentialBackoff:
             retry_max_delay=5.0,
         )
 
-        with patch('random.random', return_value=0.5):  # 0 jitter
+        with patch.object(client._rng, 'random', return_value=1.0):
             delay = client._calculate_backoff(10)  # Would be 1024 without cap
 
         assert delay == pytest.approx(5.0, rel=0.01)
         client.close()
 
-    def test_backoff_includes_jitter(self):
-        """Backoff should include jitter (±25%)."""
+    def test_backoff_table_covers_every_retry(self):
+        """Precomputed delays cover each retry attempt and respect the cap."""
+        client = AIFirewall(
+            api_key="af_test",
+            project_id="proj",
+            max_retries=5,
+            retry_base_delay=0.5,
+            retry_max_delay=4.0,
+        )
+
+        assert client._backoff_table == (0.5, 1.0, 2.0, 4.0, 4.0, 4.0)
+        client.close()
+
+    def test_backoff_uses_full_jitter(self):
+        """Backoff should be uniform between 0 and the exponential delay."""
         client = AIFirewall(
             api_key="af_test",
             project_id="proj",
             retry_base_delay=4.0,
             retry_max_delay=30.0,
         )
+        client._rng.seed(1234)
 
-        # Test with different random values
-        delays = []
-        for random_val in [0.0, 0.5, 1.0]:
-            with patch('random.random', return_value=random_val):
-                delays.append(client._calculate_backoff(0))
+        delays = [client._calculate_backoff(0) for _ in range(200)]
 
-        # Base delay is 4.0, jitter is ±25% (±1.0)
-        # So delays should be in range [3.0, 5.0]
-        assert min(delays) >= 3.0
-        assert max(delays) <= 5.0
-        # Should have some variation
-        assert len(set(delays)) > 1
+        # Base delay is 4.0, so delays should be in range [0, 4.0]
+        assert min(delays) >= 0.0
+        assert max(delays) <= 4.0
+        # Should spread over the whole window
+        assert min(delays) < 1.0
+        assert max(delays) > 3.0
 
         client.close()
 
@@ -226,7 +266,7 @@ class TestRetryOnNetworkErrors:
 class TestRetryOnServerErrors:
     """Tests for retry behavior on server errors (5xx)."""
 
-    def test_retry_on_500(self, mock_response, valid_validation_response):
+    def test_retry_on_500(self, shared_firewall, mock_response, valid_validation_response):
         """Should retry on 500 Internal Server Error."""
         with patch.object(httpx.Client, 'request') as mock_request:
             mock_request.side_effect = [
@@ -235,14 +275,12 @@ class TestRetryOnServerErrors:
             ]
 
             with patch('time.sleep'):
-                client = AIFirewall(api_key="af_test", project_id="proj")
-                result = client.execute("agent", "action", {})
+                result = shared_firewall.execute("agent", "action", {})
 
             assert result.allowed is True
             assert mock_request.call_count == 2
-            client.close()
 
-    def test_retry_on_502(self, mock_response, valid_validation_response):
+    def test_retry_on_502(self, shared_firewall, mock_response, valid_validation_response):
         """Should retry on 502 Bad Gateway."""
         with patch.object(httpx.Client, 'request') as mock_request:
             mock_request.side_effect = [
@@ -251,14 +289,12 @@ class TestRetryOnServerErrors:
             ]
 
             with patch('time.sleep'):
-                client = AIFirewall(api_key="af_test", project_id="proj")
-                result = client.execute("agent", "action", {})
+                result = shared_firewall.execute("agent", "action", {})
 
             assert result.allowed is True
             assert mock_request.call_count == 2
-            client.close()
 
-    def test_retry_on_503(self, mock_response, valid_validation_response):
+    def test_retry_on_503(self, shared_firewall, mock_response, valid_validation_response):
         """Should retry on 503 Service Unavailable."""
         with patch.object(httpx.Client, 'request') as mock_request:
             mock_request.side_effect = [
@@ -267,14 +303,12 @@ class TestRetryOnServerErrors:
             ]
 
             with patch('time.sleep'):
-                client = AIFirewall(api_key="af_test", project_id="proj")
-                result = client.execute("agent", "action", {})
+                result = shared_firewall.execute("agent", "action", {})
 
             assert result.allowed is True
             assert mock_request.call_count == 2
-            client.close()
 
-    def test_retry_on_504(self, mock_response, valid_validation_response):
+    def test_retry_on_504(self, shared_firewall, mock_response, valid_validation_response):
         """Should retry on 504 Gateway Timeout."""
         with patch.object(httpx.Client, 'request') as mock_request:
             mock_request.side_effect = [
@@ -283,12 +317,10 @@ class TestRetryOnServerErrors:
             ]
 
             with patch('time.sleep'):
-                client = AIFirewall(api_key="af_test", project_id="proj")
-                result = client.execute("agent", "action", {})
+                result = shared_firewall.execute("agent", "action", {})
 
             assert result.allowed is True
             assert mock_request.call_count == 2
-            client.close()
 
     def test_max_retries_exceeded_server_error(self, mock_response):
         """Should raise after max retries on server error."""
@@ -311,6 +343,48 @@ class TestRetryOnServerErrors:
             assert mock_request.call_count == 3
             client.close()
 
+    def test_retries_reuse_connection(self, monkeypatch, valid_validation_response):
+        """Retries go over the pooled keep-alive connection, not a new one."""
+        replies = [(503, {}), (503, {}), (200, valid_validation_response)]
+        peers = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                peers.append(self.client_address)
+                status, payload = replies[len(peers) - 1]
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        monkeypatch.setattr("time.sleep", lambda delay: None)
+
+        try:
+            with AIFirewall(
+                api_key="af_test",
+                project_id="proj",
+                base_url=f"http://127.0.0.1:{server.server_port}",
+                http2=False,
+            ) as client:
+                result = client.execute("agent", "action", {})
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert result.allowed is True
+        assert len(peers) == 3
+        assert len(set(peers)) == 1
+
 
 # =============================================================================
 # RETRY ON RATE LIMIT TESTS
@@ -319,7 +393,7 @@ class TestRetryOnServerErrors:
 class TestRetryOnRateLimit:
     """Tests for retry behavior on rate limit (429)."""
 
-    def test_retry_on_429(self, mock_response, valid_validation_response):
+    def test_retry_on_429(self, shared_firewall, mock_response, valid_validation_response):
         """Should retry on 429 Too Many Requests."""
         with patch.object(httpx.Client, 'request') as mock_request:
             mock_request.side_effect = [
@@ -328,13 +402,86 @@ class TestRetryOnRateLimit:
             ]
 
             with patch('time.sleep'):
-                client = AIFirewall(api_key="af_test", project_id="proj")
-                result = client.execute("agent", "action", {})
+                result = shared_firewall.execute("agent", "action", {})
 
             assert result.allowed is True
             assert mock_request.call_count == 2
+
+    def test_retry_respects_retry_after(
+        self, shared_firewall, mock_response, valid_validation_response
+    ):
+        """Should wait as long as the Retry-After header asks."""
+        with patch.object(httpx.Client, 'request') as mock_request:
+            mock_request.side_effect = [
+                mock_response(429, {}, "Too Many Requests", headers={"Retry-After": "7"}),
+                mock_response(200, valid_validation_response),
+            ]
+
+            with patch('time.sleep') as mock_sleep:
+                shared_firewall.execute("agent", "action", {})
+
+            mock_sleep.assert_called_once_with(7.0)
+
+    def test_short_retry_after_overrides_backoff(self, mock_response, valid_validation_response):
+        """A Retry-After shorter than the backoff shortens the wait."""
+        with patch.object(httpx.Client, 'request') as mock_request:
+            mock_request.side_effect = [
+                mock_response(503, {}, "Unavailable", headers={"Retry-After": "0"}),
+                mock_response(200, valid_validation_response),
+            ]
+
+            with patch('time.sleep') as mock_sleep:
+                client = AIFirewall(api_key="af_test", project_id="proj", retry_base_delay=5.0)
+                client.execute("agent", "action", {})
+
+            mock_sleep.assert_called_once_with(0.0)
+            client.close()
+
+    def test_retry_after_http_date(self, shared_firewall, mock_response, valid_validation_response):
+        """Retry-After may be an HTTP-date instead of seconds."""
+        retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=20), usegmt=True)
+        with patch.object(httpx.Client, 'request') as mock_request:
+            mock_request.side_effect = [
+                mock_response(503, {}, "Unavailable", headers={"Retry-After": retry_at}),
+                mock_response(200, valid_validation_response),
+            ]
+
+            with patch('time.sleep') as mock_sleep:
+                shared_firewall.execute("agent", "action", {})
+
+            assert 15.0 < mock_sleep.call_args[0][0] <= 20.0
+
+    def test_retry_after_capped_at_max_delay(self, mock_response, valid_validation_response):
+        """A large Retry-After can't make the client wait past retry_max_delay."""
+        with patch.object(httpx.Client, 'request') as mock_request:
+            mock_request.side_effect = [
+                mock_response(429, {}, "Too Many Requests", headers={"Retry-After": "3600"}),
+                mock_response(200, valid_validation_response),
+            ]
+
+            with patch('time.sleep') as mock_sleep:
+                client = AIFirewall(api_key="af_test", project_id="proj", retry_max_delay=10.0)
+                client.execute("agent", "action", {})
+
+            mock_sleep.assert_called_once_with(10.0)
             client.close()
 
+    def test_invalid_retry_after_falls_back_to_backoff(
+        self, shared_firewall, mock_response, valid_validation_response
+    ):
+        """An unparseable Retry-After is ignored."""
+        with patch.object(httpx.Client, 'request') as mock_request:
+            mock_request.side_effect = [
+                mock_response(429, {}, "Too Many Requests", headers={"Retry-After": "soon"}),
+                mock_response(200, valid_validation_response),
+            ]
+
+            with patch('time.sleep') as mock_sleep, \
+                    patch.object(shared_firewall._rng, 'random', return_value=1.0):
+                shared_firewall.execute("agent", "action", {})
+
+            mock_sleep.assert_called_once_with(1.0)
+
     def test_max_retries_exceeded_rate_limit(self, mock_response):
         """Should raise RateLimitError after max retries on 429."""
         with patch.object(httpx.Client, 'request') as mock_request:
@@ -388,31 +535,25 @@ class TestNoRetryOnClientErrors:
             assert mock_request.call_count == 1
             client.close()
 
-    def test_no_retry_on_404(self, mock_response):
+    def test_no_retry_on_404(self, shared_firewall, mock_response):
         """Should NOT retry on 404 Not Found."""
         with patch.object(httpx.Client, 'request') as mock_request:
             mock_request.return_value = mock_response(404, {"detail": "Not found"})
 
-            client = AIFirewall(api_key="af_test", project_id="proj")
-
             with pytest.raises(AIFirewallError):
-                client.execute("agent", "action", {})
+                shared_firewall.execute("agent", "action", {})
 
             assert mock_request.call_count == 1
-            client.close()
 
-    def test_no_retry_on_422(self, mock_response):
+    def test_no_retry_on_422(self, shared_firewall, mock_response):
         """Should NOT retry on 422 Validation Error."""
         with patch.object(httpx.Client, 'request') as mock_request:
             mock_request.return_value = mock_response(422, {"detail": "Invalid data"})
 
-            client = AIFirewall(api_key="af_test", project_id="proj")
-
             with pytest.raises(ValidationError):
-                client.execute("agent", "action", {})
+                shared_firewall.execute("agent", "action", {})
 
             assert mock_request.call_count == 1
-            client.close()
 
 
 # =============================================================================
@@ -422,44 +563,53 @@ class TestNoRetryOnClientErrors:
 class TestRetryConfiguration:
     """Tests for retry configuration options."""
 
-    def test_zero_retries_disables_retry(self, mock_response):
+    def test_zero_retries_disables_retry(self, serve, mock_response):
         """Setting max_retries=0 should disable retries."""
-        with patch.object(httpx.Client, 'request') as mock_request:
-            mock_request.return_value = mock_response(500, {}, "Error")
+        calls = serve(mock_response(500, {}, "Error"))
 
-            client = AIFirewall(
-                api_key="af_test",
-                project_id="proj",
-                max_retries=0,
-            )
+        client = AIFirewall(
+            api_key="af_test",
+            project_id="proj",
+            max_retries=0,
+        )
 
-            with pytest.raises(AIFirewallError):
-                client.execute("agent", "action", {})
+        with pytest.raises(AIFirewallError):
+            client.execute("agent", "action", {})
 
-            # Should only try once
-            assert mock_request.call_count == 1
-            client.close()
+        # Should only try once
+        assert len(calls) == 1
+        client.close()
 
-    def test_custom_retry_status_codes(self, mock_response, valid_validation_response):
+    def test_custom_retry_status_codes(
+        self, serve, monkeypatch, mock_response, valid_validation_response
+    ):
         """Custom retry_on_status should be respected."""
-        with patch.object(httpx.Client, 'request') as mock_request:
-            # 418 is not in default retry codes, but we add it
-            mock_request.side_effect = [
-                mock_response(418, {}, "I'm a teapot"),
-                mock_response(200, valid_validation_response),
-            ]
+        # 418 is not in default retry codes, but we add it
+        calls = serve(
+            mock_response(418, {}, "I'm a teapot"),
+            mock_response(200, valid_validation_response),
+        )
+        monkeypatch.setattr("time.sleep", lambda delay: None)
 
-            with patch('time.sleep'):
-                client = AIFirewall(
-                    api_key="af_test",
-                    project_id="proj",
-                    retry_on_status={418},  # Custom retry code
-                )
-                result = client.execute("agent", "action", {})
+        client = AIFirewall(
+            api_key="af_test",
+            project_id="proj",
+            retry_on_status={418},  # Custom retry code
+        )
+        result = client.execute("agent", "action", {})
 
-            assert result.allowed is True
-            assert mock_request.call_count == 2
-            client.close()
+        assert result.allowed is True
+        assert len(calls) == 2
+        client.close()
+
+    def test_custom_retry_status_frozen(self):
+        """Custom retry codes are copied into a frozenset."""
+        codes = {418}
+        client = AIFirewall(api_key="af_test", project_id="proj", retry_on_status=codes)
+        codes.add(500)
+
+        assert client.retry_on_status == frozenset({418})
+        client.close()
 
     def test_default_retry_status_codes(self):
         """Default retry status codes should be 429, 500, 502, 503, 504."""
@@ -485,41 +635,61 @@ class TestRetryConfiguration:
 class TestSleepTiming:
     """Tests that sleep is called with correct delays."""
 
-    def test_sleep_called_between_retries(self, mock_response, valid_validation_response):
+    @pytest.fixture(autouse=True)
+    def sleeps(self, monkeypatch):
+        """Record time.sleep() delays instead of sleeping."""
+        delays = []
+        monkeypatch.setattr("time.sleep", delays.append)
+        return delays
+
+    def test_sleep_called_between_retries(
+        self, sleeps, serve, mock_response, valid_validation_response
+    ):
         """Sleep should be called between retry attempts."""
-        with patch.object(httpx.Client, 'request') as mock_request:
-            mock_request.side_effect = [
-                mock_response(503, {}, "Service Unavailable"),
-                mock_response(503, {}, "Service Unavailable"),
-                mock_response(200, valid_validation_response),
-            ]
+        serve(
+            mock_response(503, {}, "Service Unavailable"),
+            mock_response(503, {}, "Service Unavailable"),
+            mock_response(200, valid_validation_response),
+        )
 
-            with patch('time.sleep') as mock_sleep:
-                with patch('random.random', return_value=0.5):  # 0 jitter
-                    client = AIFirewall(
-                        api_key="af_test",
-                        project_id="proj",
-                        retry_base_delay=1.0,
-                    )
-                    client.execute("agent", "action", {})
+        client = AIFirewall(
+            api_key="af_test",
+            project_id="proj",
+            retry_base_delay=1.0,
+        )
+        client._rng.seed(1234)
+        client.execute("agent", "action", {})
 
-                # Should have slept twice (after 1st and 2nd failures)
-                assert mock_sleep.call_count == 2
-                # First sleep: ~1.0s, Second sleep: ~2.0s
-                calls = mock_sleep.call_args_list
-                assert calls[0][0][0] == pytest.approx(1.0, rel=0.01)
-                assert calls[1][0][0] == pytest.approx(2.0, rel=0.01)
+        # Should have slept twice (after 1st and 2nd failures)
+        assert len(sleeps) == 2
+        # First sleep: up to 1.0s, Second sleep: up to 2.0s
+        assert 0.0 <= sleeps[0] <= 1.0
+        assert 0.0 <= sleeps[1] <= 2.0
 
-            client.close()
+        client.close()
 
-    def test_no_sleep_on_success(self, mock_response, valid_validation_response):
+    def test_sleep_uses_retry_after_when_sent(
+        self, sleeps, serve, mock_response, valid_validation_response
+    ):
+        """Retry-After replaces the exponential schedule for each retry."""
+        serve(
+            mock_response(503, {}, "Service Unavailable", headers={"Retry-After": "2"}),
+            mock_response(429, {}, "Too Many Requests", headers={"Retry-After": "2"}),
+            mock_response(200, valid_validation_response),
+        )
+
+        client = AIFirewall(api_key="af_test", project_id="proj", retry_base_delay=1.0)
+        client.execute("agent", "action", {})
+
+        assert sleeps == [2.0, 2.0]
+        client.close()
+
+    def test_no_sleep_on_success(
+        self, sleeps, serve, shared_firewall, mock_response, valid_validation_response
+    ):
         """Sleep should not be called when request succeeds immediately."""
-        with patch.object(httpx.Client, 'request') as mock_request:
-            mock_request.return_value = mock_response(200, valid_validation_response)
+        serve(mock_response(200, valid_validation_response))
 
-            with patch('time.sleep') as mock_sleep:
-                client = AIFirewall(api_key="af_test", project_id="proj")
-                client.execute("agent", "action", {})
+        shared_firewall.execute("agent", "action", {})
 
-            mock_sleep.assert_not_called()
-            client.close()
+        assert sleeps == []
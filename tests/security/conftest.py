@@ -0,0 +1,35 @@
+"""
+Security suite configuration.
+
+Groups tests by class for pytest-xdist, so with
+
+    pytest tests/security -n auto --dist loadgroup
+
+each class runs whole on one worker. Classes are independent (shared
+fixtures are per worker, projects are uuid-suffixed), while tests within
+a class - notably the brute-force and timing checks - never compete with
+each other across workers.
+"""
+
+from pathlib import Path
+
+import pytest
+
+SECURITY_DIR = Path(__file__).parent
+
+
+def pytest_configure(config):
+    # xdist registers this marker itself; register it too so runs without
+    # xdist installed don't warn about an unknown mark
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests in the group on one xdist worker"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    # Collection hooks see every item in the session, not just this directory's
+    for item in items:
+        if SECURITY_DIR not in item.path.parents:
+            continue
+        group = item.cls.__name__ if item.cls else "module"
+        item.add_marker(pytest.mark.xdist_group(name=group))
@@ -9,35 +9,144 @@ Tests:
 - Policy injection attempts (including ReDoS)
 """
 
+import asyncio
+import functools
+import statistics
 import time
 import uuid
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
+import httpx
+import orjson
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from server.app import app
+from server.schemas.action import MAX_PARAM_DEPTH
 from server.services.policy_engine import PolicyEngine
 
 
+# =============================================================================
+# PAYLOADS
+# =============================================================================
+
+SQL_INJECTION_PAYLOADS = (
+    "'; DROP TABLE projects; --",
+    "1; DELETE FROM projects WHERE 1=1; --",
+    "' OR '1'='1",
+    "' OR 1=1 --",
+    "'; SELECT * FROM api_keys; --",
+    "1 UNION SELECT * FROM projects --",
+    "'; UPDATE projects SET is_active=0; --",
+    "' AND 1=0 UNION SELECT id, api_key FROM api_keys --",
+    "'; INSERT INTO projects VALUES ('hacked', 'Hacked'); --",
+    "1); DROP TABLE action_logs; --",
+)
+
+XSS_PAYLOADS = (
+    "<script>alert('xss')</script>",
+    "<img src=x onerror=alert('xss')>",
+    "<svg onload=alert('xss')>",
+    "javascript:alert('xss')",
+    "<body onload=alert('xss')>",
+    "<iframe src='javascript:alert(1)'>",
+    "'\"><script>alert('xss')</script>",
+    "<div style='background:url(javascript:alert(1))'>",
+    "{{constructor.constructor('alert(1)')()}}",
+    "${alert('xss')}",
+)
+
+INVALID_CONSTRAINTS = (
+    {"params.value": {"unknown_constraint": 100}},
+    {"params.value": {"max": "not_a_number"}},
+    {"params.value": {"in": "not_a_list"}},
+    {"params.value": {"pattern": 12345}},
+    {"params.value": None},
+    {"params.value": []},
+)
+
+SPECIAL_CONSTRAINT_PATHS = (
+    "params.__proto__",
+    "params.constructor",
+    "params.../../../etc/passwd",
+    "params.${env.SECRET}",
+    "params.<script>",
+)
+
+MALFORMED_POLICIES = (
+    "not json at all",
+    "{incomplete",
+    '{"rules": }',
+    "",
+    "null",
+    "[]",
+)
+
+TYPE_CONFUSION_PARAMS = (
+    {"amount": [100]},  # List instead of number
+    {"amount": {"value": 100}},  # Dict instead of number
+    {"amount": True},  # Boolean
+    {"amount": None},  # Null
+    {"amount": "100"},  # String that looks like number
+)
+
+NULL_BYTE_PAYLOADS = (
+    "test\x00injection",
+    "test%00injection",
+    "test\0injection",
+)
+
+UNICODE_PAYLOADS = (
+    "тест",  # Cyrillic
+    "测试",  # Chinese
+    "🔥💀",  # Emojis
+    "\u202e\u0041\u0042\u0043",  # RTL override
+    "test\ufeffvalue",  # BOM
+)
+
+HEADER_INJECTION_KEYS = (
+    "valid_key\r\nX-Injected: true",
+    "valid_key\nSet-Cookie: hacked=true",
+)
+
+# 100 rules of 10 constraints each
+OVERSIZED_POLICY_RULES = [
+    {
+        "action_type": f"action_{i}",
+        "constraints": {f"params.field_{j}": {"max": 1000} for j in range(10)},
+    }
+    for i in range(100)
+]
+
+# About 100 KB of params
+LARGE_PARAMS = {f"field_{i}": "x" * 1000 for i in range(100)}
+
+# Action type rate-limited by the rate_limit_project policy
+RATE_LIMITED_ACTION = "limited_action"
+
+
 # =============================================================================
 # FIXTURES
 # =============================================================================
 
-@pytest.fixture
-def client():
-    """TestClient for security tests."""
-    with TestClient(app) as c:
-        yield c
+@pytest.fixture(scope="session")
+def client(app_client):
+    """Session-wide TestClient for security tests.
 
+    The database is shared with every other module using app_client, so
+    tests isolate themselves with uuid-suffixed project ids and must never
+    drop or truncate tables.
+    """
+    return app_client
 
-@pytest.fixture
-def secure_project(client):
-    """Create a project for security testing."""
+
+def create_secure_project(client):
+    """Create a project with the security-test policy, returning (project_id, api_key)."""
     project_id = f"security-test-{uuid.uuid4().hex[:8]}"
     response = client.post("/projects", json={
         "id": project_id,
@@ -68,6 +177,87 @@ def secure_project(client):
     return project_id, api_key
 
 
+@pytest_asyncio.fixture
+async def async_client(client):
+    """AsyncClient calling the ASGI app in-process, without a thread portal.
+
+    Depends on client so the app lifespan (DB init) has already run.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+def validate_batch(client, project_id, api_key, actions):
+    """Validate actions in one /validate_action/batch call.
+
+    Each action is a dict of agent_name, action_type and params. Returns the
+    response; results are in the same order as the actions.
+    """
+    return client.post(
+        "/validate_action/batch",
+        json={"actions": [{"project_id": project_id, **action} for action in actions]},
+        headers={"X-API-Key": api_key}
+    )
+
+
+@functools.cache
+def large_request_body(project_id):
+    """/validate_action body carrying LARGE_PARAMS, serialized once per project."""
+    return orjson.dumps({
+        "project_id": project_id,
+        "agent_name": "agent",
+        "action_type": "test",
+        "params": LARGE_PARAMS
+    })
+
+
+@pytest.fixture(scope="module")
+def secure_project(client):
+    """Project shared by tests that only validate actions or read state."""
+    return create_secure_project(client)
+
+
+@pytest.fixture
+def fresh_project(client):
+    """Project of its own for tests that replace the policy."""
+    return create_secure_project(client)
+
+
+@pytest.fixture(scope="class")
+def rate_limit_project(client, request):
+    """Project whose policy rate-limits RATE_LIMITED_ACTION, returning (project_id, api_key).
+
+    Parametrize indirectly with (max_requests, window_seconds). Tests in a
+    class share the project for each limit, so each one should use its own
+    agent name to get its own counter.
+    """
+    max_requests, window_seconds = request.param
+    project_id = f"ratelimit-{max_requests}-{uuid.uuid4().hex[:8]}"
+    response = client.post("/projects", json={
+        "id": project_id,
+        "name": "Rate Limit Test"
+    })
+    api_key = response.json()["api_key"]
+
+    client.post(
+        f"/policies/{project_id}",
+        json={
+            "name": "rate-limit",
+            "version": "1.0",
+            "default": "allow",
+            "rules": [
+                {
+                    "action_type": RATE_LIMITED_ACTION,
+                    "rate_limit": {"max_requests": max_requests, "window_seconds": window_seconds}
+                }
+            ]
+        },
+        headers={"X-API-Key": api_key}
+    )
+    return project_id, api_key
+
+
 # =============================================================================
 # SQL INJECTION TESTS
 # =============================================================================
@@ -75,99 +265,102 @@ def secure_project(client):
 class TestSQLInjection:
     """Test SQL injection prevention."""
 
-    SQL_INJECTION_PAYLOADS = [
-        "'; DROP TABLE projects; --",
-        "1; DELETE FROM projects WHERE 1=1; --",
-        "' OR '1'='1",
-        "' OR 1=1 --",
-        "'; SELECT * FROM api_keys; --",
-        "1 UNION SELECT * FROM projects --",
-        "'; UPDATE projects SET is_active=0; --",
-        "' AND 1=0 UNION SELECT id, api_key FROM api_keys --",
-        "'; INSERT INTO projects VALUES ('hacked', 'Hacked'); --",
-        "1); DROP TABLE action_logs; --",
-    ]
-
-    def test_sql_injection_in_params_amount(self, client, secure_project):
+    @pytest.mark.parametrize("payload", SQL_INJECTION_PAYLOADS)
+    def test_sql_injection_in_params_amount(self, client, secure_project, payload):
         """SQL injection in params.amount should not execute."""
         project_id, api_key = secure_project
 
-        for payload in self.SQL_INJECTION_PAYLOADS:
-            response = client.post(
-                "/validate_action",
-                json={
-                    "project_id": project_id,
-                    "agent_name": "test_agent",
-                    "action_type": "test_action",
-                    "params": {"amount": payload}
-                },
-                headers={"X-API-Key": api_key}
-            )
-            # Should return 200 (validation result), not crash or execute SQL
-            assert response.status_code == 200
-            # The payload should be treated as a string, not executed
-            data = response.json()
-            assert "allowed" in data
+        response = client.post(
+            "/validate_action",
+            json={
+                "project_id": project_id,
+                "agent_name": "test_agent",
+                "action_type": "test_action",
+                "params": {"amount": payload}
+            },
+            headers={"X-API-Key": api_key}
+        )
+        # Should return 200 (validation result), not crash or execute SQL
+        assert response.status_code == 200
+        # The payload should be treated as a string, not executed
+        assert "allowed" in response.json()
 
-    def test_sql_injection_in_agent_name(self, client, secure_project):
+    @pytest.mark.parametrize("payload", SQL_INJECTION_PAYLOADS)
+    def test_sql_injection_in_agent_name(self, client, secure_project, payload):
         """SQL injection in agent_name should not execute."""
         project_id, api_key = secure_project
 
-        for payload in self.SQL_INJECTION_PAYLOADS:
-            response = client.post(
-                "/validate_action",
-                json={
-                    "project_id": project_id,
-                    "agent_name": payload,
-                    "action_type": "test_action",
-                    "params": {"amount": 100}
-                },
-                headers={"X-API-Key": api_key}
-            )
-            assert response.status_code == 200
-            data = response.json()
-            assert "allowed" in data
+        response = client.post(
+            "/validate_action",
+            json={
+                "project_id": project_id,
+                "agent_name": payload,
+                "action_type": "test_action",
+                "params": {"amount": 100}
+            },
+            headers={"X-API-Key": api_key}
+        )
+        assert response.status_code == 200
+        assert "allowed" in response.json()
 
-    def test_sql_injection_in_action_type(self, client, secure_project):
+    @pytest.mark.parametrize("payload", SQL_INJECTION_PAYLOADS)
+    def test_sql_injection_in_action_type(self, client, secure_project, payload):
         """SQL injection in action_type should not execute."""
         project_id, api_key = secure_project
 
-        for payload in self.SQL_INJECTION_PAYLOADS:
-            response = client.post(
-                "/validate_action",
-                json={
-                    "project_id": project_id,
-                    "agent_name": "test_agent",
-                    "action_type": payload,
-                    "params": {"amount": 100}
-                },
-                headers={"X-API-Key": api_key}
+        response = client.post(
+            "/validate_action",
+            json={
+                "project_id": project_id,
+                "agent_name": "test_agent",
+                "action_type": payload,
+                "params": {"amount": 100}
+            },
+            headers={"X-API-Key": api_key}
+        )
+        assert response.status_code == 200
+
+    def test_sql_injection_in_batch(self, client, secure_project):
+        """SQL injection in any field of a batched action should not execute."""
+        project_id, api_key = secure_project
+
+        response = validate_batch(client, project_id, api_key, [
+            action
+            for payload in SQL_INJECTION_PAYLOADS
+            for action in (
+                {"agent_name": "test_agent", "action_type": "test_action", "params": {"amount": payload}},
+                {"agent_name": payload, "action_type": "test_action", "params": {"amount": 100}},
+                {"agent_name": "test_agent", "action_type": payload, "params": {"amount": 100}},
             )
-            assert response.status_code == 200
+        ])
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert len(results) == 3 * len(SQL_INJECTION_PAYLOADS)
+        assert all("allowed" in result for result in results)
 
-    def test_sql_injection_in_project_id_path(self, client, secure_project):
+    @pytest.mark.parametrize("payload", SQL_INJECTION_PAYLOADS[:5])  # Test subset
+    def test_sql_injection_in_project_id_path(self, client, secure_project, payload):
         """SQL injection in project_id path parameter should fail safely."""
         _, api_key = secure_project
 
-        for payload in self.SQL_INJECTION_PAYLOADS[:5]:  # Test subset
-            response = client.get(
-                f"/projects/{payload}",
-                headers={"X-API-Key": api_key}
-            )
-            # Should return 403 (wrong project) or 404 (not found), not execute SQL
-            assert response.status_code in [403, 404]
+        response = client.get(
+            f"/projects/{payload}",
+            headers={"X-API-Key": api_key}
+        )
+        # Should return 403 (wrong project) or 404 (not found), not execute SQL
+        assert response.status_code in [403, 404]
 
-    def test_sql_injection_in_log_filters(self, client, secure_project):
+    @pytest.mark.parametrize("payload", SQL_INJECTION_PAYLOADS[:5])
+    def test_sql_injection_in_log_filters(self, client, secure_project, payload):
         """SQL injection in log filter parameters should not execute."""
         project_id, api_key = secure_project
 
-        for payload in self.SQL_INJECTION_PAYLOADS[:5]:
-            response = client.get(
-                f"/logs/{project_id}?agent_name={payload}",
-                headers={"X-API-Key": api_key}
-            )
-            # Should return 200 with empty results, not crash
-            assert response.status_code == 200
+        response = client.get(
+            f"/logs/{project_id}?agent_name={payload}",
+            headers={"X-API-Key": api_key}
+        )
+        # Should return 200 with empty results, not crash
+        assert response.status_code == 200
 
     def test_database_intact_after_injection_attempts(self, client, secure_project):
         """Verify database tables still exist after injection attempts."""
@@ -201,83 +394,93 @@ class TestSQLInjection:
 class TestXSS:
     """Test XSS prevention."""
 
-    XSS_PAYLOADS = [
-        "<script>alert('xss')</script>",
-        "<img src=x onerror=alert('xss')>",
-        "<svg onload=alert('xss')>",
-        "javascript:alert('xss')",
-        "<body onload=alert('xss')>",
-        "<iframe src='javascript:alert(1)'>",
-        "'\"><script>alert('xss')</script>",
-        "<div style='background:url(javascript:alert(1))'>",
-        "{{constructor.constructor('alert(1)')()}}",
-        "${alert('xss')}",
-    ]
-
-    def test_xss_in_agent_name_not_reflected(self, client, secure_project):
+    SCRIPT_TAG = b"<script>"
+    # Either escape shows a reflected payload was JSON-encoded
+    JSON_ESCAPES = (b"\\u003c", b'\\"')
+
+    def assert_not_reflected(self, content: bytes) -> None:
+        # Scan the raw bytes so the body isn't decoded just for this check.
+        # The payload should be JSON-encoded, not raw HTML
+        assert self.SCRIPT_TAG not in content or any(
+            escape in content for escape in self.JSON_ESCAPES
+        )
+
+    @pytest.mark.parametrize("payload", XSS_PAYLOADS)
+    def test_xss_in_agent_name_not_reflected(self, client, secure_project, payload):
         """XSS in agent_name should be stored safely, not executed."""
         project_id, api_key = secure_project
 
-        for payload in self.XSS_PAYLOADS:
-            response = client.post(
-                "/validate_action",
-                json={
-                    "project_id": project_id,
-                    "agent_name": payload,
-                    "action_type": "test_action",
-                    "params": {"amount": 100}
-                },
-                headers={"X-API-Key": api_key}
-            )
-            assert response.status_code == 200
-
-            # Check response doesn't contain unescaped script
-            response_text = response.text
-            # The payload should be JSON-encoded, not raw HTML
-            assert "<script>" not in response_text or "\\u003c" in response_text or '\\"' in response_text
+        response = client.post(
+            "/validate_action",
+            json={
+                "project_id": project_id,
+                "agent_name": payload,
+                "action_type": "test_action",
+                "params": {"amount": 100}
+            },
+            headers={"X-API-Key": api_key}
+        )
+        assert response.status_code == 200
+        self.assert_not_reflected(response.content)
 
-    def test_xss_in_action_type(self, client, secure_project):
+    @pytest.mark.parametrize("payload", XSS_PAYLOADS)
+    def test_xss_in_action_type(self, client, secure_project, payload):
         """XSS in action_type should be handled safely."""
         project_id, api_key = secure_project
 
-        for payload in self.XSS_PAYLOADS:
-            response = client.post(
-                "/validate_action",
-                json={
-                    "project_id": project_id,
-                    "agent_name": "test_agent",
-                    "action_type": payload,
-                    "params": {}
-                },
-                headers={"X-API-Key": api_key}
+        response = client.post(
+            "/validate_action",
+            json={
+                "project_id": project_id,
+                "agent_name": "test_agent",
+                "action_type": payload,
+                "params": {}
+            },
+            headers={"X-API-Key": api_key}
+        )
+        assert response.status_code == 200
+
+    def test_xss_in_batch_not_reflected(self, client, secure_project):
+        """XSS in batched actions should be handled safely."""
+        project_id, api_key = secure_project
+
+        response = validate_batch(client, project_id, api_key, [
+            action
+            for payload in XSS_PAYLOADS
+            for action in (
+                {"agent_name": payload, "action_type": "test_action", "params": {"amount": 100}},
+                {"agent_name": "test_agent", "action_type": payload, "params": {}},
             )
-            assert response.status_code == 200
+        ])
+        assert response.status_code == 200
+        assert len(response.json()["results"]) == 2 * len(XSS_PAYLOADS)
+        self.assert_not_reflected(response.content)
 
-    def test_xss_in_project_name(self, client):
+    @pytest.mark.parametrize("payload", XSS_PAYLOADS[:5])
+    def test_xss_in_project_name(self, client, payload):
         """XSS in project name should be handled safely."""
-        for payload in self.XSS_PAYLOADS[:5]:
-            project_id = f"xss-test-{uuid.uuid4().hex[:8]}"
-            response = client.post("/projects", json={
-                "id": project_id,
-                "name": payload
-            })
-            assert response.status_code == 200
+        project_id = f"xss-test-{uuid.uuid4().hex[:8]}"
+        response = client.post("/projects", json={
+            "id": project_id,
+            "name": payload
+        })
+        assert response.status_code == 200
 
-            # Retrieve and verify it's stored safely
-            api_key = response.json()["api_key"]
-            get_response = client.get(
-                f"/projects/{project_id}",
-                headers={"X-API-Key": api_key}
-            )
-            assert get_response.status_code == 200
-            # Name should be returned as-is (JSON encoded), not executed
-            assert get_response.json()["name"] == payload
+        # Retrieve and verify it's stored safely
+        api_key = response.json()["api_key"]
+        get_response = client.get(
+            f"/projects/{project_id}",
+            headers={"X-API-Key": api_key}
+        )
+        assert get_response.status_code == 200
+        # Name should be returned as-is (JSON encoded), not executed
+        assert get_response.json()["name"] == payload
 
-    def test_xss_in_policy_name(self, client, secure_project):
+    def test_xss_in_policy_name(self, client, fresh_project):
         """XSS in policy name should be handled safely."""
-        project_id, api_key = secure_project
+        project_id, api_key = fresh_project
 
-        for payload in self.XSS_PAYLOADS[:5]:
+        for payload in XSS_PAYLOADS[:5]:
             response = client.post(
                 f"/policies/{project_id}",
                 json={
@@ -359,47 +562,59 @@ class TestAPIKeyBruteForce:
         """Response times should be consistent regardless of key validity."""
         project_id, valid_key = secure_project
 
+        # Well-formed but unknown, so it takes the same lookup path as the valid key
+        # instead of being rejected by the format check
+        invalid_key = "af_" + "x" * 43
+
+        # Warm up both auth paths so one-off costs aren't charged to the first sample
+        client.get(f"/policies/{project_id}", headers={"X-API-Key": valid_key})
+        client.get(f"/policies/{project_id}", headers={"X-API-Key": invalid_key})
+
         # Measure response times for valid and invalid keys
-        valid_times = []
-        invalid_times = []
+        valid_ns = []
+        invalid_ns = []
 
-        for _ in range(10):
+        for _ in range(50):
             # Valid key - use /policies endpoint which requires auth
-            start = time.perf_counter()
+            start = time.perf_counter_ns()
             client.get(
                 f"/policies/{project_id}",
                 headers={"X-API-Key": valid_key}
             )
-            valid_times.append(time.perf_counter() - start)
+            valid_ns.append(time.perf_counter_ns() - start)
 
             # Invalid key
-            start = time.perf_counter()
+            start = time.perf_counter_ns()
             client.get(
                 f"/policies/{project_id}",
-                headers={"X-API-Key": "invalid_key_attempt"}
+                headers={"X-API-Key": invalid_key}
             )
-            invalid_times.append(time.perf_counter() - start)
+            invalid_ns.append(time.perf_counter_ns() - start)
 
-        avg_valid = sum(valid_times) / len(valid_times)
-        avg_invalid = sum(invalid_times) / len(invalid_times)
+        # Medians ignore the GC pauses and scheduler hiccups that skew averages
+        med_valid = statistics.median(valid_ns)
+        med_invalid = statistics.median(invalid_ns)
 
-        # Times should be within reasonable variance (not a huge difference)
         # Note: This is a basic check; real timing attacks need more sophisticated testing
-        ratio = max(avg_valid, avg_invalid) / min(avg_valid, avg_invalid)
-        assert ratio < 5, f"Response time ratio {ratio:.2f} suggests timing vulnerability"
+        ratio = max(med_valid, med_invalid) / min(med_valid, med_invalid)
+        assert ratio < 1.5, f"Response time ratio {ratio:.2f} suggests timing vulnerability"
 
     def test_sequential_key_guessing(self, client, secure_project):
         """Sequential key guessing should all fail."""
         project_id, _ = secure_project
 
-        # Try sequential patterns - use /policies endpoint which requires auth
-        for i in range(20):
-            guessed_key = f"af_{i:040d}"
+        def guess(i):
             response = client.get(
                 f"/policies/{project_id}",
-                headers={"X-API-Key": guessed_key}
+                headers={"X-API-Key": f"af_{i:040d}"}
             )
-            assert response.status_code == 403
+            return response.status_code
+
+        # Try sequential patterns - use /policies endpoint which requires auth
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            status_codes = list(executor.map(guess, range(20)))
+
+        assert status_codes == [403] * 20
 
     def test_error_message_doesnt_leak_info(self, client, secure_project):
         """Error messages should not reveal key structure or valid keys."""
@@ -418,16 +633,41 @@ class TestAPIKeyBruteForce:
         assert "length" not in error_detail.lower()
         assert "character" not in error_detail.lower()
 
+    def test_malformed_keys_rejected_without_lookup(self, client, secure_project):
+        """Keys that can't have been issued are refused before any cache or DB lookup."""
+        project_id, valid_key = secure_project
+
+        malformed_keys = [
+            "invalid_key_attempt",
+            "af_short",
+            valid_key + "x",
+            "xx" + valid_key[2:],
+        ]
+
+        with patch("server.middleware.auth.get_cache") as mock_get_cache:
+            for key in malformed_keys:
+                response = client.get(
+                    f"/policies/{project_id}",
+                    headers={"X-API-Key": key}
+                )
+                assert response.status_code == 403
+                assert response.json()["error"]["code"] == "invalid_api_key"
+
+        mock_get_cache.assert_not_called()
+
     def test_many_failed_attempts_still_work(self, client, secure_project):
         """System should still work after many failed attempts (no lockout DoS)."""
         project_id, valid_key = secure_project
 
         # Make many failed attempts - use /policies endpoint which requires auth
-        for _ in range(50):
-            client.get(
-                f"/policies/{project_id}",
-                headers={"X-API-Key": "invalid_attempt"}
-            )
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(
+                lambda _: client.get(
+                    f"/policies/{project_id}",
+                    headers={"X-API-Key": "invalid_attempt"}
+                ),
+                range(50)
+            ))
 
         # Valid key should still work
         response = client.get(
@@ -444,34 +684,11 @@ class TestAPIKeyBruteForce:
 class TestRateLimitBypass:
     """Test rate limiting cannot be bypassed."""
 
-    def test_cannot_bypass_with_different_case_agent(self, client):
+    @pytest.mark.parametrize("rate_limit_project", [(3, 60)], indirect=True)
+    def test_cannot_bypass_with_different_case_agent(self, client, rate_limit_project):
         """Rate limit should apply regardless of agent name case."""
-        project_id = f"ratelimit-case-{uuid.uuid4().hex[:8]}"
+        project_id, api_key = rate_limit_project
         unique_agent = f"agent_{uuid.uuid4().hex[:8]}"
-        unique_action = f"action_{uuid.uuid4().hex[:8]}"
-
-        response = client.post("/projects", json={
-            "id": project_id,
-            "name": "Rate Limit Case Test"
-        })
-        api_key = response.json()["api_key"]
-
-        # Policy with strict rate limit
-        client.post(
-            f"/policies/{project_id}",
-            json={
-                "name": "strict-limit",
-                "version": "1.0",
-                "default": "allow",
-                "rules": [
-                    {
-                        "action_type": unique_action,
-                        "rate_limit": {"max_requests": 3, "window_seconds": 60}
-                    }
-                ]
-            },
-            headers={"X-API-Key": api_key}
-        )
 
         # Use exact same agent name - should hit limit
         for i in range(3):
@@ -480,7 +697,7 @@ class TestRateLimitBypass:
                 json={
                     "project_id": project_id,
                     "agent_name": unique_agent,
-                    "action_type": unique_action,
+                    "action_type": RATE_LIMITED_ACTION,
                     "params": {}
                 },
                 headers={"X-API-Key": api_key}
@@ -493,37 +710,43 @@ class TestRateLimitBypass:
             json={
                 "project_id": project_id,
                 "agent_name": unique_agent,
-                "action_type": unique_action,
+                "action_type": RATE_LIMITED_ACTION,
                 "params": {}
             },
             headers={"X-API-Key": api_key}
         )
         assert response.json()["allowed"] is False
 
-    def test_cannot_bypass_with_action_type_variations(self, client):
-        """Rate limit should not be bypassed by action type variations."""
-        project_id = f"ratelimit-action-{uuid.uuid4().hex[:8]}"
-        response = client.post("/projects", json={
-            "id": project_id,
-            "name": "Rate Limit Action Test"
-        })
-        api_key = response.json()["api_key"]
+    @pytest.mark.parametrize("rate_limit_project", [(3, 60)], indirect=True)
+    def test_rate_limit_persists_across_requests(self, client, rate_limit_project):
+        """Rate limit state should persist correctly."""
+        project_id, api_key = rate_limit_project
+        agent = f"agent_{uuid.uuid4().hex[:8]}"
 
-        client.post(
-            f"/policies/{project_id}",
-            json={
-                "name": "strict-limit",
-                "version": "1.0",
-                "default": "allow",
-                "rules": [
-                    {
-                        "action_type": "send_email",
-                        "rate_limit": {"max_requests": 2, "window_seconds": 60}
-                    }
-                ]
-            },
-            headers={"X-API-Key": api_key}
-        )
+        # Make requests with delays
+        allowed_count = 0
+        for i in range(5):
+            response = client.post(
+                "/validate_action",
+                json={
+                    "project_id": project_id,
+                    "agent_name": agent,
+                    "action_type": RATE_LIMITED_ACTION,
+                    "params": {}
+                },
+                headers={"X-API-Key": api_key}
+            )
+            if response.json()["allowed"]:
+                allowed_count += 1
+            time.sleep(0.1)  # Small delay between requests
+
+        assert allowed_count == 3, f"Expected 3 allowed, got {allowed_count}"
+
+    @pytest.mark.parametrize("rate_limit_project", [(2, 60)], indirect=True)
+    def test_cannot_bypass_with_action_type_variations(self, client, rate_limit_project):
+        """Rate limit should not be bypassed by action type variations."""
+        project_id, api_key = rate_limit_project
+        agent = f"agent_{uuid.uuid4().hex[:8]}"
 
         # Exhaust rate limit
         for _ in range(2):
@@ -531,8 +754,8 @@ class TestRateLimitBypass:
                 "/validate_action",
                 json={
                     "project_id": project_id,
-                    "agent_name": "agent",
-                    "action_type": "send_email",
+                    "agent_name": agent,
+                    "action_type": RATE_LIMITED_ACTION,
                     "params": {}
                 },
                 headers={"X-API-Key": api_key}
@@ -544,90 +767,27 @@ class TestRateLimitBypass:
             "/validate_action",
             json={
                 "project_id": project_id,
-                "agent_name": "agent",
-                "action_type": "send_email",  # Original action
+                "agent_name": agent,
+                "action_type": RATE_LIMITED_ACTION,  # Original action
                 "params": {}
             },
             headers={"X-API-Key": api_key}
         )
         assert response.json()["allowed"] is False, "Original action should still be rate limited"
 
-    def test_rate_limit_persists_across_requests(self, client):
-        """Rate limit state should persist correctly."""
-        project_id = f"ratelimit-persist-{uuid.uuid4().hex[:8]}"
-        response = client.post("/projects", json={
-            "id": project_id,
-            "name": "Rate Limit Persist Test"
-        })
-        api_key = response.json()["api_key"]
-
-        client.post(
-            f"/policies/{project_id}",
-            json={
-                "name": "persist-limit",
-                "version": "1.0",
-                "default": "allow",
-                "rules": [
-                    {
-                        "action_type": "persist_action",
-                        "rate_limit": {"max_requests": 3, "window_seconds": 60}
-                    }
-                ]
-            },
-            headers={"X-API-Key": api_key}
-        )
-
-        # Make requests with delays
-        allowed_count = 0
-        for i in range(5):
-            response = client.post(
-                "/validate_action",
-                json={
-                    "project_id": project_id,
-                    "agent_name": "agent",
-                    "action_type": "persist_action",
-                    "params": {}
-                },
-                headers={"X-API-Key": api_key}
-            )
-            if response.json()["allowed"]:
-                allowed_count += 1
-            time.sleep(0.1)  # Small delay between requests
-
-        assert allowed_count == 3, f"Expected 3 allowed, got {allowed_count}"
-
-    def test_concurrent_requests_respect_limit(self, client):
+    @pytest.mark.parametrize("rate_limit_project", [(5, 60)], indirect=True)
+    async def test_concurrent_requests_respect_limit(self, rate_limit_project, async_client):
         """Concurrent requests should still respect rate limits."""
-        project_id = f"ratelimit-concurrent-{uuid.uuid4().hex[:8]}"
-        response = client.post("/projects", json={
-            "id": project_id,
-            "name": "Rate Limit Concurrent Test"
-        })
-        api_key = response.json()["api_key"]
-
-        client.post(
-            f"/policies/{project_id}",
-            json={
-                "name": "concurrent-limit",
-                "version": "1.0",
-                "default": "allow",
-                "rules": [
-                    {
-                        "action_type": "concurrent_action",
-                        "rate_limit": {"max_requests": 5, "window_seconds": 60}
-                    }
-                ]
-            },
-            headers={"X-API-Key": api_key}
-        )
+        project_id, api_key = rate_limit_project
+        agent = f"agent_{uuid.uuid4().hex[:8]}"
 
-        def make_request():
-            resp = client.post(
+        async def make_request():
+            resp = await async_client.post(
                 "/validate_action",
                 json={
                     "project_id": project_id,
-                    "agent_name": "agent",
-                    "action_type": "concurrent_action",
+                    "agent_name": agent,
+                    "action_type": RATE_LIMITED_ACTION,
                     "params": {}
                 },
                 headers={"X-API-Key": api_key}
@@ -635,9 +795,7 @@ class TestRateLimitBypass:
             return resp.json()["allowed"]
 
         # Send 10 concurrent requests
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(make_request) for _ in range(10)]
-            results = [f.result() for f in as_completed(futures)]
+        results = await asyncio.gather(*(make_request() for _ in range(10)))
 
         allowed_count = sum(results)
         # Should allow at most 5 (the rate limit)
@@ -651,9 +809,9 @@ class TestRateLimitBypass:
 class TestPolicyInjection:
     """Test policy injection and malformed input handling."""
 
-    def test_safe_regex_patterns_work(self, client, secure_project):
+    def test_safe_regex_patterns_work(self, client, fresh_project):
         """Safe regex patterns should work correctly."""
-        project_id, api_key = secure_project
+        project_id, api_key = fresh_project
 
         # Safe patterns that won't cause ReDoS
         safe_pattern = r"^[a-zA-Z0-9]+$"
@@ -707,146 +865,152 @@ class TestPolicyInjection:
         assert response.json()["allowed"] is False
         assert "pattern" in response.json()["reason"].lower()
 
-    def test_deeply_nested_params(self, client, secure_project):
-        """Deeply nested params should be handled safely."""
-        project_id, api_key = secure_project
-
-        # Create deeply nested structure
-        nested = {"value": 1}
-        for _ in range(50):
-            nested = {"nested": nested}
+    def test_redos_pattern_within_deadline(self, client, fresh_project):
+        """A backtracking-prone pattern must not stall validation on adversarial input."""
+        project_id, api_key = fresh_project
 
+        # Cloudflare-style pattern: stacked wildcards around a literal
         response = client.post(
-            "/validate_action",
+            f"/policies/{project_id}",
             json={
-                "project_id": project_id,
-                "agent_name": "agent",
-                "action_type": "test",
-                "params": nested
+                "name": "redos-deadline",
+                "version": "1.0",
+                "default": "allow",
+                "rules": [
+                    {
+                        "action_type": "regex_test",
+                        "constraints": {
+                            "params.input": {"pattern": ".*.*=.*"}
+                        }
+                    }
+                ]
             },
             headers={"X-API-Key": api_key}
         )
-        # Should handle gracefully, not crash
-        assert response.status_code in [200, 422]
+        assert response.status_code == 200
 
-    def test_oversized_policy_rules(self, client, secure_project):
-        """Oversized policy rules should be handled."""
+        def validate():
+            return client.post(
+                "/validate_action",
+                json={
+                    "project_id": project_id,
+                    "agent_name": "agent",
+                    "action_type": "regex_test",
+                    "params": {"input": "=" * 10000 + "!"}
+                },
+                headers={"X-API-Key": api_key}
+            )
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            response = executor.submit(validate).result(timeout=0.5)
+
+        assert response.status_code == 200
+        assert response.json()["allowed"] is True
+
+    @pytest.mark.parametrize("depth", [10, MAX_PARAM_DEPTH, 64, 1000])
+    def test_deeply_nested_params(self, client, secure_project, depth):
+        """Params nested past MAX_PARAM_DEPTH are rejected before validation."""
         project_id, api_key = secure_project
 
-        # Create policy with many rules
-        rules = []
-        for i in range(100):
-            rules.append({
-                "action_type": f"action_{i}",
-                "constraints": {
-                    f"params.field_{j}": {"max": 1000}
-                    for j in range(10)
-                }
-            })
+        # Build the body as text; json.dumps recurses once per level and would
+        # hit the recursion limit itself. params counts as the first level.
+        params = '{"nested": ' * (depth - 1) + '{"value": 1}' + "}" * (depth - 1)
+        body = (
+            f'{{"project_id": "{project_id}", "agent_name": "agent", '
+            f'"action_type": "test", "params": {params}}}'
+        )
 
+        response = client.post(
+            "/validate_action",
+            content=body,
+            headers={"X-API-Key": api_key, "Content-Type": "application/json"}
+        )
+        expected = 200 if depth <= MAX_PARAM_DEPTH else 422
+        assert response.status_code == expected
+
+    def test_oversized_policy_rules(self, client, fresh_project):
+        """Oversized policy rules should be handled."""
+        project_id, api_key = fresh_project
+
+        # Create policy with many rules
         response = client.post(
             f"/policies/{project_id}",
             json={
                 "name": "large-policy",
                 "version": "1.0",
                 "default": "allow",
-                "rules": rules
+                "rules": OVERSIZED_POLICY_RULES
             },
             headers={"X-API-Key": api_key}
         )
         # Should either accept or reject gracefully
         assert response.status_code in [200, 413, 422]
 
-    def test_invalid_constraint_types(self, client, secure_project):
+    @pytest.mark.parametrize("constraint", INVALID_CONSTRAINTS)
+    def test_invalid_constraint_types(self, client, fresh_project, constraint):
         """Invalid constraint types should be handled safely."""
-        project_id, api_key = secure_project
+        project_id, api_key = fresh_project
 
-        invalid_constraints = [
-            {"params.value": {"unknown_constraint": 100}},
-            {"params.value": {"max": "not_a_number"}},
-            {"params.value": {"in": "not_a_list"}},
-            {"params.value": {"pattern": 12345}},
-            {"params.value": None},
-            {"params.value": []},
-        ]
-
-        for constraint in invalid_constraints:
-            response = client.post(
-                f"/policies/{project_id}",
-                json={
-                    "name": "invalid-constraint",
-                    "version": "1.0",
-                    "default": "allow",
-                    "rules": [
-                        {
-                            "action_type": "test",
-                            "constraints": constraint
-                        }
-                    ]
-                },
-                headers={"X-API-Key": api_key}
-            )
-            # Should accept (schema allows flexible constraints) or reject with 422
-            assert response.status_code in [200, 422]
+        response = client.post(
+            f"/policies/{project_id}",
+            json={
+                "name": "invalid-constraint",
+                "version": "1.0",
+                "default": "allow",
+                "rules": [
+                    {
+                        "action_type": "test",
+                        "constraints": constraint
+                    }
+                ]
+            },
+            headers={"X-API-Key": api_key}
+        )
+        # Should accept (schema allows flexible constraints) or reject with 422
+        assert response.status_code in [200, 422]
 
-    def test_special_characters_in_constraint_path(self, client, secure_project):
+    @pytest.mark.parametrize("path", SPECIAL_CONSTRAINT_PATHS)
+    def test_special_characters_in_constraint_path(self, client, fresh_project, path):
         """Special characters in constraint paths should be handled."""
-        project_id, api_key = secure_project
+        project_id, api_key = fresh_project
 
-        special_paths = [
-            "params.__proto__",
-            "params.constructor",
-            "params.../../../etc/passwd",
-            "params.${env.SECRET}",
-            "params.<script>",
-        ]
-
-        for path in special_paths:
-            response = client.post(
-                f"/policies/{project_id}",
-                json={
-                    "name": "special-path",
-                    "version": "1.0",
-                    "default": "allow",
-                    "rules": [
-                        {
-                            "action_type": "test",
-                            "constraints": {
-                                path: {"max": 100}
-                            }
+        response = client.post(
+            f"/policies/{project_id}",
+            json={
+                "name": "special-path",
+                "version": "1.0",
+                "default": "allow",
+                "rules": [
+                    {
+                        "action_type": "test",
+                        "constraints": {
+                            path: {"max": 100}
                         }
-                    ]
-                },
-                headers={"X-API-Key": api_key}
-            )
-            assert response.status_code in [200, 422]
+                    }
+                ]
+            },
+            headers={"X-API-Key": api_key}
+        )
+        assert response.status_code in [200, 422]
 
-    def test_policy_engine_handles_malformed_json(self):
+    @pytest.mark.parametrize("policy", MALFORMED_POLICIES)
+    def test_policy_engine_handles_malformed_json(self, policy):
         """Policy engine should handle malformed JSON gracefully."""
         engine = PolicyEngine()
 
-        malformed_policies = [
-            "not json at all",
-            "{incomplete",
-            '{"rules": }',
-            "",
-            "null",
-            "[]",
-        ]
-
-        for policy in malformed_policies:
-            result = engine.validate(
-                policy_json=policy,
-                agent_name="agent",
-                action_type="test",
-                params={}
-            )
-            # Should return a result, not crash
-            assert hasattr(result, "allowed")
+        result = engine.validate(
+            policy_json=policy,
+            agent_name="agent",
+            action_type="test",
+            params={}
+        )
+        # Should return a result, not crash
+        assert hasattr(result, "allowed")
 
-    def test_constraint_type_confusion(self, client, secure_project):
+    @pytest.mark.parametrize("params", TYPE_CONFUSION_PARAMS)
+    def test_constraint_type_confusion(self, client, fresh_project, params):
         """Type confusion in constraints should be handled safely."""
-        project_id, api_key = secure_project
+        project_id, api_key = fresh_project
 
         # Create policy
         client.post(
@@ -868,27 +1032,18 @@ class TestPolicyInjection:
         )
 
         # Try to confuse type checking
-        type_confusion_values = [
-            {"amount": [100]},  # List instead of number
-            {"amount": {"value": 100}},  # Dict instead of number
-            {"amount": True},  # Boolean
-            {"amount": None},  # Null
-            {"amount": "100"},  # String that looks like number
-        ]
-
-        for params in type_confusion_values:
-            response = client.post(
-                "/validate_action",
-                json={
-                    "project_id": project_id,
-                    "agent_name": "agent",
-                    "action_type": "test",
-                    "params": params
-                },
-                headers={"X-API-Key": api_key}
-            )
-            # Should handle gracefully
-            assert response.status_code == 200
+        response = client.post(
+            "/validate_action",
+            json={
+                "project_id": project_id,
+                "agent_name": "agent",
+                "action_type": "test",
+                "params": params
+            },
+            headers={"X-API-Key": api_key}
+        )
+        # Should handle gracefully
+        assert response.status_code == 200
 
 
 # =============================================================================
@@ -898,92 +1053,65 @@ class TestPolicyInjection:
 class TestAdditionalSecurity:
     """Additional security edge cases."""
 
-    def test_null_byte_injection(self, client, secure_project):
+    @pytest.mark.parametrize("payload", NULL_BYTE_PAYLOADS)
+    def test_null_byte_injection(self, client, secure_project, payload):
         """Null byte injection should be handled safely."""
         project_id, api_key = secure_project
 
-        null_payloads = [
-            "test\x00injection",
-            "test%00injection",
-            "test\0injection",
-        ]
-
-        for payload in null_payloads:
-            response = client.post(
-                "/validate_action",
-                json={
-                    "project_id": project_id,
-                    "agent_name": payload,
-                    "action_type": "test",
-                    "params": {}
-                },
-                headers={"X-API-Key": api_key}
-            )
-            assert response.status_code == 200
+        response = client.post(
+            "/validate_action",
+            json={
+                "project_id": project_id,
+                "agent_name": payload,
+                "action_type": "test",
+                "params": {}
+            },
+            headers={"X-API-Key": api_key}
+        )
+        assert response.status_code == 200
 
-    def test_unicode_handling(self, client, secure_project):
+    @pytest.mark.parametrize("payload", UNICODE_PAYLOADS)
+    def test_unicode_handling(self, client, secure_project, payload):
         """Unicode characters should be handled safely."""
         project_id, api_key = secure_project
 
-        unicode_payloads = [
-            "тест",  # Cyrillic
-            "测试",  # Chinese
-            "🔥💀",  # Emojis
-            "\u202e\u0041\u0042\u0043",  # RTL override
-            "test\ufeffvalue",  # BOM
-        ]
-
-        for payload in unicode_payloads:
-            response = client.post(
-                "/validate_action",
-                json={
-                    "project_id": project_id,
-                    "agent_name": payload,
-                    "action_type": "test",
-                    "params": {}
-                },
-                headers={"X-API-Key": api_key}
-            )
-            assert response.status_code == 200
-
-    def test_large_request_body(self, client, secure_project):
-        """Large request bodies should be handled (or rejected) safely."""
-        project_id, api_key = secure_project
-
-        # Create large params
-        large_params = {f"field_{i}": "x" * 1000 for i in range(100)}
-
         response = client.post(
             "/validate_action",
             json={
                 "project_id": project_id,
-                "agent_name": "agent",
+                "agent_name": payload,
                 "action_type": "test",
-                "params": large_params
+                "params": {}
             },
             headers={"X-API-Key": api_key}
         )
+        assert response.status_code == 200
+
+    def test_large_request_body(self, client, secure_project):
+        """Large request bodies should be handled (or rejected) safely."""
+        project_id, api_key = secure_project
+
+        response = client.post(
+            "/validate_action",
+            content=large_request_body(project_id),
+            headers={"X-API-Key": api_key, "Content-Type": "application/json"}
+        )
         # Should handle or reject gracefully
         assert response.status_code in [200, 413, 422]
 
-    def test_header_injection(self, client, secure_project):
+    @pytest.mark.parametrize("key", HEADER_INJECTION_KEYS)
+    def test_header_injection(self, client, secure_project, key):
         """Header injection attempts should be handled safely."""
         project_id, api_key = secure_project
 
         # Try to inject headers via API key
-        injection_keys = [
-            "valid_key\r\nX-Injected: true",
-            "valid_key\nSet-Cookie: hacked=true",
-        ]
-
-        for key in injection_keys:
-            try:
-                response = client.get(
-                    f"/projects/{project_id}",
-                    headers={"X-API-Key": key}
-                )
-                # Should fail authentication, not inject headers
-                assert response.status_code in [400, 401, 403]
-            except Exception:
-                # Some clients may reject invalid header values
-                pass
+        try:
+            response = client.get(
+                f"/projects/{project_id}",
+                headers={"X-API-Key": key}
+            )
+            # Should fail authentication, not inject headers
+            assert response.status_code in [400, 401, 403]
+        except Exception:
+            # Some clients may reject invalid header values
+            pass
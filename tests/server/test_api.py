@@ -12,42 +12,65 @@ Covers:
 - Error handling
 """
 
+import functools
+import uuid
+from collections.abc import Mapping
+from types import MappingProxyType
+
+import orjson
 import pytest
-from fastapi.testclient import TestClient
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from server.app import app
+from server.database import async_session_maker
+from server.models.project import Project
 
 
-@pytest.fixture
-def client():
-    """Create a test client with fresh database for each test."""
-    # Use TestClient which handles lifespan events
-    with TestClient(app) as c:
-        yield c
+@pytest.fixture(scope="session")
+def client(app_client):
+    """Session-wide TestClient - the app lifespan runs once, not per test.
 
+    The database is shared with every test, so fixtures create projects
+    under unique IDs instead of relying on a fresh database.
+    """
+    return app_client
 
-@pytest.fixture
-def project_with_key(client):
-    """Create a project and return (project_id, api_key)."""
-    import time
-    project_id = f"test-project-{int(time.time() * 1000)}"
-    response = client.post("/projects", json={
-        "id": project_id,
-        "name": "Test Project"
-    })
-    assert response.status_code == 200
-    data = response.json()
-    return data["id"], data["api_key"]
 
+async def insert_project(project_id: str, name: str) -> tuple[str, str]:
+    """Insert a project row directly, returning (project_id, api_key)."""
+    async with async_session_maker() as session:
+        project = Project(id=project_id, name=name)
+        session.add(project)
+        await session.commit()
+        return project.id, project.api_key
+
+
+@functools.cache
+def auth_headers(api_key: str) -> MappingProxyType:
+    """Read-only X-API-Key headers, built once per key and shared across requests."""
+    return MappingProxyType({"X-API-Key": api_key})
 
-@pytest.fixture
-def project_with_policy(client, project_with_key):
-    """Create a project with a policy configured."""
-    project_id, api_key = project_with_key
+
+def post_json(client, url: str, payload: dict, headers: Mapping[str, str] | None = None):
+    """POST payload encoded with orjson rather than the client's stdlib json."""
+    return client.post(
+        url,
+        content=orjson.dumps(payload),
+        headers={**(headers or {}), "Content-Type": "application/json"},
+    )
+
+
+def create_project(client) -> tuple[str, str]:
+    """Insert a uniquely named project, returning (project_id, api_key)."""
+    project_id = f"test-project-{uuid.uuid4().hex[:12]}"
+    return client.portal.call(insert_project, project_id, "Test Project")
+
+
+def create_project_with_policy(client) -> tuple[str, str]:
+    """Create a project with the test policy configured."""
+    project_id, api_key = create_project(client)
 
     # Create a policy
     policy = {
@@ -67,13 +90,38 @@ def project_with_policy(client, project_with_key):
     response = client.post(
         f"/policies/{project_id}",
         json=policy,
-        headers={"X-API-Key": api_key}
+        headers=auth_headers(api_key)
     )
     assert response.status_code == 200
 
     return project_id, api_key
 
 
+@pytest.fixture
+def project_with_key(client):
+    """Create a project and return (project_id, api_key).
+
+    Skips the /projects round trip; tests of that endpoint call it themselves.
+    """
+    return create_project(client)
+
+
+@pytest.fixture(scope="class")
+def project_with_policy(client):
+    """Project with a policy, shared by the tests in a class.
+
+    For tests that only validate actions or read state; tests that change
+    the project or policy, or count its logs, use fresh_project_with_policy.
+    """
+    return create_project_with_policy(client)
+
+
+@pytest.fixture
+def fresh_project_with_policy(client):
+    """Project with a policy of its own for tests that change or count its state."""
+    return create_project_with_policy(client)
+
+
 # =============================================================================
 # HEALTH & ROOT ENDPOINT TESTS
 # =============================================================================
@@ -113,8 +161,7 @@ class TestProjectManagement:
     """Tests for /projects endpoints."""
 
     def test_create_project_success(self, client):
-        import time
-        project_id = f"new-project-{int(time.time() * 1000)}"
+        project_id = f"new-project-{uuid.uuid4().hex[:12]}"
         response = client.post("/projects", json={
             "id": project_id,
             "name": "New Project"
@@ -125,8 +172,7 @@ class TestProjectManagement:
         assert data["name"] == "New Project"
 
     def test_create_project_returns_api_key(self, client):
-        import time
-        project_id = f"key-test-{int(time.time() * 1000)}"
+        project_id = f"key-test-{uuid.uuid4().hex[:12]}"
         response = client.post("/projects", json={
             "id": project_id,
             "name": "Key Test"
@@ -200,17 +246,15 @@ class TestAuthentication:
         project_id, api_key = project_with_policy
         response = client.get(
             f"/policies/{project_id}",
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         assert response.status_code == 200
 
     def test_api_key_for_wrong_project_returns_403(self, client):
         """API key for project A should not access project B."""
-        import time
-
         # Create project A
         response = client.post("/projects", json={
-            "id": f"project-a-{int(time.time() * 1000)}",
+            "id": f"project-a-{uuid.uuid4().hex[:12]}",
             "name": "Project A"
         })
         project_a_id = response.json()["id"]
@@ -218,7 +262,7 @@ class TestAuthentication:
 
         # Create project B
         response = client.post("/projects", json={
-            "id": f"project-b-{int(time.time() * 1000)}",
+            "id": f"project-b-{uuid.uuid4().hex[:12]}",
             "name": "Project B"
         })
         project_b_id = response.json()["id"]
@@ -226,12 +270,12 @@ class TestAuthentication:
         # Try to access project B with project A's key
         response = client.get(
             f"/policies/{project_b_id}",
-            headers={"X-API-Key": project_a_key}
+            headers=auth_headers(project_a_key)
         )
         assert response.status_code == 403
 
-    def test_deactivated_project_api_key_fails(self, client, project_with_policy):
-        project_id, api_key = project_with_policy
+    def test_deactivated_project_api_key_fails(self, client, fresh_project_with_policy):
+        project_id, api_key = fresh_project_with_policy
 
         # Deactivate the project
         client.delete(f"/projects/{project_id}")
@@ -239,7 +283,7 @@ class TestAuthentication:
         # Try to use the API key
         response = client.get(
             f"/policies/{project_id}",
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         assert response.status_code == 403
 
@@ -262,7 +306,7 @@ class TestPolicyManagement:
         response = client.post(
             f"/policies/{project_id}",
             json=policy,
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         assert response.status_code == 200
         data = response.json()
@@ -273,7 +317,7 @@ class TestPolicyManagement:
         project_id, api_key = project_with_policy
         response = client.get(
             f"/policies/{project_id}",
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         assert response.status_code == 200
         data = response.json()
@@ -290,13 +334,13 @@ class TestPolicyManagement:
         project_id, api_key = project_with_key
         response = client.get(
             f"/policies/{project_id}",
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         assert response.status_code == 404
         assert "No active policy" in response.json()["detail"]
 
-    def test_update_policy_deactivates_old(self, client, project_with_policy):
-        project_id, api_key = project_with_policy
+    def test_update_policy_deactivates_old(self, client, fresh_project_with_policy):
+        project_id, api_key = fresh_project_with_policy
 
         # Create a new policy (v2)
         new_policy = {
@@ -308,33 +352,33 @@ class TestPolicyManagement:
         response = client.post(
             f"/policies/{project_id}",
             json=new_policy,
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         assert response.status_code == 200
 
         # Get active policy - should be v2
         response = client.get(
             f"/policies/{project_id}",
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         data = response.json()
         assert data["version"] == "2.0"
         assert data["name"] == "updated-policy"
 
-    def test_policy_history(self, client, project_with_policy):
-        project_id, api_key = project_with_policy
+    def test_policy_history(self, client, fresh_project_with_policy):
+        project_id, api_key = fresh_project_with_policy
 
         # Create another policy version
         client.post(
             f"/policies/{project_id}",
             json={"name": "v2", "version": "2.0", "default": "allow", "rules": []},
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
 
         # Get history
         response = client.get(
             f"/policies/{project_id}/history",
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         assert response.status_code == 200
         data = response.json()
@@ -360,7 +404,7 @@ class TestPolicyManagement:
         response = client.post(
             f"/policies/{project_id}",
             json=policy,
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         assert response.status_code == 200
         data = response.json()
@@ -376,15 +420,16 @@ class TestActionValidation:
 
     def test_validate_allowed_action(self, client, project_with_policy):
         project_id, api_key = project_with_policy
-        response = client.post(
+        response = post_json(
+            client,
             "/validate_action",
-            json={
+            {
                 "project_id": project_id,
                 "agent_name": "test_agent",
                 "action_type": "test_action",
                 "params": {"amount": 50}
             },
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         assert response.status_code == 200
         data = response.json()
@@ -393,15 +438,16 @@ class TestActionValidation:
 
     def test_validate_blocked_action_exceeds_max(self, client, project_with_policy):
         project_id, api_key = project_with_policy
-        response = client.post(
+        response = post_json(
+            client,
             "/validate_action",
-            json={
+            {
                 "project_id": project_id,
                 "agent_name": "test_agent",
                 "action_type": "test_action",
                 "params": {"amount": 200}  # Exceeds max of 100
             },
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         assert response.status_code == 200
         data = response.json()
@@ -410,15 +456,16 @@ class TestActionValidation:
 
     def test_validate_blocked_action_wrong_agent(self, client, project_with_policy):
         project_id, api_key = project_with_policy
-        response = client.post(
+        response = post_json(
+            client,
             "/validate_action",
-            json={
+            {
                 "project_id": project_id,
                 "agent_name": "unauthorized_agent",  # Not in allowed_agents
                 "action_type": "test_action",
                 "params": {"amount": 50}
             },
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         assert response.status_code == 200
         data = response.json()
@@ -427,9 +474,10 @@ class TestActionValidation:
 
     def test_validate_without_api_key_returns_401(self, client, project_with_policy):
         project_id, _ = project_with_policy
-        response = client.post(
+        response = post_json(
+            client,
             "/validate_action",
-            json={
+            {
                 "project_id": project_id,
                 "agent_name": "test_agent",
                 "action_type": "test_action",
@@ -440,29 +488,31 @@ class TestActionValidation:
 
     def test_validate_wrong_project_id_returns_403(self, client, project_with_policy):
         _, api_key = project_with_policy
-        response = client.post(
+        response = post_json(
+            client,
             "/validate_action",
-            json={
+            {
                 "project_id": "different-project",  # Wrong project ID
                 "agent_name": "test_agent",
                 "action_type": "test_action",
                 "params": {}
             },
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         assert response.status_code == 403
 
     def test_validate_returns_action_id(self, client, project_with_policy):
         project_id, api_key = project_with_policy
-        response = client.post(
+        response = post_json(
+            client,
             "/validate_action",
-            json={
+            {
                 "project_id": project_id,
                 "agent_name": "test_agent",
                 "action_type": "test_action",
                 "params": {"amount": 50}
             },
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         data = response.json()
         assert "action_id" in data
@@ -470,15 +520,16 @@ class TestActionValidation:
 
     def test_validate_returns_timestamp(self, client, project_with_policy):
         project_id, api_key = project_with_policy
-        response = client.post(
+        response = post_json(
+            client,
             "/validate_action",
-            json={
+            {
                 "project_id": project_id,
                 "agent_name": "test_agent",
                 "action_type": "test_action",
                 "params": {}
             },
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         data = response.json()
         assert "timestamp" in data
@@ -486,20 +537,85 @@ class TestActionValidation:
     def test_validate_unknown_action_with_default_block(self, client, project_with_policy):
         """Actions not matching any rule should use default policy."""
         project_id, api_key = project_with_policy
-        response = client.post(
+        response = post_json(
+            client,
             "/validate_action",
-            json={
+            {
                 "project_id": project_id,
                 "agent_name": "test_agent",
                 "action_type": "unknown_action",  # No rule for this
                 "params": {}
             },
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         data = response.json()
         assert data["allowed"] is False  # Default is block
 
 
+class TestBatchValidation:
+    """Tests for /validate_action/batch endpoint."""
+
+    def _action(self, project_id, amount, agent="test_agent"):
+        return {
+            "project_id": project_id,
+            "agent_name": agent,
+            "action_type": "test_action",
+            "params": {"amount": amount}
+        }
+
+    def test_batch_returns_result_per_action_in_order(self, client, project_with_policy):
+        project_id, api_key = project_with_policy
+        response = client.post(
+            "/validate_action/batch",
+            json={"actions": [
+                self._action(project_id, 50),
+                self._action(project_id, 500),
+                self._action(project_id, 50, agent="other_agent"),
+            ]},
+            headers=auth_headers(api_key)
+        )
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["allowed"] for r in results] == [True, False, False]
+        assert all(r["action_id"] for r in results)
+        assert len({r["action_id"] for r in results}) == 3
+
+    def test_batch_actions_are_logged(self, client, fresh_project_with_policy):
+        project_id, api_key = fresh_project_with_policy
+        client.post(
+            "/validate_action/batch",
+            json={"actions": [self._action(project_id, i) for i in range(5)]},
+            headers=auth_headers(api_key)
+        )
+
+        response = client.get(f"/logs/{project_id}", headers=auth_headers(api_key))
+        assert response.json()["total"] == 5
+
+    def test_batch_with_foreign_project_returns_403(self, client, fresh_project_with_policy):
+        project_id, api_key = fresh_project_with_policy
+        response = client.post(
+            "/validate_action/batch",
+            json={"actions": [
+                self._action(project_id, 50),
+                self._action("different-project", 50),
+            ]},
+            headers=auth_headers(api_key)
+        )
+        assert response.status_code == 403
+
+        logs = client.get(f"/logs/{project_id}", headers=auth_headers(api_key))
+        assert logs.json()["total"] == 0
+
+    def test_empty_batch_returns_422(self, client, project_with_policy):
+        _, api_key = project_with_policy
+        response = client.post(
+            "/validate_action/batch",
+            json={"actions": []},
+            headers=auth_headers(api_key)
+        )
+        assert response.status_code == 422
+
+
 # =============================================================================
 # AUDIT LOG TESTS
 # =============================================================================
@@ -519,13 +635,13 @@ class TestAuditLogs:
                 "action_type": "test_action",
                 "params": {"amount": 50}
             },
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
 
         # Get logs
         response = client.get(
             f"/logs/{project_id}",
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         assert response.status_code == 200
         data = response.json()
@@ -545,13 +661,13 @@ class TestAuditLogs:
                     "action_type": "test_action",
                     "params": {"amount": i}
                 },
-                headers={"X-API-Key": api_key}
+                headers=auth_headers(api_key)
             )
 
         # Get first page with small page size
         response = client.get(
             f"/logs/{project_id}?page=1&page_size=2",
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         data = response.json()
         assert len(data["items"]) == 2
@@ -570,7 +686,7 @@ class TestAuditLogs:
                 "action_type": "test_action",
                 "params": {"amount": 50}
             },
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         client.post(
             "/validate_action",
@@ -580,13 +696,13 @@ class TestAuditLogs:
                 "action_type": "test_action",
                 "params": {"amount": 50}
             },
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
 
         # Filter by agent_a
         response = client.get(
             f"/logs/{project_id}?agent_name=agent_a",
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         data = response.json()
         for item in data["items"]:
@@ -604,7 +720,7 @@ class TestAuditLogs:
                 "action_type": "test_action",
                 "params": {"amount": 50}
             },
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         # Create blocked action
         client.post(
@@ -615,13 +731,13 @@ class TestAuditLogs:
                 "action_type": "test_action",
                 "params": {"amount": 200}  # Exceeds max
             },
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
 
         # Filter blocked only
         response = client.get(
             f"/logs/{project_id}?allowed=false",
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         data = response.json()
         for item in data["items"]:
@@ -639,13 +755,13 @@ class TestAuditLogs:
                 "action_type": "test_action",
                 "params": {"amount": 50}
             },
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
 
         # Get stats
         response = client.get(
             f"/logs/{project_id}/stats",
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         assert response.status_code == 200
         data = response.json()
@@ -654,6 +770,57 @@ class TestAuditLogs:
         assert "blocked" in data
         assert "block_rate" in data
 
+    def test_log_stats_count_each_validation(self, client, fresh_project_with_policy):
+        project_id, api_key = fresh_project_with_policy
+
+        for amount in (50, 60, 200):  # 200 exceeds max
+            client.post(
+                "/validate_action",
+                json={
+                    "project_id": project_id,
+                    "agent_name": "test_agent",
+                    "action_type": "test_action",
+                    "params": {"amount": amount}
+                },
+                headers=auth_headers(api_key)
+            )
+
+        response = client.get(
+            f"/logs/{project_id}/stats",
+            headers=auth_headers(api_key)
+        )
+        data = response.json()
+        assert data["total_actions"] == 3
+        assert data["allowed"] == 2
+        assert data["blocked"] == 1
+        assert data["top_action_types"] == [{"action_type": "test_action", "count": 3}]
+        assert data["top_agents"] == [{"agent_name": "test_agent", "count": 3}]
+
+    def test_rebuild_log_stats_matches_counters(self, client, fresh_project_with_policy):
+        project_id, api_key = fresh_project_with_policy
+
+        client.post(
+            "/validate_action",
+            json={
+                "project_id": project_id,
+                "agent_name": "test_agent",
+                "action_type": "test_action",
+                "params": {"amount": 50}
+            },
+            headers=auth_headers(api_key)
+        )
+        stats = client.get(
+            f"/logs/{project_id}/stats",
+            headers=auth_headers(api_key)
+        ).json()
+
+        response = client.post(
+            f"/logs/{project_id}/stats/rebuild",
+            headers=auth_headers(api_key)
+        )
+        assert response.status_code == 200
+        assert response.json() == stats
+
 
 # =============================================================================
 # REQUEST VALIDATION / ERROR HANDLING TESTS
@@ -686,7 +853,7 @@ class TestRequestValidation:
                 "action_type": "test",
                 "params": {}
             },
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         assert response.status_code == 422
 
@@ -700,7 +867,7 @@ class TestRequestValidation:
                 "action_type": "test",
                 "params": {}
             },
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         assert response.status_code == 422
 
@@ -716,6 +883,34 @@ class TestRequestValidation:
         )
         assert response.status_code == 422
 
+    def test_validate_action_invalid_json_returns_422(self, client, project_with_policy):
+        _, api_key = project_with_policy
+        response = client.post(
+            "/validate_action",
+            content="not valid json",
+            headers={
+                "X-API-Key": api_key,
+                "Content-Type": "application/json"
+            }
+        )
+        assert response.status_code == 422
+
+    def test_validate_action_nan_param_returns_422(self, client, project_with_policy):
+        """NaN would compare as within any numeric limit, so it is rejected."""
+        project_id, api_key = project_with_policy
+        response = client.post(
+            "/validate_action",
+            content=(
+                '{"project_id": "%s", "agent_name": "test_agent", '
+                '"action_type": "test_action", "params": {"amount": NaN}}' % project_id
+            ),
+            headers={
+                "X-API-Key": api_key,
+                "Content-Type": "application/json"
+            }
+        )
+        assert response.status_code == 422
+
     def test_policy_invalid_rule_type_returns_422(self, client, project_with_key):
         project_id, api_key = project_with_key
         response = client.post(
@@ -731,7 +926,7 @@ class TestRequestValidation:
                     }
                 ]
             },
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         assert response.status_code == 422
 
@@ -739,7 +934,7 @@ class TestRequestValidation:
         project_id, api_key = project_with_policy
         response = client.get(
             f"/logs/{project_id}?page_size=500",  # Max is 100
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         assert response.status_code == 422
 
@@ -747,6 +942,6 @@ class TestRequestValidation:
         project_id, api_key = project_with_policy
         response = client.get(
             f"/logs/{project_id}?page=-1",
-            headers={"X-API-Key": api_key}
+            headers=auth_headers(api_key)
         )
         assert response.status_code == 422
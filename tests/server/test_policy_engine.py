@@ -445,6 +445,18 @@ class TestRateLimiting:
         result = engine.validate(policy, "agent2", "action1", {})
         assert result.allowed is True
 
+    def test_rate_limit_per_project(self):
+        """The same agent/action pair has a separate limit in each project."""
+        engine = PolicyEngine()
+        policy = make_policy([{
+            "action_type": "api_call",
+            "rate_limit": {"max_requests": 1, "window_seconds": 60}
+        }])
+
+        assert engine.validate(policy, "agent", "api_call", {}, project_id="proj-a").allowed is True
+        assert engine.validate(policy, "agent", "api_call", {}, project_id="proj-a").allowed is False
+        assert engine.validate(policy, "agent", "api_call", {}, project_id="proj-b").allowed is True
+
     def test_rate_limit_resets_after_window(self):
         """Rate limit should reset after the window expires."""
         engine = PolicyEngine()
@@ -685,6 +697,34 @@ class TestEdgeCases:
         assert result.allowed is False
         assert "cannot be compared numerically" in result.reason
 
+    def test_malformed_rule_blocks_only_its_action(self):
+        """A rule that can't be compiled blocks its action; other rules still apply."""
+        engine = PolicyEngine()
+        policy = make_policy([
+            {"action_type": "a", "constraints": ["params.amount"]},
+            {"action_type": "c", "rate_limit": "100/hour"},
+            {"action_type": "b", "constraints": {"params.amount": {"max": 500}}},
+        ], default="allow")
+
+        result = engine.validate(policy, "agent", "a", {"amount": 100})
+        assert result.allowed is False
+        assert "Invalid policy rule" in result.reason
+        assert result.matched_rule == "a"
+
+        assert engine.validate(policy, "agent", "c", {}).allowed is False
+        assert engine.validate(policy, "agent", "b", {"amount": 100}).allowed is True
+        assert engine.validate(policy, "agent", "b", {"amount": 600}).allowed is False
+
+    @pytest.mark.parametrize("rules", [["not a rule"], {"action_type": "pay"}])
+    def test_malformed_rules_fail_closed(self, rules):
+        """Rules whose scope can't be determined block every action."""
+        engine = PolicyEngine()
+        policy = json.dumps({"default": "allow", "rules": rules})
+
+        result = engine.validate(policy, "agent", "anything", {})
+        assert result.allowed is False
+        assert "Invalid policy" in result.reason
+
     def test_multiple_rules_for_same_action(self):
         """When multiple rules match the same action, all are evaluated."""
         engine = PolicyEngine()
@@ -704,3 +744,174 @@ class TestEdgeCases:
         # Fails agent constraint
         result = engine.validate(policy, "other_agent", "pay", {"amount": 100})
         assert result.allowed is False
+
+
+# =============================================================================
+# CACHING TESTS
+# =============================================================================
+
+class TestParseAndPatternCaching:
+    """Tests for the parsed-policy and compiled-regex caches."""
+
+    def test_policy_compiled_once(self):
+        """Repeated validations of the same policy string reuse the plan."""
+        from server.services.policy_engine import get_compiled_policy
+
+        engine = PolicyEngine()
+        policy = make_policy([{"action_type": "pay", "constraints": {"params.amount": {"max": 500}}}])
+
+        engine.validate(policy, "agent", "pay", {"amount": 100})
+        hits_before = get_compiled_policy.cache_info().hits
+        result = engine.validate(policy, "agent", "pay", {"amount": 600})
+
+        assert result.allowed is False
+        assert get_compiled_policy.cache_info().hits == hits_before + 1
+
+    def test_pattern_compiled_once(self):
+        """The same pattern string returns the same compiled object."""
+        from server.services.policy_engine import compile_pattern
+
+        assert compile_pattern(r"^\d+$") is compile_pattern(r"^\d+$")
+
+    def test_pattern_compiled_with_policy(self):
+        """Validations reuse the pattern compiled with the policy, skipping the cache lookup."""
+        engine = PolicyEngine()
+        policy = make_policy([{
+            "action_type": "pay",
+            "constraints": {"params.ref": {"pattern": r"^INV-\d+$", "not_pattern": r"test"}},
+        }])
+        engine.validate(policy, "agent", "pay", {"ref": "INV-1"})
+
+        with patch("server.services.policy_engine.compile_pattern") as mock_compile:
+            assert engine.validate(policy, "agent", "pay", {"ref": "INV-2"}).allowed is True
+            assert engine.validate(policy, "agent", "pay", {"ref": "INV-test"}).allowed is False
+
+        mock_compile.assert_not_called()
+
+    def test_invalid_policy_json_not_cached(self):
+        """Invalid JSON still returns a clean validation failure."""
+        engine = PolicyEngine()
+
+        for _ in range(2):
+            result = engine.validate("{not json", "agent", "pay", {})
+            assert result.allowed is False
+            assert "Invalid policy JSON" in result.reason
+
+    def test_policy_json_outside_orjson_range_still_parses(self):
+        """Integers beyond 64 bits fall back to the stdlib parser."""
+        from server.services.policy_engine import dump_policy_json, parse_policy_json
+
+        policy = {"rules": [{"action_type": "pay", "constraints": {"params.amount": {"max": 2**70}}}]}
+        encoded = dump_policy_json(policy)
+
+        assert parse_policy_json(encoded) == policy
+
+
+class TestCompiledPolicy:
+    """Tests for the compiled policy dispatch table."""
+
+    def test_rules_grouped_by_action_type(self):
+        from server.services.policy_engine import compile_policy
+
+        plan = compile_policy({"rules": [
+            {"action_type": "pay", "constraints": {"params.amount": {"max": 500}}},
+            {"action_type": "*", "blocked_agents": ["bad_agent"]},
+            {"action_type": "refund", "allowed_agents": ["finance_agent"]},
+        ]})
+
+        assert [r.name for r in plan.rules_for("pay")] == ["pay", "*"]
+        assert [r.name for r in plan.rules_for("refund")] == ["refund", "*"]
+        assert [r.name for r in plan.rules_for("unknown")] == ["*"]
+        assert len(plan.rules_for("pay")[0].constraint_checks) == 1
+
+    def test_rule_without_action_type_keeps_policy_order(self):
+        """Rules with no action_type apply everywhere, ahead of explicit wildcards."""
+        from server.services.policy_engine import compile_policy
+
+        plan = compile_policy({"rules": [
+            {"action_type": "*", "allowed_agents": ["a"]},
+            {"allowed_agents": ["b"]},
+            {"action_type": "pay", "allowed_agents": ["c"]},
+        ]})
+
+        assert [r.allowed_agents for r in plan.rules_for("pay")] == [{"b"}, {"c"}, {"a"}]
+        assert [r.allowed_agents for r in plan.rules_for("other")] == [{"b"}, {"a"}]
+
+    def test_changed_policy_gets_new_plan(self):
+        from server.services.policy_engine import get_compiled_policy
+
+        old = make_policy([{"action_type": "pay", "constraints": {"params.amount": {"max": 500}}}])
+        new = make_policy([{"action_type": "pay", "constraints": {"params.amount": {"max": 50}}}])
+
+        assert get_compiled_policy(old) is not get_compiled_policy(new)
+
+        engine = PolicyEngine()
+        assert engine.validate(old, "agent", "pay", {"amount": 100}).allowed is True
+        assert engine.validate(new, "agent", "pay", {"amount": 100}).allowed is False
+
+    def test_compiled_plan_matches_policy_semantics(self):
+        """Randomized actions get the decision the policy rules spell out."""
+        import random
+
+        policy = make_policy([
+            {
+                "action_type": "pay_invoice",
+                "allowed_agents": ["billing_agent", "finance_agent"],
+                "constraints": {
+                    "params.amount": {"min": 0, "max": 1000},
+                    "params.currency": {"in": ["USD", "EUR"]},
+                },
+            },
+            {"action_type": "*", "blocked_agents": ["rogue_agent"]},
+        ], default="block")
+
+        def expected(agent, action_type, params):
+            if agent == "rogue_agent":
+                return False
+            if action_type != "pay_invoice":
+                return True  # only the wildcard rule matches
+            amount = params.get("amount")
+            return (
+                agent in ("billing_agent", "finance_agent")
+                and amount is not None and 0 <= amount <= 1000
+                and params.get("currency") in ("USD", "EUR")
+            )
+
+        engine = PolicyEngine()
+        rng = random.Random(1234)
+        for _ in range(1000):
+            agent = rng.choice(["billing_agent", "finance_agent", "other_agent", "rogue_agent"])
+            action_type = rng.choice(["pay_invoice", "refund"])
+            params = {}
+            if rng.random() < 0.9:
+                params["amount"] = rng.choice([rng.randint(-100, 1500), rng.uniform(-1, 1001)])
+            if rng.random() < 0.9:
+                params["currency"] = rng.choice(["USD", "EUR", "GBP"])
+
+            result = engine.validate(policy, agent, action_type, params)
+            assert result.allowed is expected(agent, action_type, params), (agent, action_type, params)
+
+    def test_list_values_become_frozensets(self):
+        from server.services.policy_engine import compile_policy
+
+        plan = compile_policy({"rules": [{
+            "action_type": "pay",
+            "allowed_agents": ["billing_agent", "finance_agent"],
+            "blocked_agents": ["*"],
+        }]})
+        rule = plan.rules_for("pay")[0]
+
+        assert rule.allowed_agents == frozenset({"billing_agent", "finance_agent"})
+        assert rule.blocks_all is True
+
+    def test_in_constraint_with_unhashable_value(self):
+        """Dict or list params are compared against the original list."""
+        engine = PolicyEngine()
+        policy = make_policy([{
+            "action_type": "pay",
+            "constraints": {"params.currency": {"in": ["USD", "EUR"]}},
+        }])
+
+        result = engine.validate(policy, "agent", "pay", {"currency": {"code": "USD"}})
+        assert result.allowed is False
+        assert "['USD', 'EUR']" in result.reason
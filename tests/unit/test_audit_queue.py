@@ -0,0 +1,204 @@
+"""Unit tests for the batched audit log writer."""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from server.config import Settings, get_settings
+from server.models import AuditLog
+from server.services.audit_queue import (
+    AuditLogWriter,
+    close_audit_writer,
+    flush_audit_logs,
+    get_audit_writer,
+    init_audit_writer,
+)
+
+
+def make_row() -> AuditLog:
+    return AuditLog(
+        project_id="test-project",
+        agent_name="agent",
+        action_type="pay",
+        params="{}",
+        allowed=True,
+    )
+
+
+class RecordingWriter(AuditLogWriter):
+    """Writer that records batches instead of touching the database."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batches: list[list[AuditLog]] = []
+
+    async def _write(self, batch):
+        self.batches.append(batch)
+
+
+class TestAuditLogWriter:
+    """Tests for AuditLogWriter batching."""
+
+    @pytest.mark.asyncio
+    async def test_rows_queued_together_are_written_as_one_batch(self):
+        writer = RecordingWriter(flush_interval=0.05)
+        writer.start()
+        try:
+            for _ in range(10):
+                writer.put_nowait(make_row())
+            await writer.flush()
+        finally:
+            await writer.stop()
+
+        assert [len(batch) for batch in writer.batches] == [10]
+
+    @pytest.mark.asyncio
+    async def test_batches_capped_at_max_batch(self):
+        writer = RecordingWriter(max_batch=4, flush_interval=0.05)
+        for _ in range(10):
+            writer.put_nowait(make_row())
+        writer.start()
+        try:
+            await writer.flush()
+        finally:
+            await writer.stop()
+
+        assert [len(batch) for batch in writer.batches] == [4, 4, 2]
+
+    @pytest.mark.asyncio
+    async def test_stop_writes_pending_rows(self):
+        writer = RecordingWriter(flush_interval=0.05)
+        writer.start()
+        writer.put_nowait(make_row())
+
+        await writer.stop()
+
+        assert sum(len(batch) for batch in writer.batches) == 1
+        assert writer.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_write_error_does_not_stop_writer(self):
+        writer = RecordingWriter(flush_interval=0)
+        calls = []
+
+        async def failing_once(batch):
+            calls.append(len(batch))
+            if len(calls) == 1:
+                raise RuntimeError("database is locked")
+
+        writer._write = failing_once
+        writer.start()
+        try:
+            writer.put_nowait(make_row())
+            await writer.flush()
+            writer.put_nowait(make_row())
+            await writer.flush()
+        finally:
+            await writer.stop()
+
+        # The failed batch is retried row by row before the next one
+        assert calls == [1, 1, 1]
+
+    @pytest.mark.asyncio
+    async def test_failing_row_retried_until_written(self):
+        """A row that keeps failing stays queued; the rest of its batch is written."""
+        writer = RecordingWriter(flush_interval=0.05, retry_delay=0)
+        bad = make_row()
+        written = []
+        failures = []
+
+        async def reject_bad(batch):
+            if bad in batch and len(failures) < 5:
+                failures.append(batch)
+                raise RuntimeError("database is locked")
+            written.extend(batch)
+
+        writer._write = reject_bad
+        rows = [make_row(), bad, make_row()]
+        for row in rows:
+            writer.put_nowait(row)
+        writer.start()
+        try:
+            await writer.flush()
+        finally:
+            await writer.stop()
+
+        assert written == rows
+        assert len(failures) == 5
+
+    @pytest.mark.asyncio
+    async def test_stop_gives_up_after_timeout(self):
+        """stop() doesn't hang on shutdown if the database stays down."""
+        writer = RecordingWriter(flush_interval=0, retry_delay=0.01)
+
+        async def always_fail(batch):
+            raise RuntimeError("database is down")
+
+        writer._write = always_fail
+        writer.start()
+        writer.put_nowait(make_row())
+
+        await asyncio.wait_for(writer.stop(timeout=0.05), 1.0)
+
+    @pytest.mark.asyncio
+    async def test_flush_returns_under_sustained_traffic(self):
+        """flush() waits for rows queued before it, not for an empty queue."""
+        writer = RecordingWriter(flush_interval=0)
+        writer.start()
+
+        async def produce():
+            while True:
+                writer.put_nowait(make_row())
+                await asyncio.sleep(0)
+
+        producer = asyncio.create_task(produce())
+        try:
+            await asyncio.sleep(0.01)
+            await asyncio.wait_for(writer.flush(), 1.0)
+        finally:
+            producer.cancel()
+            await writer.stop()
+
+    @pytest.mark.asyncio
+    async def test_put_raises_when_queue_full(self):
+        writer = RecordingWriter(max_pending=2)
+        writer.put_nowait(make_row())
+        writer.put_nowait(make_row())
+
+        with pytest.raises(asyncio.QueueFull):
+            writer.put_nowait(make_row())
+
+        assert writer.pending == 2
+
+
+class TestWriterRegistry:
+    """Tests for the per-loop writer lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_no_writer_until_initialized(self):
+        assert get_audit_writer() is None
+        await flush_audit_logs()  # no-op
+
+    @pytest.mark.asyncio
+    async def test_init_and_close(self, monkeypatch):
+        monkeypatch.setattr(get_settings(), "audit_batch_enabled", True)
+        writer = await init_audit_writer()
+        try:
+            assert writer is not None
+            assert get_audit_writer() is writer
+            assert await init_audit_writer() is writer
+        finally:
+            await close_audit_writer()
+
+        assert get_audit_writer() is None
+
+    def test_disabled_by_default(self):
+        assert Settings().audit_batch_enabled is False
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_config(self):
+        with patch("server.services.audit_queue.get_settings") as mock_get_settings:
+            mock_get_settings.return_value.audit_batch_enabled = False
+            assert await init_audit_writer() is None
+        assert get_audit_writer() is None
@@ -4,6 +4,24 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 
+@pytest.fixture(autouse=True)
+def clear_local_caches():
+    """Keep the process-wide API key and policy caches from leaking between tests."""
+    from server.cache import get_local_policy_cache, get_local_project_cache
+
+    get_local_project_cache().clear()
+    get_local_policy_cache().clear()
+    yield
+    get_local_project_cache().clear()
+    get_local_policy_cache().clear()
+
+
+@pytest.fixture
+def invalidations_live(monkeypatch):
+    """Act as if this worker is subscribed to cache invalidations."""
+    monkeypatch.setattr("server.cache._invalidations_live", True)
+
+
 class TestCacheServiceWithoutRedis:
     """Tests for CacheService when Redis is not available."""
 
@@ -243,6 +261,341 @@ class TestCacheServiceErrorHandling:
         assert result is None
 
 
+class TestCacheSerialization:
+    """Tests for cache value encoding."""
+
+    def test_serialize_round_trip(self):
+        """_serialize output decodes back to the original dict."""
+        from server.cache import CacheService
+
+        cache = CacheService(None)
+        data = {"id": 1, "name": "test", "rules": '{"default": "allow"}'}
+
+        assert cache._deserialize(cache._serialize(data)) == data
+
+    def test_serialize_falls_back_to_stdlib_json(self):
+        """Stdlib json is used when orjson is not installed."""
+        import json
+        import server.cache as cache_module
+        from server.cache import CacheService
+
+        cache = CacheService(None)
+        data = {"id": 1, "name": "test"}
+
+        with patch.object(cache_module, "ORJSON_AVAILABLE", False):
+            encoded = cache._serialize(data)
+            assert isinstance(encoded, str)
+            assert json.loads(encoded) == data
+            assert cache._deserialize(encoded) == data
+
+
+class TestTTLCache:
+    """Tests for the in-process TTL cache."""
+
+    def test_get_returns_value_before_expiry(self):
+        from server.cache import TTLCache
+
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("key", {"id": "proj-1"})
+
+        assert cache.get("key") == {"id": "proj-1"}
+        assert cache.get("missing") is None
+
+    def test_entry_expires_after_ttl(self):
+        import server.cache as cache_module
+        from server.cache import TTLCache
+
+        cache = TTLCache(maxsize=10, ttl=60)
+        with patch.object(cache_module.time, "monotonic", return_value=1000.0):
+            cache.set("key", "value")
+        with patch.object(cache_module.time, "monotonic", return_value=1060.0):
+            assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_oldest_entry_evicted_when_full(self):
+        from server.cache import TTLCache
+
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_pop_removes_entry(self):
+        from server.cache import TTLCache
+
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("key", "value")
+
+        assert cache.pop("key") == "value"
+        assert cache.get("key") is None
+        assert cache.pop("key") is None
+
+
+class TestLocalProjectCache:
+    """Tests for the in-process layer in front of Redis for API key lookups."""
+
+    @pytest.mark.asyncio
+    async def test_project_not_cached_without_redis(self, invalidations_live):
+        """Without Redis other workers can't evict entries, so nothing is cached."""
+        from server.cache import CacheService
+
+        cache = CacheService(None)
+        await cache.set_project_by_api_key("api_key_123", {"id": "proj-1"})
+
+        assert await cache.get_project_by_api_key("api_key_123") is None
+
+    @pytest.mark.asyncio
+    async def test_local_cache_bypassed_while_listener_down(self):
+        """Without a live invalidation listener every lookup goes to Redis."""
+        from server.cache import CacheService, get_local_project_cache
+
+        mock_redis = AsyncMock()
+        mock_redis.get = AsyncMock(return_value=None)
+        cache = CacheService(mock_redis)
+
+        await cache.set_project_by_api_key("api_key_123", {"id": "proj-1"})
+
+        assert get_local_project_cache().get("api_key_123") is None
+        assert await cache.get_project_by_api_key("api_key_123") is None
+        mock_redis.get.assert_called_once_with("api_key:api_key_123")
+
+    @pytest.mark.asyncio
+    async def test_local_hit_skips_redis(self, invalidations_live):
+        from server.cache import CacheService
+
+        mock_redis = AsyncMock()
+        mock_redis.get = AsyncMock(return_value=None)
+        cache = CacheService(mock_redis)
+
+        await cache.set_project_by_api_key("api_key_123", {"id": "proj-1"})
+        result = await cache.get_project_by_api_key("api_key_123")
+
+        assert result == {"id": "proj-1"}
+        mock_redis.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_project_clears_local_entry(self, invalidations_live):
+        from server.cache import CacheService
+
+        mock_redis = AsyncMock()
+        mock_redis.get = AsyncMock(return_value=None)
+        cache = CacheService(mock_redis)
+        await cache.set_project_by_api_key("api_key_123", {"id": "proj-1"})
+        await cache.invalidate_project("api_key_123")
+
+        assert await cache.get_project_by_api_key("api_key_123") is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_project_publishes_to_other_workers(self):
+        from server.cache import CacheService, INVALIDATION_CHANNEL
+
+        mock_redis = AsyncMock()
+        cache = CacheService(mock_redis)
+        await cache.invalidate_project("api_key_123")
+
+        mock_redis.delete.assert_called_once_with("api_key:api_key_123")
+        mock_redis.publish.assert_called_once_with(INVALIDATION_CHANNEL, "api_key_123")
+
+    @pytest.mark.asyncio
+    async def test_invalidate_project_publishes_when_delete_fails(self):
+        """Other workers are told even if the Redis copy couldn't be deleted."""
+        from redis.exceptions import RedisError
+        from server.cache import CacheService, INVALIDATION_CHANNEL
+
+        mock_redis = AsyncMock()
+        mock_redis.delete = AsyncMock(side_effect=RedisError("timeout"))
+        cache = CacheService(mock_redis)
+        await cache.invalidate_project("api_key_123")
+
+        mock_redis.publish.assert_called_once_with(INVALIDATION_CHANNEL, "api_key_123")
+
+    def test_invalidation_message_evicts_local_entry(self):
+        from server.cache import get_local_project_cache, handle_invalidation_message
+
+        local = get_local_project_cache()
+        local.set("api_key_123", {"id": "proj-1"})
+        local.set("api_key_456", {"id": "proj-2"})
+
+        handle_invalidation_message({"type": "subscribe", "data": 1})
+        handle_invalidation_message({"type": "message", "data": "api_key_123"})
+
+        assert local.get("api_key_123") is None
+        assert local.get("api_key_456") == {"id": "proj-2"}
+
+    @pytest.mark.asyncio
+    async def test_local_cache_respects_master_switch(self, invalidations_live):
+        from server.cache import CacheService
+
+        mock_redis = AsyncMock()
+        mock_redis.get = AsyncMock(return_value=None)
+        cache = CacheService(mock_redis)
+        with patch.object(cache, "settings") as mock_settings:
+            mock_settings.cache_enabled = False
+            await cache.set_project_by_api_key("api_key_123", {"id": "proj-1"})
+            assert await cache.get_project_by_api_key("api_key_123") is None
+
+
+class TestLocalPolicyCache:
+    """Tests for the in-process layer in front of Redis for policy lookups."""
+
+    @pytest.mark.asyncio
+    async def test_policy_not_cached_without_redis(self, invalidations_live):
+        """Without Redis other workers can't evict entries, so nothing is cached."""
+        from server.cache import CacheService
+
+        cache = CacheService(None)
+        await cache.set_policy("project-123", {"id": 1, "rules": '{"default": "allow"}'})
+
+        assert await cache.get_policy("project-123") is None
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_skips_local_cache_while_listener_down(self):
+        from server.cache import CacheService
+        import json
+
+        mock_redis = AsyncMock()
+        mock_redis.get = AsyncMock(return_value=json.dumps({"id": 1}))
+        cache = CacheService(mock_redis)
+
+        assert await cache.get_policy("project-123") == {"id": 1}
+        assert await cache.get_policy("project-123") == {"id": 1}
+        assert mock_redis.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_populates_local_cache(self, invalidations_live):
+        from server.cache import CacheService
+        import json
+
+        mock_redis = AsyncMock()
+        mock_redis.get = AsyncMock(return_value=json.dumps({"id": 1}))
+        cache = CacheService(mock_redis)
+
+        assert await cache.get_policy("project-123") == {"id": 1}
+        assert await cache.get_policy("project-123") == {"id": 1}
+        mock_redis.get.assert_called_once_with("policy:project-123")
+
+    @pytest.mark.asyncio
+    async def test_local_ttl_capped_by_policy_ttl(self, invalidations_live):
+        """A local entry never outlives the Redis policy TTL."""
+        from server.cache import CacheService, get_local_policy_cache
+
+        cache = CacheService(AsyncMock())
+        with patch.object(cache, "settings") as mock_settings:
+            mock_settings.cache_enabled = True
+            mock_settings.cache_ttl_policy = 0
+            await cache.set_policy("project-123", {"id": 1})
+
+        assert get_local_policy_cache().get("project-123") is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_policy_clears_local_entry(self, invalidations_live):
+        from server.cache import CacheService
+
+        mock_redis = AsyncMock()
+        mock_redis.get = AsyncMock(return_value=None)
+        cache = CacheService(mock_redis)
+        await cache.set_policy("project-123", {"id": 1})
+        await cache.invalidate_policy("project-123")
+
+        assert await cache.get_policy("project-123") is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_policy_publishes_to_other_workers(self):
+        from server.cache import CacheService, POLICY_INVALIDATION_CHANNEL
+
+        mock_redis = AsyncMock()
+        cache = CacheService(mock_redis)
+        await cache.invalidate_policy("project-123")
+
+        mock_redis.publish.assert_called_once_with(POLICY_INVALIDATION_CHANNEL, "project-123")
+
+    @pytest.mark.asyncio
+    async def test_invalidate_policy_publishes_when_delete_fails(self):
+        from redis.exceptions import RedisError
+        from server.cache import CacheService, POLICY_INVALIDATION_CHANNEL
+
+        mock_redis = AsyncMock()
+        mock_redis.delete = AsyncMock(side_effect=RedisError("timeout"))
+        cache = CacheService(mock_redis)
+        await cache.invalidate_policy("project-123")
+
+        mock_redis.publish.assert_called_once_with(POLICY_INVALIDATION_CHANNEL, "project-123")
+
+    def test_invalidation_message_evicts_from_named_channel(self):
+        from server.cache import (
+            POLICY_INVALIDATION_CHANNEL,
+            get_local_policy_cache,
+            get_local_project_cache,
+            handle_invalidation_message,
+        )
+
+        get_local_policy_cache().set("shared-key", {"id": 1})
+        get_local_project_cache().set("shared-key", {"id": "proj-1"})
+
+        handle_invalidation_message({
+            "type": "message",
+            "channel": POLICY_INVALIDATION_CHANNEL,
+            "data": "shared-key",
+        })
+
+        assert get_local_policy_cache().get("shared-key") is None
+        assert get_local_project_cache().get("shared-key") == {"id": "proj-1"}
+
+
+class TestInvalidationListener:
+    """Tests for the pub/sub listener that keeps local caches coherent."""
+
+    @pytest.mark.asyncio
+    async def test_listener_resubscribes_after_error(self, monkeypatch):
+        """A dropped subscription clears local caches and is retried."""
+        import asyncio
+        from redis.exceptions import RedisError
+        from server import cache as cache_module
+
+        monkeypatch.setattr(cache_module, "LISTENER_RETRY_DELAY", 0)
+        subscribed = asyncio.Event()
+        attempts = []
+
+        def make_pubsub():
+            pubsub = MagicMock()
+            pubsub.aclose = AsyncMock()
+
+            async def subscribe(*channels):
+                attempts.append(channels)
+                if len(attempts) == 1:
+                    raise RedisError("connection reset")
+
+            async def listen():
+                subscribed.set()
+                await asyncio.Event().wait()
+                yield  # pragma: no cover
+
+            pubsub.subscribe = subscribe
+            pubsub.listen = listen
+            return pubsub
+
+        redis_client = MagicMock()
+        redis_client.pubsub = make_pubsub
+        cache_module.get_local_policy_cache().set("project-123", {"id": 1})
+
+        task = asyncio.create_task(cache_module._listen_for_invalidations(redis_client))
+        try:
+            await asyncio.wait_for(subscribed.wait(), 1.0)
+            assert len(attempts) == 2
+            assert cache_module._invalidations_live is True
+            assert cache_module.get_local_policy_cache().get("project-123") is None
+        finally:
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert cache_module._invalidations_live is False
+
+
 class TestGetCacheFunction:
     """Tests for the get_cache() function."""
 
@@ -141,6 +141,100 @@ class TestEngineConfiguration:
             # SQLite engine should use NullPool
             assert engine.pool.__class__.__name__ == "NullPool"
 
+    @pytest.mark.asyncio
+    async def test_sqlite_connections_use_wal(self):
+        """SQLite connections are opened in WAL mode with relaxed sync."""
+        from sqlalchemy import text
+        from server.database import engine, _is_sqlite
+        from server.config import get_settings
+
+        settings = get_settings()
+        if not _is_sqlite(settings.database_url):
+            pytest.skip("SQLite only")
+
+        async with engine.connect() as conn:
+            journal_mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+            synchronous = (await conn.execute(text("PRAGMA synchronous"))).scalar()
+
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+
+    @pytest.mark.asyncio
+    async def test_log_filters_use_compound_indexes(self):
+        """Filtered audit log queries search an index instead of scanning."""
+        from sqlalchemy import select, text
+        from sqlalchemy.ext.asyncio import create_async_engine
+        from server.database import Base
+        from server.models import AuditLog
+
+        test_engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        filters = {
+            "ix_audit_logs_project_agent": AuditLog.agent_name == "agent_1",
+            "ix_audit_logs_project_allowed": AuditLog.allowed == True,
+        }
+        try:
+            async with test_engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+                for index_name, condition in filters.items():
+                    query = (
+                        select(AuditLog)
+                        .where(AuditLog.project_id == "proj")
+                        .where(condition)
+                        .order_by(AuditLog.timestamp.desc())
+                    )
+                    sql = str(query.compile(
+                        test_engine, compile_kwargs={"literal_binds": True}
+                    ))
+                    plan = (await conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"))).all()
+                    details = " ".join(row[-1] for row in plan)
+
+                    assert f"USING INDEX {index_name}" in details
+                    assert "TEMP B-TREE" not in details
+        finally:
+            await test_engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_init_db_backfills_new_counters_table(self, tmp_path):
+        """Counters created next to existing logs start from those logs."""
+        from datetime import datetime
+        from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+        from server import database
+        from server.database import Base
+        from server.models import AuditLog, AuditLogCounter, Project
+        from server.services.log_stats import get_log_stats
+
+        test_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'old.db'}")
+        tables = [
+            table for table in Base.metadata.sorted_tables
+            if table.name != AuditLogCounter.__tablename__
+        ]
+        try:
+            async with test_engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all, tables=tables)
+            async with AsyncSession(test_engine) as session:
+                session.add(Project(id="proj", name="Old", api_key="key"))
+                session.add_all(
+                    AuditLog(
+                        action_id=f"act_{i}", project_id="proj", agent_name="agent",
+                        action_type="pay", params="{}", allowed=i < 2,
+                        timestamp=datetime(2024, 1, 1 + i % 2, 12),
+                    )
+                    for i in range(3)
+                )
+                await session.commit()
+
+            with patch.object(database, "engine", test_engine):
+                await database.init_db()
+
+            async with AsyncSession(test_engine) as session:
+                stats = await get_log_stats(session, "proj")
+        finally:
+            await test_engine.dispose()
+
+        assert stats["total_actions"] == 3
+        assert stats["allowed"] == 2
+        assert stats["blocked"] == 1
+
     def test_engine_created_successfully(self):
         """Engine should be created without errors."""
         from server.database import engine
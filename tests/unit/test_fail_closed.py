@@ -7,6 +7,12 @@ from fastapi import BackgroundTasks
 from server.config import Settings
 
 
+def parse_action_response(response):
+    """Decode the handler's JSON response into an ActionResponse."""
+    from server.schemas import ActionResponse
+    return ActionResponse.model_validate_json(response.body)
+
+
 class TestFailClosedConfig:
     """Test fail-closed configuration settings."""
 
@@ -100,7 +106,9 @@ class TestFailClosedEndpoint:
                     side_effect=Exception("Database error")
                 )
 
-                response = await validate_action(request, mock_background_tasks, mock_db, mock_project)
+                response = parse_action_response(
+                    await validate_action(request, mock_background_tasks, mock_db, mock_project)
+                )
 
                 assert response.allowed is False
                 assert response.action_id.startswith("fail-closed-")
@@ -136,7 +144,9 @@ class TestFailClosedEndpoint:
                     side_effect=Exception("Error")
                 )
 
-                response = await validate_action(request, mock_background_tasks, mock_db, mock_project)
+                response = parse_action_response(
+                    await validate_action(request, mock_background_tasks, mock_db, mock_project)
+                )
 
                 assert response.reason == custom_reason
 
@@ -167,7 +177,9 @@ class TestFailClosedEndpoint:
                     side_effect=Exception("Error")
                 )
 
-                response = await validate_action(request, mock_background_tasks, mock_db, mock_project)
+                response = parse_action_response(
+                    await validate_action(request, mock_background_tasks, mock_db, mock_project)
+                )
 
                 assert response.timestamp is not None
                 assert isinstance(response.timestamp, datetime)
@@ -198,7 +210,9 @@ class TestFailClosedEndpoint:
                     side_effect=Exception("Error")
                 )
 
-                response = await validate_action(request, mock_background_tasks, mock_db, mock_project)
+                response = parse_action_response(
+                    await validate_action(request, mock_background_tasks, mock_db, mock_project)
+                )
 
                 # Format: fail-closed-{8 hex chars}
                 assert response.action_id.startswith("fail-closed-")
@@ -245,7 +259,9 @@ class TestFailClosedEndpoint:
                 )
 
                 with patch("server.routes.validate.record_validation_metrics"):
-                    response = await validate_action(request, mock_background_tasks, mock_db, mock_project)
+                    response = parse_action_response(
+                        await validate_action(request, mock_background_tasks, mock_db, mock_project)
+                    )
 
                 assert response.allowed is True
                 assert response.action_id == "test-action-123"
@@ -281,7 +297,9 @@ class TestFailClosedWithDifferentErrors:
                     side_effect=OperationalError("statement", {}, Exception("Connection refused"))
                 )
 
-                response = await validate_action(request, mock_background_tasks, mock_db, mock_project)
+                response = parse_action_response(
+                    await validate_action(request, mock_background_tasks, mock_db, mock_project)
+                )
 
                 assert response.allowed is False
                 assert "fail-closed" in response.action_id
@@ -313,7 +331,9 @@ class TestFailClosedWithDifferentErrors:
                     side_effect=asyncio.TimeoutError("Query timeout")
                 )
 
-                response = await validate_action(request, mock_background_tasks, mock_db, mock_project)
+                response = parse_action_response(
+                    await validate_action(request, mock_background_tasks, mock_db, mock_project)
+                )
 
                 assert response.allowed is False
 
@@ -343,7 +363,9 @@ class TestFailClosedWithDifferentErrors:
                     side_effect=RuntimeError("Unexpected internal error")
                 )
 
-                response = await validate_action(request, mock_background_tasks, mock_db, mock_project)
+                response = parse_action_response(
+                    await validate_action(request, mock_background_tasks, mock_db, mock_project)
+                )
 
                 assert response.allowed is False
 
@@ -449,7 +471,9 @@ class TestFailClosedActionIdUniqueness:
 
                 # Make 100 calls and collect action_ids
                 for _ in range(100):
-                    response = await validate_action(request, mock_background_tasks, mock_db, mock_project)
+                    response = parse_action_response(
+                        await validate_action(request, mock_background_tasks, mock_db, mock_project)
+                    )
                     action_ids.add(response.action_id)
 
         # All 100 should be unique
@@ -0,0 +1,120 @@
+"""Unit tests for the sliding-window rate limiter."""
+
+import threading
+
+from server.services.ratelimit import INITIAL_CAPACITY, SlidingWindowRateLimiter
+
+
+class FakeClock:
+    """Manually advanced monotonic clock (nanoseconds)."""
+
+    def __init__(self, now: int = 1000 * 10**9):
+        self.now = now
+
+    def __call__(self) -> int:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += int(seconds * 10**9)
+
+
+class TestSlidingWindowRateLimiter:
+    """Tests for SlidingWindowRateLimiter."""
+
+    def test_allows_up_to_max_requests(self):
+        limiter = SlidingWindowRateLimiter(clock=FakeClock())
+
+        assert [limiter.hit("agent:pay", 3, 60) for _ in range(4)] == [True, True, True, False]
+
+    def test_window_slides(self):
+        clock = FakeClock()
+        limiter = SlidingWindowRateLimiter(clock=clock)
+
+        assert limiter.hit("agent:pay", 2, 60) is True
+        clock.advance(30)
+        assert limiter.hit("agent:pay", 2, 60) is True
+        assert limiter.hit("agent:pay", 2, 60) is False
+
+        # First request leaves the window exactly window_seconds later
+        clock.advance(30)
+        assert limiter.hit("agent:pay", 2, 60) is True
+        assert limiter.hit("agent:pay", 2, 60) is False
+
+    def test_rejected_requests_are_not_counted(self):
+        clock = FakeClock()
+        limiter = SlidingWindowRateLimiter(clock=clock)
+
+        limiter.hit("agent:pay", 1, 60)
+        for _ in range(5):
+            limiter.hit("agent:pay", 1, 60)
+
+        clock.advance(60)
+        assert limiter.hit("agent:pay", 1, 60) is True
+
+    def test_keys_are_independent(self):
+        limiter = SlidingWindowRateLimiter(clock=FakeClock())
+
+        assert limiter.hit("agent1:pay", 1, 60) is True
+        assert limiter.hit("agent1:pay", 1, 60) is False
+        assert limiter.hit("agent2:pay", 1, 60) is True
+        assert limiter.hit("agent1:refund", 1, 60) is True
+
+    def test_buffer_reused_across_windows(self):
+        """The ring buffer is sized once and wraps instead of growing."""
+        clock = FakeClock()
+        limiter = SlidingWindowRateLimiter(clock=clock)
+
+        for _ in range(10):
+            assert limiter.hit("agent:pay", 3, 1) is True
+            clock.advance(0.5)
+
+        state = next(shard["agent:pay"] for shard in limiter._shards if "agent:pay" in shard)
+        assert len(state.buf) == 3
+
+    def test_large_limit_not_allocated_up_front(self):
+        """A huge max_requests only costs as many slots as requests seen."""
+        limiter = SlidingWindowRateLimiter(clock=FakeClock())
+
+        for _ in range(INITIAL_CAPACITY + 1):
+            assert limiter.hit("agent:pay", 10_000_000, 60) is True
+
+        state = next(shard["agent:pay"] for shard in limiter._shards if "agent:pay" in shard)
+        assert len(state.buf) == INITIAL_CAPACITY * 2
+        assert state.count == INITIAL_CAPACITY + 1
+
+    def test_rules_with_different_limits_share_a_key(self):
+        limiter = SlidingWindowRateLimiter(clock=FakeClock())
+
+        assert [limiter.hit("agent:pay", 2, 60) for _ in range(3)] == [True, True, False]
+        assert limiter.hit("agent:pay", 4, 60) is True
+        assert limiter.hit("agent:pay", 2, 60) is False
+        assert limiter.hit("agent:pay", 4, 60) is True
+        assert limiter.hit("agent:pay", 4, 60) is False
+
+    def test_clear_resets_all_keys(self):
+        limiter = SlidingWindowRateLimiter(clock=FakeClock())
+        limiter.hit("agent:pay", 1, 60)
+
+        limiter.clear()
+
+        assert limiter.hit("agent:pay", 1, 60) is True
+
+    def test_concurrent_hits_respect_limit(self):
+        """Exactly max_requests hits are allowed across threads."""
+        limiter = SlidingWindowRateLimiter()
+        results = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(50):
+                allowed = limiter.hit("agent:pay", 100, 60)
+                with lock:
+                    results.append(allowed)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results.count(True) == 100
@@ -1,11 +1,15 @@
 """Unit tests for policy templates loader."""
 
+import json
+
 import pytest
 
 from server.templates.loader import (
     load_templates,
     get_template,
     list_templates,
+    list_templates_body,
+    get_template_body,
     clear_cache,
 )
 
@@ -178,6 +182,39 @@ class TestTemplateStructure:
             assert template["policy"]["default"] in ["allow", "block"]
 
 
+class TestTemplateBodies:
+    """Tests for pre-serialized template response bodies."""
+
+    def setup_method(self):
+        """Clear cache before each test."""
+        clear_cache()
+
+    def test_list_templates_body_matches_list_templates(self):
+        """list_templates_body should encode the list_templates metadata."""
+        body, etag = list_templates_body()
+        assert json.loads(body) == {"templates": list_templates()}
+        assert etag.startswith('"') and etag.endswith('"')
+
+    def test_list_templates_body_is_cached(self):
+        """list_templates_body should reuse the same bytes."""
+        assert list_templates_body()[0] is list_templates_body()[0]
+
+    def test_get_template_body_matches_get_template(self):
+        """get_template_body should encode the full template."""
+        body, _ = get_template_body("finance")
+        assert json.loads(body) == get_template("finance")
+
+    def test_get_template_body_invalid_returns_none(self):
+        """get_template_body('invalid') should return None."""
+        assert get_template_body("invalid") is None
+
+    def test_etags_differ_per_body(self):
+        """Each template body should have its own ETag."""
+        etags = {get_template_body(t)[1] for t in ("finance", "healthcare", "general")}
+        etags.add(list_templates_body()[1])
+        assert len(etags) == 4
+
+
 class TestClearCache:
     """Tests for clear_cache function."""
 